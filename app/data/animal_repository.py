@@ -1,5 +1,7 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from app.data.db_connection import DBConnection
+from app.data.normalizacion import clave_busqueda, rango_prefijo
+from app.data.paginacion_sql import sql_pagina
 
 
 class AnimalRepository:
@@ -17,8 +19,8 @@ class AnimalRepository:
         sql = """
         INSERT INTO animal
         (idTenedor, idEspecie, idRaza, nombre, sexo, fechaNacimientoEst, edadEstimadaMeses, color, estadoReproductivo,
-         numeroMicrochip, viveDentroCasa, conviveConOtros, observaciones, estadoRegistro)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+         numeroMicrochip, viveDentroCasa, conviveConOtros, observaciones, claveBusqueda, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
         """
         cur = conn.cursor()
         
@@ -36,6 +38,7 @@ class AnimalRepository:
             data.get("viveDentroCasa"),
             data.get("conviveConOtros"),
             data.get("observaciones"),
+            clave_busqueda(data.get("nombre")),
         ))
         conn.commit()
         new_id = cur.lastrowid
@@ -82,6 +85,32 @@ class AnimalRepository:
 
         return dict(row) if row else None
 
+    def list_by_microchips(self, microchips: List[str]) -> List[Dict[str, Any]]:
+        """
+        Busca en bloque los animales activos cuyos numeroMicrochip estén en la lista.
+        """
+        if not microchips:
+            return []
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        rows = []
+        cur = conn.cursor()
+        # Por tramos, para no superar el límite de parámetros de SQLite
+        for i in range(0, len(microchips), 500):
+            tramo = microchips[i:i + 500]
+            sql = f"""
+            SELECT *
+            FROM animal
+            WHERE numeroMicrochip IN ({", ".join("?" for _ in tramo)}) AND estadoRegistro = 1
+            """
+            cur.execute(sql, tramo)
+            rows.extend(cur.fetchall())
+        self.db.close()
+
+        return [dict(r) for r in rows]
+
     def list_active(self) -> List[Dict[str, Any]]:
         """
         Lista animales activos.
@@ -103,6 +132,104 @@ class AnimalRepository:
 
         return [dict(r) for r in rows]
 
+    def list_by_nombre_prefix(self, texto: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Animales activos cuyo nombre empieza con texto, sin importar tildes ni
+        mayúsculas ("tom" encuentra a "Tomás" y "TOMMY"). Usa idx_animal_clave_busqueda.
+        """
+        prefijo = clave_busqueda(texto)
+        if not prefijo:
+            return []
+        desde, hasta = rango_prefijo(prefijo)
+
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        sql = """
+        SELECT *
+        FROM animal
+        WHERE claveBusqueda >= ? AND claveBusqueda < ? AND estadoRegistro = 1
+        ORDER BY claveBusqueda
+        LIMIT ?
+        """
+        cur = conn.cursor()
+        cur.execute(sql, (desde, hasta, limit))
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    # Clave de orden de list_active_page (la PK desempata nombres repetidos)
+    PAGE_KEYS = ("nombre", "idAnimal")
+
+    # Órdenes disponibles para list_active_page -> columnas de la clave.
+    # Cada uno se resuelve con un índice (sin ordenar en un B-tree temporal).
+    PAGE_ORDERS = {
+        "nombre": PAGE_KEYS,
+        "idTenedor": ("idTenedor", "nombre", "idAnimal"),
+        "idAnimal": ("idAnimal",),
+    }
+
+    def list_active_page(
+        self,
+        after: Optional[Tuple[Any, ...]] = None,
+        limit: int = 50,
+        order: str = "nombre",
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Página de animales activos, por defecto ordenados por (nombre, idAnimal),
+        paginación por clave: order = clave de PAGE_ORDERS; after = valores de esas
+        columnas en la última fila de la página anterior, o None.
+        """
+        keys = self.PAGE_ORDERS.get(order)
+        if keys is None:
+            raise ValueError(f"Orden no soportado: {order}")
+        condicion, orden = sql_pagina(keys, descending)
+
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        if after is None:
+            sql = f"""
+            SELECT *
+            FROM animal
+            WHERE estadoRegistro = 1
+            ORDER BY {orden}
+            LIMIT ?
+            """
+            params = (limit,)
+        else:
+            sql = f"""
+            SELECT *
+            FROM animal
+            WHERE estadoRegistro = 1 AND {condicion}
+            ORDER BY {orden}
+            LIMIT ?
+            """
+            params = (*after, limit)
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        self.db.close()
+
+        return [dict(r) for r in rows]
+
+    def iter_active(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre todos los animales ACTIVOS en orden de idAnimal (para exportes).
+        Lee de a batch_size filas (ver DBConnection.iterar_lotes), sin cargar
+        toda la tabla en memoria ni bloquear las escrituras mientras se recorre.
+        """
+        sql = """
+        SELECT *
+        FROM animal
+        WHERE estadoRegistro = 1
+        """
+        for r in self.db.iterar_lotes(sql, "idAnimal", batch_size):
+            yield dict(r)
+
     def list_by_tenedor(self, id_tenedor: int) -> List[Dict[str, Any]]:
         """
         Lista animales activos de un tenedor.
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from app.data.db_connection import DBConnection
 
 
@@ -98,6 +98,20 @@ class AtencionRepository:
         self.db.close()
         return [dict(r) for r in rows]
 
+    def iter_active(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre todas las atenciones ACTIVAS en orden de idAtencion (para exportes).
+        Lee de a batch_size filas (ver DBConnection.iterar_lotes), sin cargar
+        toda la tabla en memoria ni bloquear las escrituras mientras se recorre.
+        """
+        sql = """
+        SELECT *
+        FROM atencion_clinica
+        WHERE estadoRegistro = 1
+        """
+        for r in self.db.iterar_lotes(sql, "idAtencion", batch_size):
+            yield dict(r)
+
     def deactivate(self, id_atencion: int) -> None:
         """
         Eliminación lógica.
@@ -0,0 +1,160 @@
+from typing import List, Dict, Any
+from app.data.db_connection import DBConnection
+
+
+# RUT tal como se indexa: sin puntos ni guion ("12.345.678-k" -> "12345678K"),
+# así la búsqueda por prefijo funciona con o sin formato.
+_RUT_INDEXADO = "upper(replace(replace({col}, '.', ''), '-', ''))"
+
+# Tablas FTS5 sin contenido (content=''): solo guardan el índice, los datos se leen
+# de la tabla original uniendo por rowid. Las mantienen al día los triggers; al
+# borrar de una tabla sin contenido hay que entregar los valores que se indexaron.
+_FTS_OPCIONES = "content='', prefix='2 3', tokenize='unicode61 remove_diacritics 2'"
+
+_TABLAS = {
+    "tenedor_fts": {
+        "tabla": "tenedor_responsable",
+        "pk": "idTenedor",
+        "columnas": ("nombres", "apellidos", "rut", "sector"),
+        "valores": ("{p}.nombres", "{p}.apellidos", _RUT_INDEXADO.format(col="{p}.rut"), "{p}.sector"),
+    },
+    "animal_fts": {
+        "tabla": "animal",
+        "pk": "idAnimal",
+        "columnas": ("nombre", "color", "numeroMicrochip"),
+        "valores": ("{p}.nombre", "{p}.color", "{p}.numeroMicrochip"),
+    },
+    "atencion_fts": {
+        "tabla": "atencion_clinica",
+        "pk": "idAtencion",
+        "columnas": ("sintomas", "diagnostico", "tratamiento"),
+        "valores": ("{p}.sintomas", "{p}.diagnostico", "{p}.tratamiento"),
+    },
+}
+
+
+def _ddl_indice() -> List[str]:
+    """Sentencias que crean las tablas FTS5 y sus triggers (idempotentes)."""
+    sentencias = []
+    for fts, d in _TABLAS.items():
+        cols = ", ".join(d["columnas"])
+        nuevos = ", ".join(v.format(p="new") for v in d["valores"])
+        viejos = ", ".join(v.format(p="old") for v in d["valores"])
+        insertar = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.{d['pk']}, {nuevos});"
+        borrar = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.{d['pk']}, {viejos});"
+
+        sentencias += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, {_FTS_OPCIONES})",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_ai AFTER INSERT ON {d['tabla']} BEGIN {insertar} END",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_ad AFTER DELETE ON {d['tabla']} BEGIN {borrar} END",
+            f"CREATE TRIGGER IF NOT EXISTS trg_{fts}_au AFTER UPDATE OF {cols} ON {d['tabla']} "
+            f"BEGIN {borrar} {insertar} END",
+        ]
+    return sentencias
+
+
+def _sql_poblar(fts: str) -> str:
+    d = _TABLAS[fts]
+    cols = ", ".join(d["columnas"])
+    valores = ", ".join(v.format(p="t") for v in d["valores"])
+    return f"INSERT INTO {fts}(rowid, {cols}) SELECT t.{d['pk']}, {valores} FROM {d['tabla']} t"
+
+
+def crear_indice_busqueda(conn) -> None:
+    """
+    Crea las tablas FTS5 y sus triggers si no existen y llena las que se crearon
+    recién con los datos actuales. Debe llamarse dentro de una transacción.
+    """
+    existentes = {
+        r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ({})".format(
+                ", ".join("?" for _ in _TABLAS)),
+            tuple(_TABLAS),
+        )
+    }
+    for sql in _ddl_indice():
+        conn.execute(sql)
+    for fts in _TABLAS:
+        if fts not in existentes:
+            conn.execute(_sql_poblar(fts))
+
+
+class BusquedaRepository:
+    """
+    Búsqueda de texto completo (FTS5) sobre tenedores, animales y atenciones.
+
+    Las consultas reciben una expresión MATCH ya armada (ver BusquedaService)
+    y retornan solo registros activos, ordenados por relevancia (bm25).
+    """
+
+    def __init__(self, db: DBConnection):
+        self.db = db
+
+    def asegurar_indice(self) -> None:
+        """
+        Crea el índice de búsqueda si la BD aún no lo tiene y lo llena con los
+        datos existentes. Si ya existe no hace nada (normalmente lo crea la migración 4).
+        """
+        with self.db.transaccion() as conn:
+            crear_indice_busqueda(conn)
+
+    def reconstruir_indice(self) -> None:
+        """Vacía y vuelve a llenar el índice desde las tablas (mantenimiento)."""
+        with self.db.transaccion() as conn:
+            for fts in _TABLAS:
+                conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('delete-all')")
+                conn.execute(_sql_poblar(fts))
+
+    def _buscar(self, sql: str, match: str, limit: int) -> List[Dict[str, Any]]:
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        cur = conn.cursor()
+        cur.execute(sql, (match, limit))
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    def buscar_tenedores(self, match: str, limit: int = 20) -> List[Dict[str, Any]]:
+        # Pesos bm25: nombres, apellidos, rut, sector
+        sql = """
+        SELECT t.*, bm25(tenedor_fts, 5.0, 5.0, 10.0, 1.0) AS relevancia
+        FROM tenedor_fts
+        JOIN tenedor_responsable t ON t.idTenedor = tenedor_fts.rowid
+        WHERE tenedor_fts MATCH ? AND t.estadoRegistro = 1
+        ORDER BY relevancia
+        LIMIT ?
+        """
+        return self._buscar(sql, match, limit)
+
+    def buscar_animales(self, match: str, limit: int = 20) -> List[Dict[str, Any]]:
+        # Pesos bm25: nombre, color, numeroMicrochip
+        sql = """
+        SELECT a.*,
+               te.nombres AS nombresTenedor,
+               te.apellidos AS apellidosTenedor,
+               bm25(animal_fts, 5.0, 1.0, 10.0) AS relevancia
+        FROM animal_fts
+        JOIN animal a ON a.idAnimal = animal_fts.rowid
+        JOIN tenedor_responsable te ON te.idTenedor = a.idTenedor
+        WHERE animal_fts MATCH ? AND a.estadoRegistro = 1
+        ORDER BY relevancia
+        LIMIT ?
+        """
+        return self._buscar(sql, match, limit)
+
+    def buscar_atenciones(self, match: str, limit: int = 20) -> List[Dict[str, Any]]:
+        # Pesos bm25: sintomas, diagnostico, tratamiento
+        sql = """
+        SELECT ac.*,
+               an.nombre AS nombreAnimal,
+               bm25(atencion_fts, 1.0, 2.0, 1.0) AS relevancia
+        FROM atencion_fts
+        JOIN atencion_clinica ac ON ac.idAtencion = atencion_fts.rowid
+        JOIN animal an ON an.idAnimal = ac.idAnimal
+        WHERE atencion_fts MATCH ? AND ac.estadoRegistro = 1
+        ORDER BY relevancia
+        LIMIT ?
+        """
+        return self._buscar(sql, match, limit)
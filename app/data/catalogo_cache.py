@@ -0,0 +1,129 @@
+import os
+import threading
+import time
+from typing import Callable, Optional, List, Dict, Any, Tuple
+
+
+class CatalogoCache:
+    """
+    Caché en memoria para un repository de catálogo (especie, raza, motivo_consulta,
+    tipo_vacuna, tipo_desparasitacion, tipo_medicamento).
+
+    Se usa en lugar del repository original (mismo API):
+    - get_by_id / list_active / list_by_especie se responden desde memoria;
+      el catálogo se carga completo con list_active() la primera vez
+    - create / deactivate se delegan al repository y luego invalidan la caché
+      (write-through), así los crear/desactivar de los services la mantienen al día.
+      Dentro de DBConnection.transaccion() se invalida otra vez al terminar la
+      transacción: si se revierte, no queda en caché una fila que no existe
+    - lo cargado vence a los VET_CATALOGO_TTL_S segundos (60 por defecto): así se
+      ven los cambios hechos desde otro equipo sobre la misma BD
+    - cualquier otro método (get_by_nombre, ...) se delega tal cual
+
+    Usar una sola instancia por tabla y compartirla entre services.
+    """
+
+    TTL_POR_DEFECTO_S = 60.0
+
+    def __init__(
+        self,
+        repo,
+        id_field: str,
+        incluye_generales: bool = False,
+        ttl_s: Optional[float] = None,
+        reloj: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param repo: Repository del catálogo (debe tener list_active()).
+        :param id_field: Nombre de la PK (ej: "idEspecie").
+        :param incluye_generales: list_by_especie también retorna filas con
+            idEspecie NULL (como TipoVacunaRepository.list_by_especie).
+        :param ttl_s: Segundos que vale lo cargado. Si no se indica, se usa
+            VET_CATALOGO_TTL_S o TTL_POR_DEFECTO_S.
+        """
+        self.repo = repo
+        self.id_field = id_field
+        self.incluye_generales = incluye_generales
+        if ttl_s is None:
+            ttl_s = os.environ.get("VET_CATALOGO_TTL_S") or self.TTL_POR_DEFECTO_S
+        try:
+            ttl_s = float(ttl_s)
+        except (TypeError, ValueError):
+            raise ValueError("El TTL de la caché de catálogos debe ser un número")
+        if ttl_s <= 0:
+            raise ValueError("El TTL de la caché de catálogos debe ser mayor a 0")
+        self.ttl_s = ttl_s
+        self._reloj = reloj
+
+        self._lock = threading.Lock()
+        # (filas en el orden de list_active, índice por id, vence); None = sin cargar
+        self._datos: Optional[Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]], float]] = None
+
+    def __getattr__(self, name):
+        # Solo se llama para atributos que la caché no define
+        return getattr(self.repo, name)
+
+    # ------------------------
+    # Carga / invalidación
+    # ------------------------
+    def _cargar(self):
+        datos = self._datos
+        if datos is not None and self._reloj() < datos[2]:
+            return datos
+        with self._lock:
+            datos = self._datos
+            if datos is None or self._reloj() >= datos[2]:
+                filas = self.repo.list_active()
+                datos = self._datos = (
+                    filas, {f[self.id_field]: f for f in filas}, self._reloj() + self.ttl_s,
+                )
+            return datos
+
+    def invalidar(self) -> None:
+        """Descarta lo cargado; la próxima lectura vuelve a la BD."""
+        with self._lock:
+            self._datos = None
+
+    def _invalidar_tras_escritura(self) -> None:
+        self.invalidar()
+        # En una transacción abierta, lo que se cargue antes del commit/rollback
+        # puede no ser lo que quede en la BD: se vuelve a invalidar al terminar.
+        db = getattr(self.repo, "db", None)
+        if db is not None:
+            db.al_cerrar_transaccion(self.invalidar)
+
+    # ------------------------
+    # Lecturas (desde memoria)
+    # ------------------------
+    def get_by_id(self, id_registro: int) -> Optional[Dict[str, Any]]:
+        _, por_id, _ = self._cargar()
+        fila = por_id.get(id_registro)
+        return dict(fila) if fila else None
+
+    def list_active(self) -> List[Dict[str, Any]]:
+        filas, _, _ = self._cargar()
+        return [dict(f) for f in filas]
+
+    def list_by_especie(self, id_especie: int) -> List[Dict[str, Any]]:
+        # list_active ya viene ordenado, filtrar conserva el orden del repository
+        filas, _, _ = self._cargar()
+        return [
+            dict(f) for f in filas
+            if f.get("idEspecie") == id_especie
+            or (self.incluye_generales and f.get("idEspecie") is None)
+        ]
+
+    # ------------------------
+    # Escrituras (write-through)
+    # ------------------------
+    def create(self, data: Dict[str, Any]) -> int:
+        try:
+            return self.repo.create(data)
+        finally:
+            self._invalidar_tras_escritura()
+
+    def deactivate(self, id_registro: int) -> None:
+        try:
+            self.repo.deactivate(id_registro)
+        finally:
+            self._invalidar_tras_escritura()
@@ -1,25 +1,524 @@
+import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from sqlite3 import Error
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+from app.data.metricas_sql import MetricasSQL
+
+
+# Perfiles de PRAGMA aplicados a cada conexión nueva del pool.
+# - escritorio: la BD está en el disco local del equipo (caso normal).
+# - red_compartida: la BD está en una carpeta compartida de la red municipal.
+#   WAL y mmap no son seguros sobre sistemas de archivos en red, por eso este
+#   perfil mantiene el journal clásico y synchronous=FULL.
+PERFILES_PRAGMA: Dict[str, Dict[str, Any]] = {
+    "escritorio": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,       # KiB (~16 MB)
+        "mmap_size": 134217728,     # 128 MB
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+    "red_compartida": {
+        "busy_timeout": 15000,
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+        "foreign_keys": "ON",
+    },
+}
+
+PERFIL_POR_DEFECTO = "escritorio"
+
+# Sobre este tiempo (ms) una sentencia se registra como lenta; VET_DB_LENTO_MS lo cambia
+UMBRAL_LENTO_MS_POR_DEFECTO = 200.0
+
+
+class _CursorMedido(sqlite3.Cursor):
+    """
+    Cursor que mide cada sentencia para MetricasSQL: el tiempo de execute() más el
+    de los fetch*() posteriores, y las filas leídas (o afectadas si no se leyó nada).
+    Si execute() falla solo se cuenta el error, sin tiempo ni filas.
+    La medición se entrega al terminar de leer, al ejecutar otra sentencia o al
+    descartar el cursor. Las filas recorridas con `for fila in cursor` no se cuentan.
+    """
+    _sql = None
+    _segundos = 0.0
+    _filas = 0
+    _leyo = False
+
+    def _cerrar_medicion(self):
+        if self._sql is None:
+            return
+        filas = self._filas if self._leyo else max(self.rowcount, 0)
+        self.connection.metricas.registrar(self._sql, self._segundos, filas)
+        self._sql = None
+
+    def _iniciar(self, sql, t0):
+        self._sql = sql
+        self._segundos = time.perf_counter() - t0
+        self._filas = 0
+        self._leyo = False
+
+    def execute(self, sql, parameters=()):
+        self._cerrar_medicion()
+        t0 = time.perf_counter()
+        try:
+            cursor = super().execute(sql, parameters)
+        except Exception:
+            # Las fallidas se cuentan aparte: su tiempo (ej: esperar un lock) no es el de la consulta
+            self.connection.metricas.registrar_error(sql)
+            raise
+        self._iniciar(sql, t0)
+        return cursor
+
+    def executemany(self, sql, seq_of_parameters):
+        self._cerrar_medicion()
+        t0 = time.perf_counter()
+        try:
+            cursor = super().executemany(sql, seq_of_parameters)
+        except Exception:
+            # Las fallidas se cuentan aparte: su tiempo (ej: esperar un lock) no es el de la consulta
+            self.connection.metricas.registrar_error(sql)
+            raise
+        self._iniciar(sql, t0)
+        return cursor
+
+    def fetchone(self):
+        t0 = time.perf_counter()
+        fila = super().fetchone()
+        self._segundos += time.perf_counter() - t0
+        self._leyo = True
+        if fila is None:
+            self._cerrar_medicion()
+        else:
+            self._filas += 1
+        return fila
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        t0 = time.perf_counter()
+        filas = super().fetchmany(size)
+        self._segundos += time.perf_counter() - t0
+        self._leyo = True
+        self._filas += len(filas)
+        if len(filas) < size:
+            self._cerrar_medicion()
+        return filas
+
+    def fetchall(self):
+        t0 = time.perf_counter()
+        filas = super().fetchall()
+        self._segundos += time.perf_counter() - t0
+        self._leyo = True
+        self._filas += len(filas)
+        self._cerrar_medicion()
+        return filas
+
+    def close(self):
+        self._cerrar_medicion()
+        super().close()
+
+    def __del__(self):
+        try:
+            self._cerrar_medicion()
+        except Exception:
+            pass
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Conexión del pool. Mientras participa de una transacción abierta con
+    DBConnection.transaccion(), los commit() de los repositories no hacen nada:
+    el commit real ocurre una sola vez al cerrar la transacción.
+
+    Si tiene metricas asignadas, sus cursores (también los de conn.execute())
+    miden cada sentencia.
+    """
+    en_transaccion_externa = False
+    metricas: Optional[MetricasSQL] = None
+
+    def commit(self):
+        if self.en_transaccion_externa:
+            return
+        super().commit()
+
+    def cursor(self, factory=None):
+        if factory is None:
+            factory = _CursorMedido if self.metricas is not None else sqlite3.Cursor
+        return super().cursor(factory)
+
+    # sqlite3.Connection.execute() crea su cursor sin pasar por cursor()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
 
 
 class DBConnection:
-    def __init__(self, db_path: str):
-        """Inicializa la conexión a la base de datos.
-        :param db_path: Ruta al archivo .db"""
+    """
+    Pool de conexiones SQLite compartido por todos los repositories.
+
+    Los repositories siguen usando connect()/close() alrededor de cada sentencia:
+    connect() entrega al hilo actual una conexión del pool (abriéndola solo si no
+    hay una libre) y close() la devuelve al pool en vez de cerrar el archivo.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        pool_size: int = 5,
+        timeout: float = 10.0,
+        perfil: Union[str, Dict[str, Any], None] = None,
+        instrumentar: bool = True,
+        umbral_lento_ms: Optional[float] = None,
+    ):
+        """Inicializa el pool de conexiones a la base de datos.
+        :param db_path: Ruta al archivo .db
+        :param pool_size: Máximo de conexiones abiertas al mismo tiempo
+        :param timeout: Segundos a esperar por una conexión libre antes de fallar
+        :param perfil: Nombre de un perfil de PERFILES_PRAGMA o un dict de PRAGMAs.
+            Si no se indica, se usa la variable de entorno VET_DB_PERFIL
+            o "escritorio".
+        :param instrumentar: Registrar estadísticas por sentencia (ver metricas_sql())
+        :param umbral_lento_ms: Desde cuántos ms una sentencia se registra como lenta.
+            Si no se indica, se usa VET_DB_LENTO_MS o 200."""
         self.db_path = db_path
-        self.connection = None
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.pragmas = self._resolver_perfil(perfil)
+        if umbral_lento_ms is None:
+            umbral_lento_ms = float(os.environ.get("VET_DB_LENTO_MS") or UMBRAL_LENTO_MS_POR_DEFECTO)
+        self.metricas = MetricasSQL(umbral_lento_ms) if instrumentar else None
+
+        self._modo_wal: Optional[bool] = None  # se averigua en la primera lectura larga
+
+        self._idle: List[sqlite3.Connection] = []
+        self._total = 0
+        self._cond = threading.Condition()
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Conexión que tiene tomada el hilo actual (o None)."""
+        return getattr(self._local, "connection", None)
+
+    # ------------------------
+    # Pool
+    # ------------------------
+    @staticmethod
+    def _resolver_perfil(perfil: Union[str, Dict[str, Any], None]) -> Dict[str, Any]:
+        if isinstance(perfil, dict):
+            return dict(perfil)
+        nombre = perfil or os.environ.get("VET_DB_PERFIL") or PERFIL_POR_DEFECTO
+        if nombre not in PERFILES_PRAGMA:
+            raise ValueError(f"Perfil de BD desconocido: '{nombre}'. Use: {', '.join(PERFILES_PRAGMA)}")
+        return dict(PERFILES_PRAGMA[nombre])
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=_PooledConnection)
+        conn.row_factory = sqlite3.Row
+        try:
+            for nombre, valor in self.pragmas.items():
+                conn.execute(f"PRAGMA {nombre} = {valor}").fetchall()
+        except Error:
+            conn.close()
+            raise
+        # Después de los PRAGMA: solo se miden las sentencias de la aplicación
+        conn.metricas = self.metricas
+        return conn
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            # Cursor sin medición: la validación del pool no es una consulta de la aplicación
+            conn.cursor(sqlite3.Cursor).execute("SELECT 1").fetchone()
+            return True
+        except Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except Error:
+            pass
+        with self._cond:
+            self._total -= 1
+            self._cond.notify()
 
+    def _checkout(self) -> sqlite3.Connection:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._cond:
+                conn = None
+                while conn is None:
+                    if self._idle:
+                        conn = self._idle.pop()
+                    elif self._total < self.pool_size:
+                        self._total += 1
+                        break
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise Error("No hay conexiones libres en el pool (timeout)")
+                        self._cond.wait(remaining)
+
+            if conn is None:
+                try:
+                    return self._open()
+                except Error:
+                    with self._cond:
+                        self._total -= 1
+                        self._cond.notify()
+                    raise
+
+            # Conexión reutilizada: se valida antes de entregarla
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                # Nunca devolvemos al pool una transacción a medias
+                conn.rollback()
+        except Error:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    # ------------------------
+    # API usada por los repositories
+    # ------------------------
     def connect(self):
-        """ Crea y retorna una conexión a la base de datos SQLite."""
+        """ Toma una conexión del pool para el hilo actual y la retorna."""
+        conn = self.connection
+        if conn is not None:
+            if self._en_transaccion():
+                return conn
+            # Quedó tomada por un método que falló antes de llamar a close():
+            # se reutiliza, descartando lo que haya quedado sin confirmar.
+            if conn.in_transaction:
+                conn.rollback()
+            return conn
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row
-            return self.connection
+            conn = self._checkout()
         except Error as e:
             print(f"Error al conectar con la base de datos: {e}")
             return None
+        self._local.connection = conn
+        return conn
 
     def close(self):
-        """Cierra la conexión a la base de datos."""
-        if self.connection:
-            self.connection.close()
+        """Devuelve la conexión del hilo actual al pool."""
+        conn = self.connection
+        if conn is None or self._en_transaccion():
+            return
+        self._local.connection = None
+        self._checkin(conn)
+
+    # ------------------------
+    # Transacciones (unidad de trabajo)
+    # ------------------------
+    def _en_transaccion(self) -> bool:
+        return getattr(self._local, "transacciones", 0) > 0
+
+    def al_cerrar_transaccion(self, fn: Callable[[], None]) -> None:
+        """
+        Llama a fn cuando termina (commit o rollback) la transacción abierta con
+        transaccion() en este hilo; si no hay una, la llama de inmediato.
+        Para cachés que deben descartar lo leído dentro de una transacción que
+        puede revertirse (ver CatalogoCache).
+        """
+        if not self._en_transaccion():
+            fn()
+            return
+        pendientes = getattr(self._local, "al_cerrar", None)
+        if pendientes is None:
+            pendientes = self._local.al_cerrar = []
+        pendientes.append(fn)
+
+    def _avisar_cierre_transaccion(self) -> None:
+        pendientes = getattr(self._local, "al_cerrar", None)
+        self._local.al_cerrar = None
+        for fn in pendientes or ():
+            fn()
+
+    @contextmanager
+    def transaccion(self, escritura: bool = True):
+        """
+        Abre una transacción que abarca todas las llamadas a repositories hechas
+        desde este hilo dentro del bloque `with`: usan la misma conexión y se
+        confirman con un único commit al salir (o se revierten si hay excepción).
+
+        escritura=True toma el lock de escritura al inicio (BEGIN IMMEDIATE), así
+        las validaciones leídas dentro del bloque siguen siendo válidas al insertar.
+        Una transacción anidada se abre como SAVEPOINT: si falla, solo se deshace
+        lo hecho dentro de ella y la exterior puede continuar.
+        """
+        if self._en_transaccion():
+            conn = self.connection
+            savepoint = f"sp_{self._local.transacciones}"
+            self._local.transacciones += 1
+            conn.execute(f"SAVEPOINT {savepoint}")
+            try:
+                yield conn
+                conn.execute(f"RELEASE {savepoint}")
+            except BaseException:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+                raise
+            finally:
+                self._local.transacciones -= 1
+            return
+
+        conn = self.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        self._local.transacciones = 1
+        conn.en_transaccion_externa = True
+        try:
+            conn.execute("BEGIN IMMEDIATE" if escritura else "BEGIN")
+            yield conn
+            conn.en_transaccion_externa = False
+            conn.commit()
+        except BaseException:
+            conn.en_transaccion_externa = False
+            conn.rollback()
+            raise
+        finally:
+            conn.en_transaccion_externa = False
+            self._local.transacciones = 0
+            self.close()
+            self._avisar_cierre_transaccion()
+
+    @contextmanager
+    def conexion_lectura(self):
+        """
+        Conexión del pool exclusiva para una lectura larga con fetchmany, dentro
+        de una transacción de solo lectura (todo el recorrido ve la misma foto de la BD).
+        No queda asociada al hilo: connect()/close() de los repositories no la afectan.
+
+        Solo sirve en modo WAL. Con journal DELETE (perfil red_compartida) la
+        transacción mantiene un lock SHARED mientras dure el recorrido: ninguna
+        escritura (de este hilo ni de otros equipos) puede confirmarse hasta que
+        termine. Para recorrer tablas completas usar iterar_lotes(), que elige el
+        modo según el journal.
+        """
+        try:
+            conn = self._checkout()
+        except Error as e:
+            print(f"Error al conectar con la base de datos: {e}")
+            raise Exception("No se pudo conectar a la base de datos")
+
+        try:
+            conn.execute("BEGIN")
+            yield conn
+        finally:
+            # _checkin hace rollback de la transacción de lectura
+            self._checkin(conn)
+
+    def _usa_wal(self) -> bool:
+        if self._modo_wal is None:
+            conn = self.connect()
+            if not conn:
+                raise Exception("No se pudo conectar a la base de datos")
+            try:
+                modo = conn.cursor(sqlite3.Cursor).execute("PRAGMA journal_mode").fetchone()[0]
+            finally:
+                self.close()
+            self._modo_wal = str(modo).lower() == "wal"
+        return self._modo_wal
+
+    def iterar_lotes(
+        self,
+        sql: str,
+        clave: str,
+        batch_size: int = 500,
+        params: Sequence[Any] = (),
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Recorre el resultado de `sql` (un SELECT ... WHERE ..., sin ORDER BY) en
+        orden de `clave` (columna única, normalmente la PK), de a batch_size filas.
+
+        - En modo WAL: una sola lectura con fetchmany en conexion_lectura()
+          (foto consistente; los lectores no bloquean a los escritores).
+        - Con journal DELETE: lotes por clave ("clave > última") en transacciones
+          cortas; entre lotes no se mantiene ningún lock, así las escrituras de este
+          hilo o de otros equipos no esperan al exporte. Las filas que cambian
+          durante el recorrido pueden verse ya cambiadas.
+
+        En ambos modos se puede llamar a repositories (también para escribir)
+        mientras se consume el generador.
+        """
+        if self._usa_wal():
+            with self.conexion_lectura() as conn:
+                cur = conn.execute(f"{sql} ORDER BY {clave}", params)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            return
+
+        sql_lote = f"{sql} AND {clave} > ? ORDER BY {clave} LIMIT ?"
+        ultima = None
+        while True:
+            conn = self.connect()
+            if not conn:
+                raise Exception("No se pudo conectar a la base de datos")
+            try:
+                if ultima is None:
+                    cur = conn.execute(f"{sql} ORDER BY {clave} LIMIT ?", (*params, batch_size))
+                else:
+                    cur = conn.execute(sql_lote, (*params, ultima, batch_size))
+                rows = cur.fetchall()
+            finally:
+                # Se suelta la conexión (y el lock) antes de entregar las filas
+                self.close()
+            if not rows:
+                return
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            ultima = rows[-1][clave]
+
+    def close_all(self) -> None:
+        """Cierra todas las conexiones libres del pool (al salir de la aplicación)."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            try:
+                conn.close()
+            except Error:
+                pass
+
+    def stats(self) -> dict:
+        """Estado del pool: conexiones abiertas y libres."""
+        with self._cond:
+            return {"abiertas": self._total, "libres": len(self._idle), "maximo": self.pool_size}
+
+    def metricas_sql(self) -> Dict[str, Any]:
+        """
+        Estadísticas por sentencia desde el inicio (o el último reinicio), para el
+        módulo de Administración. Ver MetricasSQL.snapshot(); vacío si no se instrumenta.
+        """
+        if self.metricas is None:
+            return {"desde": None, "umbral_lento_ms": None, "sentencias": [], "lentas": []}
+        return self.metricas.snapshot()
+
+    def reiniciar_metricas_sql(self) -> None:
+        if self.metricas is not None:
+            self.metricas.reiniciar()
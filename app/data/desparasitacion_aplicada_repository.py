@@ -31,6 +31,35 @@ class DesparasitacionAplicadaRepository:
         self.db.close()
         return new_id
 
+    def create_many(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Inserta varias desparasitaciones aplicadas en una sola transacción (executemany).
+        Retorna los idDesparasitacion generados, en el mismo orden de items.
+        """
+        if not items:
+            return []
+
+        sql = """
+        INSERT INTO desparasitacion_aplicada
+        (idAtencion, idTipoDesparasitacion, fechaAplicacion, fechaProximaDosis, dosis, lote, observaciones, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+        """
+        params = [(
+            data.get("idAtencion"),
+            data.get("idTipoDesparasitacion"),
+            data.get("fechaAplicacion"),
+            data.get("fechaProximaDosis"),
+            data.get("dosis"),
+            data.get("lote"),
+            data.get("observaciones"),
+        ) for data in items]
+
+        with self.db.transaccion() as conn:
+            conn.executemany(sql, params)
+            # AUTOINCREMENT + lock de escritura => ids consecutivos
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
     def list_by_atencion(self, id_atencion: int) -> List[Dict[str, Any]]:
         conn = self.db.connect()
         if not conn:
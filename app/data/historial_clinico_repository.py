@@ -0,0 +1,110 @@
+from typing import List, Dict, Any
+from app.data.db_connection import DBConnection
+
+
+class HistorialClinicoRepository:
+    """
+    Consultas de solo lectura para la ficha clínica de un animal.
+    Trae todo el historial con dos consultas (atenciones + procedimientos)
+    en vez de una consulta por atención.
+    """
+
+    def __init__(self, db: DBConnection):
+        self.db = db
+
+    def list_atenciones(self, id_animal: int) -> List[Dict[str, Any]]:
+        """
+        Atenciones ACTIVAS del animal con el nombre del motivo y del profesional,
+        más reciente primero.
+        """
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        sql = """
+        SELECT a.*,
+               m.nombreMotivo,
+               p.nombres   AS nombresPersonal,
+               p.apellidos AS apellidosPersonal
+        FROM atencion_clinica a
+        LEFT JOIN motivo_consulta m ON m.idMotivoConsulta = a.idMotivoConsulta
+        LEFT JOIN personal_veterinario p ON p.idPersonal = a.idPersonal
+        WHERE a.idAnimal = ? AND a.estadoRegistro = 1
+        ORDER BY a.fechaAtencion DESC, a.idAtencion DESC
+        """
+        cur = conn.cursor()
+        cur.execute(sql, (id_animal,))
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    def list_procedimientos(self, id_animal: int) -> List[Dict[str, Any]]:
+        """
+        Vacunas, medicamentos y desparasitaciones ACTIVOS de todas las atenciones
+        activas del animal, con el nombre del catálogo correspondiente.
+        Cada fila trae tipoProcedimiento = 'vacuna' | 'medicamento' | 'desparasitacion'.
+        """
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        sql = """
+        SELECT 'vacuna' AS tipoProcedimiento,
+               va.idVacunaAplicada AS idProcedimiento,
+               va.idAtencion,
+               va.idTipoVacuna AS idTipo,
+               tv.nombreVacuna AS nombre,
+               va.fechaAplicacion,
+               va.fechaProximaDosis,
+               va.dosis,
+               va.lote,
+               NULL AS via,
+               va.observaciones
+        FROM atencion_clinica a
+        JOIN vacuna_aplicada va ON va.idAtencion = a.idAtencion AND va.estadoRegistro = 1
+        LEFT JOIN tipo_vacuna tv ON tv.idTipoVacuna = va.idTipoVacuna
+        WHERE a.idAnimal = ? AND a.estadoRegistro = 1
+
+        UNION ALL
+
+        SELECT 'medicamento',
+               ma.idMedicamentoAplicado,
+               ma.idAtencion,
+               ma.idTipoMedicamento,
+               tm.nombreMedicamento,
+               ma.fechaAplicacion,
+               NULL,
+               ma.dosis,
+               NULL,
+               ma.via,
+               ma.observaciones
+        FROM atencion_clinica a
+        JOIN medicamento_aplicado ma ON ma.idAtencion = a.idAtencion AND ma.estadoRegistro = 1
+        LEFT JOIN tipo_medicamento tm ON tm.idTipoMedicamento = ma.idTipoMedicamento
+        WHERE a.idAnimal = ? AND a.estadoRegistro = 1
+
+        UNION ALL
+
+        SELECT 'desparasitacion',
+               da.idDesparasitacion,
+               da.idAtencion,
+               da.idTipoDesparasitacion,
+               td.nombreDesparasitacion,
+               da.fechaAplicacion,
+               da.fechaProximaDosis,
+               da.dosis,
+               da.lote,
+               NULL,
+               da.observaciones
+        FROM atencion_clinica a
+        JOIN desparasitacion_aplicada da ON da.idAtencion = a.idAtencion AND da.estadoRegistro = 1
+        LEFT JOIN tipo_desparasitacion td ON td.idTipoDesparasitacion = da.idTipoDesparasitacion
+        WHERE a.idAnimal = ? AND a.estadoRegistro = 1
+
+        ORDER BY fechaAplicacion DESC, idProcedimiento DESC
+        """
+        cur = conn.cursor()
+        cur.execute(sql, (id_animal, id_animal, id_animal))
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
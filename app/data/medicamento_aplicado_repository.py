@@ -34,6 +34,34 @@ class MedicamentoAplicadoRepository:
         self.db.close()
         return new_id
 
+    def create_many(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Inserta varios medicamentos aplicados en una sola transacción (executemany).
+        Retorna los idMedicamentoAplicado generados, en el mismo orden de items.
+        """
+        if not items:
+            return []
+
+        sql = """
+        INSERT INTO medicamento_aplicado
+        (idAtencion, idTipoMedicamento, fechaAplicacion, dosis, via, observaciones, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, 1)
+        """
+        params = [(
+            data.get("idAtencion"),
+            data.get("idTipoMedicamento"),
+            data.get("fechaAplicacion"),
+            data.get("dosis"),
+            data.get("via"),
+            data.get("observaciones"),
+        ) for data in items]
+
+        with self.db.transaccion() as conn:
+            conn.executemany(sql, params)
+            # AUTOINCREMENT + lock de escritura => ids consecutivos
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
     def list_by_atencion(self, id_atencion: int) -> List[Dict[str, Any]]:
         """
         Lista medicamentos aplicados (activos) de una atención.
@@ -0,0 +1,116 @@
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List
+
+logger = logging.getLogger("app.sql")
+
+# Sobre este número de sentencias distintas el resto se acumula en una sola fila
+# (SQL armado con valores incrustados no debe hacer crecer la memoria sin límite).
+MAX_SENTENCIAS = 500
+MAX_LENTAS = 50
+_OTRAS = "(otras sentencias)"
+
+
+class MetricasSQL:
+    """
+    Estadísticas por sentencia SQL de un DBConnection: cantidad de ejecuciones,
+    tiempo total / promedio / máximo y filas (leídas, o afectadas en INSERT/UPDATE),
+    de las ejecuciones exitosas; las que fallaron se cuentan aparte en "errores".
+
+    Las sentencias que superan umbral_lento_ms se registran en el log "app.sql"
+    y quedan en una lista de las últimas lentas. Es seguro usarla desde varios hilos.
+    """
+
+    def __init__(self, umbral_lento_ms: float = 200.0):
+        self.umbral_lento_ms = umbral_lento_ms
+        self._lock = threading.Lock()
+        self._claves: Dict[str, str] = {}
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            # clave -> [llamadas, total_s, max_s, filas, errores]
+            self._sentencias: Dict[str, List[float]] = {}
+            self._lentas: deque = deque(maxlen=MAX_LENTAS)
+            self._desde = datetime.now()
+
+    def _clave(self, sql: str) -> str:
+        """
+        SQL con los espacios colapsados (el texto de los repositories trae saltos de línea).
+        Se llama con _lock tomado.
+        """
+        clave = self._claves.get(sql)
+        if clave is None:
+            clave = " ".join(sql.split())
+            if len(self._claves) < MAX_SENTENCIAS:
+                self._claves[sql] = clave
+        return clave
+
+    def _fila(self, sql: str):
+        """(clave, fila de estadísticas) de la sentencia. Se llama con _lock tomado."""
+        clave = self._clave(sql)
+        fila = self._sentencias.get(clave)
+        if fila is None:
+            if len(self._sentencias) >= MAX_SENTENCIAS:
+                clave = _OTRAS
+                fila = self._sentencias.get(clave)
+            if fila is None:
+                fila = self._sentencias[clave] = [0, 0.0, 0.0, 0, 0]
+        return clave, fila
+
+    def registrar_error(self, sql: str) -> None:
+        """Cuenta una ejecución fallida (sin tiempo ni filas)."""
+        with self._lock:
+            _, fila = self._fila(sql)
+            fila[4] += 1
+
+    def registrar(self, sql: str, segundos: float, filas: int) -> None:
+        with self._lock:
+            clave, fila = self._fila(sql)
+            fila[0] += 1
+            fila[1] += segundos
+            if segundos > fila[2]:
+                fila[2] = segundos
+            fila[3] += filas
+
+        ms = segundos * 1000
+        if ms >= self.umbral_lento_ms:
+            with self._lock:
+                self._lentas.append({
+                    "sql": clave,
+                    "ms": round(ms, 2),
+                    "filas": filas,
+                    "fecha": datetime.now().isoformat(timespec="seconds"),
+                })
+            logger.warning("Consulta lenta (%.1f ms, %d filas): %s", ms, filas, clave)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Foto de las estadísticas para mostrar en Administración:
+        {"desde", "umbral_lento_ms", "sentencias": [...], "lentas": [...]}.
+        Las sentencias vienen ordenadas por tiempo total (la que más pesa primero).
+        """
+        with self._lock:
+            sentencias = [
+                {
+                    "sql": clave,
+                    "llamadas": int(llamadas),
+                    "total_ms": round(total * 1000, 3),
+                    "promedio_ms": round(total * 1000 / llamadas, 3) if llamadas else 0.0,
+                    "max_ms": round(maximo * 1000, 3),
+                    "filas": int(filas),
+                    "errores": int(errores),
+                }
+                for clave, (llamadas, total, maximo, filas, errores) in self._sentencias.items()
+            ]
+            lentas = list(reversed(self._lentas))
+            desde = self._desde
+        sentencias.sort(key=lambda s: s["total_ms"], reverse=True)
+        return {
+            "desde": desde.isoformat(timespec="seconds"),
+            "umbral_lento_ms": self.umbral_lento_ms,
+            "sentencias": sentencias,
+            "lentas": lentas,
+        }
@@ -0,0 +1,56 @@
+"""
+Migración única: agrega claveBusqueda a tenedor_responsable y animal en una BD
+existente, la llena para los registros actuales y crea sus índices.
+
+Normalmente la aplica el runner (migración 2, ver runner.py). Uso manual
+(desde la raíz del proyecto):
+    python -m app.data.migraciones.clave_busqueda db/veterinaria.db
+"""
+import sqlite3
+import sys
+
+from app.data.normalizacion import clave_busqueda
+
+# tabla -> (pk, columnas que forman la clave, índice)
+_TABLAS = {
+    "tenedor_responsable": ("idTenedor", ("apellidos", "nombres"), "idx_tenedor_clave_busqueda"),
+    "animal": ("idAnimal", ("nombre",), "idx_animal_clave_busqueda"),
+}
+
+
+def aplicar(conn: sqlite3.Connection) -> dict:
+    """Aplica la migración (idempotente). Retorna filas actualizadas por tabla."""
+    actualizadas = {}
+    for tabla, (pk, columnas, indice) in _TABLAS.items():
+        existentes = {r[1] for r in conn.execute(f"PRAGMA table_info({tabla})")}
+        if "claveBusqueda" not in existentes:
+            conn.execute(f"ALTER TABLE {tabla} ADD COLUMN claveBusqueda TEXT")
+
+        filas = conn.execute(f"SELECT {pk}, {', '.join(columnas)} FROM {tabla}").fetchall()
+        conn.executemany(
+            f"UPDATE {tabla} SET claveBusqueda = ? WHERE {pk} = ?",
+            [(clave_busqueda(*f[1:]), f[0]) for f in filas],
+        )
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {indice} ON {tabla}(claveBusqueda) WHERE estadoRegistro = 1"
+        )
+        actualizadas[tabla] = len(filas)
+    return actualizadas
+
+
+def main(db_path: str) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            resultado = aplicar(conn)
+    finally:
+        conn.close()
+    for tabla, n in resultado.items():
+        print(f"✅ {tabla}: {n} registros con claveBusqueda")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python -m app.data.migraciones.clave_busqueda <ruta.db>")
+        sys.exit(1)
+    main(sys.argv[1])
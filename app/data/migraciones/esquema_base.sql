@@ -0,0 +1,383 @@
+-- Esquema base de la migración 1 (versión 1 de la BD). CONGELADO: no editar.
+-- Es db/schema.sql tal como estaba al publicar la migración 1. Los cambios de
+-- esquema posteriores van solo en migraciones nuevas (app/data/migraciones/runner.py);
+-- db/schema.sql es la referencia del esquema actual completo.
+
+-- -------------------------
+-- TENEDOR_RESPONSABLE
+-- -------------------------
+CREATE TABLE IF NOT EXISTS tenedor_responsable (
+  idTenedor          INTEGER PRIMARY KEY AUTOINCREMENT,
+  rut                TEXT NOT NULL UNIQUE,
+  rutCanonico        TEXT,                 -- 12345678-5 (sin puntos, K mayúscula)
+  nombres            TEXT NOT NULL,
+  apellidos          TEXT NOT NULL,
+  fechaNacimiento    TEXT,                 -- ISO: YYYY-MM-DD (puede ser NULL)
+  telefono           TEXT,
+  direccion          TEXT,
+  sector             TEXT,
+  correo             TEXT,
+  observaciones      TEXT,
+  claveBusqueda      TEXT,                 -- "apellidos nombres" sin tildes, minúsculas
+  estadoRegistro     INTEGER NOT NULL DEFAULT 1, -- 1=activo, 0=inactivo
+  CHECK (estadoRegistro IN (0,1))
+);
+
+CREATE INDEX IF NOT EXISTS idx_tenedor_rut ON tenedor_responsable(rut);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_tenedor_rut_canonico ON tenedor_responsable(rutCanonico);
+CREATE INDEX IF NOT EXISTS idx_tenedor_nombre ON tenedor_responsable(apellidos, nombres);
+
+-- Búsqueda por prefijo sin tildes/mayúsculas (TenedorRepository.list_by_nombre_prefix)
+CREATE INDEX IF NOT EXISTS idx_tenedor_clave_busqueda
+ON tenedor_responsable(claveBusqueda)
+WHERE estadoRegistro = 1;
+
+-- -------------------------
+-- ESPECIE
+-- -------------------------
+CREATE TABLE IF NOT EXISTS especie (
+  idEspecie       INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreEspecie   TEXT NOT NULL UNIQUE,
+  estadoRegistro  INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1))
+);
+
+-- -------------------------
+-- RAZA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS raza (
+  idRaza          INTEGER PRIMARY KEY AUTOINCREMENT,
+  idEspecie       INTEGER NOT NULL,
+  nombreRaza      TEXT NOT NULL,
+  estadoRegistro  INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  FOREIGN KEY (idEspecie) REFERENCES especie(idEspecie)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  UNIQUE (idEspecie, nombreRaza)
+);
+
+CREATE INDEX IF NOT EXISTS idx_raza_especie ON raza(idEspecie);
+
+-- -------------------------
+-- MOTIVO_CONSULTA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS motivo_consulta (
+  idMotivoConsulta  INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreMotivo      TEXT NOT NULL UNIQUE,
+  descripcion       TEXT,
+  estadoRegistro    INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1))
+);
+
+-- -------------------------
+-- PERSONAL_VETERINARIO
+-- -------------------------
+CREATE TABLE IF NOT EXISTS personal_veterinario (
+  idPersonal       INTEGER PRIMARY KEY AUTOINCREMENT,
+  rut              TEXT NOT NULL UNIQUE,
+  rutCanonico      TEXT,  -- 12345678-5 (sin puntos, K mayúscula)
+  nombres          TEXT NOT NULL,
+  apellidos        TEXT NOT NULL,
+  cargo            TEXT NOT NULL,
+  areaTrabajo      TEXT,
+  telefono         TEXT,
+  correo           TEXT,
+  fechaIngreso     TEXT,  -- YYYY-MM-DD
+  fechaNacimiento  TEXT,  -- YYYY-MM-DD
+  observaciones    TEXT,
+  estadoRegistro   INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1))
+);
+
+CREATE INDEX IF NOT EXISTS idx_personal_rut ON personal_veterinario(rut);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_personal_rut_canonico ON personal_veterinario(rutCanonico);
+CREATE INDEX IF NOT EXISTS idx_personal_nombre ON personal_veterinario(apellidos, nombres);
+
+-- -------------------------
+-- USUARIO_SISTEMA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS usuario_sistema (
+  idUsuario        INTEGER PRIMARY KEY AUTOINCREMENT,
+  idPersonal       INTEGER,  -- puede ser NULL
+  nombreUsuario    TEXT NOT NULL UNIQUE,
+  claveEncriptada  TEXT NOT NULL, -- hash
+  rol              TEXT NOT NULL, -- admin_sistema / veterinario / tecnico / administrativo
+  fechaCreacion    TEXT NOT NULL DEFAULT (date('now')),
+  estadoRegistro   INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (rol IN ('admin_sistema','veterinario','tecnico','administrativo')),
+  FOREIGN KEY (idPersonal) REFERENCES personal_veterinario(idPersonal)
+    ON UPDATE CASCADE
+    ON DELETE SET NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_usuario_nombre ON usuario_sistema(nombreUsuario);
+
+-- -------------------------
+-- ANIMAL
+-- -------------------------
+CREATE TABLE IF NOT EXISTS animal (
+  idAnimal            INTEGER PRIMARY KEY AUTOINCREMENT,
+  idTenedor           INTEGER NOT NULL,
+  idEspecie           INTEGER NOT NULL,
+  idRaza              INTEGER, -- opcional
+  nombre              TEXT NOT NULL,
+  sexo                TEXT NOT NULL DEFAULT 'Desconocido', -- M/H/Desconocido
+  fechaNacimientoEst  TEXT, -- YYYY-MM-DD
+  edadEstimadaMeses   INTEGER, -- opcional, si no se conoce la fecha
+  color               TEXT,
+  estadoReproductivo  TEXT,
+  numeroMicrochip     TEXT,
+  viveDentroCasa      INTEGER, -- 1/0/NULL
+  conviveConOtros     TEXT,
+  observaciones       TEXT,
+  claveBusqueda       TEXT, -- nombre sin tildes, minúsculas
+  estadoRegistro      INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (viveDentroCasa IN (0,1) OR viveDentroCasa IS NULL),
+  CHECK (sexo IN ('M','H','Desconocido')),
+  FOREIGN KEY (idTenedor) REFERENCES tenedor_responsable(idTenedor)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idEspecie) REFERENCES especie(idEspecie)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idRaza) REFERENCES raza(idRaza)
+    ON UPDATE CASCADE
+    ON DELETE SET NULL
+);
+
+-- Microchip debería ser único si se usa (pero puede venir vacío)
+CREATE UNIQUE INDEX IF NOT EXISTS ux_animal_microchip
+ON animal(numeroMicrochip)
+WHERE numeroMicrochip IS NOT NULL AND trim(numeroMicrochip) <> '';
+
+CREATE INDEX IF NOT EXISTS idx_animal_tenedor ON animal(idTenedor);
+CREATE INDEX IF NOT EXISTS idx_animal_especie ON animal(idEspecie);
+CREATE INDEX IF NOT EXISTS idx_animal_nombre ON animal(nombre);
+
+-- Búsqueda por prefijo sin tildes/mayúsculas (AnimalRepository.list_by_nombre_prefix)
+CREATE INDEX IF NOT EXISTS idx_animal_clave_busqueda
+ON animal(claveBusqueda)
+WHERE estadoRegistro = 1;
+
+-- -------------------------
+-- ATENCION_CLINICA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS atencion_clinica (
+  idAtencion             INTEGER PRIMARY KEY AUTOINCREMENT,
+  idAnimal               INTEGER NOT NULL,
+  idPersonal             INTEGER NOT NULL, -- vet responsable
+  idMotivoConsulta       INTEGER NOT NULL,
+  fechaAtencion          TEXT NOT NULL,    -- YYYY-MM-DD
+  sintomas               TEXT,
+  pesoKg                 REAL,             -- NULL permitido
+  diagnostico            TEXT,
+  tratamiento            TEXT,
+  observaciones          TEXT,
+  fechaControlSugerida   TEXT,             -- YYYY-MM-DD
+  lugarAtencion          TEXT NOT NULL DEFAULT 'Consulta', -- Consulta/Operativo/Domicilio
+  estadoRegistro         INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (pesoKg IS NULL OR pesoKg >= 0),
+  CHECK (lugarAtencion IN ('Consulta','Operativo','Domicilio')),
+  FOREIGN KEY (idAnimal) REFERENCES animal(idAnimal)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idPersonal) REFERENCES personal_veterinario(idPersonal)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idMotivoConsulta) REFERENCES motivo_consulta(idMotivoConsulta)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_atencion_animal_fecha ON atencion_clinica(idAnimal, fechaAtencion);
+CREATE INDEX IF NOT EXISTS idx_atencion_fecha ON atencion_clinica(fechaAtencion);
+CREATE INDEX IF NOT EXISTS idx_atencion_motivo ON atencion_clinica(idMotivoConsulta);
+
+-- -------------------------
+-- TIPO_VACUNA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS tipo_vacuna (
+  idTipoVacuna       INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreVacuna       TEXT NOT NULL UNIQUE,
+  descripcion        TEXT,
+  idEspecie          INTEGER,  -- opcional
+  intervaloRecMeses  INTEGER,  -- opcional
+  estadoRegistro     INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (intervaloRecMeses IS NULL OR intervaloRecMeses >= 0),
+  FOREIGN KEY (idEspecie) REFERENCES especie(idEspecie)
+    ON UPDATE CASCADE
+    ON DELETE SET NULL
+);
+
+-- -------------------------
+-- VACUNA_APLICADA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS vacuna_aplicada (
+  idVacunaAplicada  INTEGER PRIMARY KEY AUTOINCREMENT,
+  idAtencion        INTEGER NOT NULL,
+  idTipoVacuna      INTEGER NOT NULL,
+  fechaAplicacion   TEXT NOT NULL, -- YYYY-MM-DD
+  fechaProximaDosis TEXT,
+  dosis             TEXT,
+  lote              TEXT,
+  observaciones     TEXT,
+  estadoRegistro    INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  FOREIGN KEY (idAtencion) REFERENCES atencion_clinica(idAtencion)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idTipoVacuna) REFERENCES tipo_vacuna(idTipoVacuna)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_vacuna_atencion ON vacuna_aplicada(idAtencion);
+
+-- Recordatorios de próximas dosis
+CREATE INDEX IF NOT EXISTS idx_vacuna_proxima
+ON vacuna_aplicada(fechaProximaDosis)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_vacuna_tipo_fecha_sin_proxima
+ON vacuna_aplicada(idTipoVacuna, fechaAplicacion)
+WHERE fechaProximaDosis IS NULL AND estadoRegistro = 1;
+
+-- -------------------------
+-- TIPO_DESPARASITACION
+-- -------------------------
+CREATE TABLE IF NOT EXISTS tipo_desparasitacion (
+  idTipoDesparasitacion INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreDesparasitacion TEXT NOT NULL,
+  tipo                 TEXT NOT NULL DEFAULT 'Mixta', -- Interna/Externa/Mixta
+  idEspecie            INTEGER,
+  intervaloRecMeses    INTEGER,
+  estadoRegistro       INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (tipo IN ('Interna','Externa','Mixta')),
+  CHECK (intervaloRecMeses IS NULL OR intervaloRecMeses >= 0),
+  FOREIGN KEY (idEspecie) REFERENCES especie(idEspecie)
+    ON UPDATE CASCADE
+    ON DELETE SET NULL
+);
+
+-- El mismo producto puede registrarse para distintas especies
+CREATE UNIQUE INDEX IF NOT EXISTS ux_tipo_desparasitacion_nombre_especie
+ON tipo_desparasitacion(nombreDesparasitacion, idEspecie);
+
+-- -------------------------
+-- DESPARASITACION_APLICADA
+-- -------------------------
+CREATE TABLE IF NOT EXISTS desparasitacion_aplicada (
+  idDesparasitacion     INTEGER PRIMARY KEY AUTOINCREMENT,
+  idAtencion            INTEGER NOT NULL,
+  idTipoDesparasitacion INTEGER NOT NULL,
+  fechaAplicacion       TEXT NOT NULL,
+  fechaProximaDosis     TEXT,
+  dosis                 TEXT,
+  lote                  TEXT,
+  observaciones         TEXT,
+  estadoRegistro        INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  FOREIGN KEY (idAtencion) REFERENCES atencion_clinica(idAtencion)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idTipoDesparasitacion) REFERENCES tipo_desparasitacion(idTipoDesparasitacion)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_atencion ON desparasitacion_aplicada(idAtencion);
+
+-- Recordatorios de próximas dosis
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_proxima
+ON desparasitacion_aplicada(fechaProximaDosis)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_tipo_fecha_sin_proxima
+ON desparasitacion_aplicada(idTipoDesparasitacion, fechaAplicacion)
+WHERE fechaProximaDosis IS NULL AND estadoRegistro = 1;
+
+-- -------------------------
+-- TIPO_MEDICAMENTO
+-- -------------------------
+CREATE TABLE IF NOT EXISTS tipo_medicamento (
+  idTipoMedicamento  INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreMedicamento  TEXT NOT NULL UNIQUE,
+  categoria          TEXT NOT NULL,
+  descripcion        TEXT,
+  estadoRegistro     INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (categoria IN (
+    'antibiotico',
+    'antiinflamatorio',
+    'analgesico',
+    'vitaminas',
+    'fluidoterapia',
+    'gastroprotector',
+    'otro'
+  ))
+);
+
+CREATE INDEX IF NOT EXISTS idx_tipo_medicamento_categoria ON tipo_medicamento(categoria);
+CREATE INDEX IF NOT EXISTS idx_tipo_medicamento_nombre ON tipo_medicamento(nombreMedicamento);
+
+-- -------------------------
+-- MEDICAMENTO_APLICADO
+-- -------------------------
+CREATE TABLE IF NOT EXISTS medicamento_aplicado (
+  idMedicamentoAplicado  INTEGER PRIMARY KEY AUTOINCREMENT,
+  idAtencion             INTEGER NOT NULL,
+  idTipoMedicamento      INTEGER NOT NULL,
+  fechaAplicacion        TEXT NOT NULL,
+  dosis                  TEXT,
+  via                    TEXT,
+  observaciones          TEXT,
+  estadoRegistro         INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (via IN ('IM','IV','VO','SC','Topica','Otra')),
+  FOREIGN KEY (idAtencion) REFERENCES atencion_clinica(idAtencion)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idTipoMedicamento) REFERENCES tipo_medicamento(idTipoMedicamento)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_atencion ON medicamento_aplicado(idAtencion);
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_tipo ON medicamento_aplicado(idTipoMedicamento);
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_fecha ON medicamento_aplicado(fechaAplicacion);
+
+
+-- Evita borrar ANIMAL si tiene atenciones
+CREATE TRIGGER IF NOT EXISTS trg_no_delete_animal_con_atenciones
+BEFORE DELETE ON animal
+FOR EACH ROW
+BEGIN
+  SELECT CASE
+    WHEN EXISTS (SELECT 1 FROM atencion_clinica WHERE idAnimal = OLD.idAnimal)
+    THEN RAISE(ABORT, 'No se puede eliminar el animal: tiene atenciones registradas.')
+  END;
+END;
+
+-- Evita borrar ATENCION si tiene vacuna/desparasitación asociada
+CREATE TRIGGER IF NOT EXISTS trg_no_delete_atencion_con_procedimientos
+BEFORE DELETE ON atencion_clinica
+FOR EACH ROW
+BEGIN
+  SELECT CASE
+    WHEN EXISTS (SELECT 1 FROM vacuna_aplicada WHERE idAtencion = OLD.idAtencion)
+      OR EXISTS (SELECT 1 FROM desparasitacion_aplicada WHERE idAtencion = OLD.idAtencion)
+    THEN RAISE(ABORT, 'No se puede eliminar la atención: tiene procedimientos asociados.')
+  END;
+END;
+
+-- -------------------------
+-- BÚSQUEDA (FTS5)
+-- -------------------------
+-- Las tablas tenedor_fts, animal_fts y atencion_fts y sus triggers los crea
+-- la migración 4 (crear_indice_busqueda en app/data/busqueda_repository.py).
@@ -0,0 +1,191 @@
+"""
+Migraciones de la BD, versionadas con PRAGMA user_version.
+
+Cada migración lleva la BD de la versión N-1 a la N dentro de una transacción
+(junto con el cambio de user_version), así una migración a medias nunca queda
+registrada. Todas son idempotentes: también sirven para BD antiguas en versión 0
+que ya tienen parte de los cambios.
+
+Una migración publicada no cambia nunca: la 1 aplica una copia congelada del
+esquema (esquema_base.sql) y cada cambio posterior lleva su propio DDL en una
+migración nueva. db/schema.sql es la referencia del esquema actual completo
+(debe coincidir con lo que deja la última migración), pero ninguna migración lo lee.
+
+Al iniciar la aplicación se llama migrar(db_path): si no hay nada pendiente solo
+lee user_version y retorna.
+
+Uso manual (desde la raíz del proyecto):
+    python -m app.data.migraciones.runner db/veterinaria.db
+"""
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from app.data.busqueda_repository import crear_indice_busqueda
+from app.data.migraciones import clave_busqueda, rut_canonico
+
+ESQUEMA_BASE_PATH = Path(__file__).resolve().parent / "esquema_base.sql"
+
+# Columnas que se agregaron a tablas existentes después de la primera versión de la BD:
+# tabla -> [(columna, definición)]
+_COLUMNAS_AGREGADAS = {
+    "animal": [("edadEstimadaMeses", "INTEGER"), ("claveBusqueda", "TEXT")],
+    "tenedor_responsable": [("claveBusqueda", "TEXT"), ("rutCanonico", "TEXT")],
+    "personal_veterinario": [("rutCanonico", "TEXT")],
+}
+
+
+def _sentencias(script: str) -> List[str]:
+    """Separa un script SQL en sentencias (respeta los BEGIN...END de los triggers)."""
+    sentencias = []
+    actual = ""
+    for linea in script.splitlines(keepends=True):
+        actual += linea
+        if sqlite3.complete_statement(actual):
+            if actual.strip():
+                sentencias.append(actual.strip())
+            actual = ""
+    resto = "\n".join(l for l in actual.splitlines() if not l.strip().startswith("--"))
+    if resto.strip():
+        raise ValueError("El script termina con una sentencia incompleta")
+    return sentencias
+
+
+# ------------------------
+# Migraciones
+# ------------------------
+def _m001_esquema_base(conn: sqlite3.Connection) -> None:
+    """Esquema base congelado; en BD antiguas agrega antes las columnas que faltan."""
+    for tabla, columnas in _COLUMNAS_AGREGADAS.items():
+        existentes = {r[1] for r in conn.execute(f"PRAGMA table_info({tabla})")}
+        if not existentes:
+            continue  # BD nueva: la tabla la crea esquema_base.sql completa
+        for columna, definicion in columnas:
+            if columna not in existentes:
+                conn.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+
+    for sql in _sentencias(ESQUEMA_BASE_PATH.read_text(encoding="utf-8")):
+        conn.execute(sql)
+
+
+def _m002_clave_busqueda(conn: sqlite3.Connection) -> None:
+    clave_busqueda.aplicar(conn)
+
+
+def _m003_rut_canonico(conn: sqlite3.Connection) -> None:
+    reporte = rut_canonico.aplicar(conn)
+    if any(r["invalidos"] or r["dv_incorrecto"] or r["colisiones"] for r in reporte.values()):
+        rut_canonico.imprimir_reporte(reporte)
+
+
+def _m004_indice_busqueda(conn: sqlite3.Connection) -> None:
+    crear_indice_busqueda(conn)
+
+
+def _m005_indices_activos(conn: sqlite3.Connection) -> None:
+    """Índices parciales WHERE estadoRegistro = 1; reemplazan a los índices de orden completos."""
+    for nombre in ("idx_tenedor_nombre", "idx_animal_nombre", "idx_atencion_fecha"):
+        conn.execute(f"DROP INDEX IF EXISTS {nombre}")
+    for nombre, tabla, columnas in (
+        ("idx_tenedor_activos_nombre", "tenedor_responsable", "apellidos, nombres"),
+        ("idx_animal_activos_nombre", "animal", "nombre"),
+        ("idx_animal_activos_tenedor", "animal", "idTenedor, nombre"),
+        ("idx_animal_activos_microchip", "animal", "numeroMicrochip"),
+        ("idx_atencion_activos_animal_fecha", "atencion_clinica", "idAnimal, fechaAtencion"),
+        ("idx_atencion_activos_fecha", "atencion_clinica", "fechaAtencion"),
+        ("idx_vacuna_activos_atencion_fecha", "vacuna_aplicada", "idAtencion, fechaAplicacion"),
+        ("idx_vacuna_activos_fecha", "vacuna_aplicada", "fechaAplicacion"),
+        ("idx_desparasitacion_activos_atencion_fecha", "desparasitacion_aplicada",
+         "idAtencion, fechaAplicacion"),
+        ("idx_med_aplicado_activos_atencion_fecha", "medicamento_aplicado",
+         "idAtencion, fechaAplicacion"),
+    ):
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {nombre} ON {tabla}({columnas}) WHERE estadoRegistro = 1"
+        )
+
+
+def _m006_orden_rut(conn: sqlite3.Connection) -> None:
+    """
+    tenedor_responsable.rutOrden: rutCanonico con ceros a la izquierda, para que el
+    orden por RUT sea numérico ("9876543-2" antes que "12345678-5"). Es una columna
+    generada (virtual): no hay que mantenerla al insertar ni al actualizar.
+    """
+    columnas = {r[1] for r in conn.execute("PRAGMA table_xinfo(tenedor_responsable)")}
+    if "rutOrden" not in columnas:
+        conn.execute(
+            "ALTER TABLE tenedor_responsable ADD COLUMN rutOrden TEXT "
+            "GENERATED ALWAYS AS (substr('00000000000' || coalesce(rutCanonico, ''), -11)) VIRTUAL"
+        )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tenedor_activos_rut "
+        "ON tenedor_responsable(rutOrden, idTenedor) WHERE estadoRegistro = 1"
+    )
+
+
+# (versión, descripción, función) en orden; nunca modificar una ya publicada,
+# solo agregar nuevas al final.
+MIGRACIONES: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Esquema base y columnas faltantes", _m001_esquema_base),
+    (2, "claveBusqueda en tenedores y animales", _m002_clave_busqueda),
+    (3, "rutCanonico en tenedores y personal", _m003_rut_canonico),
+    (4, "Índice de búsqueda FTS5", _m004_indice_busqueda),
+    (5, "Índices parciales de registros activos", _m005_indices_activos),
+    (6, "Orden numérico por RUT de tenedores", _m006_orden_rut),
+]
+
+VERSION_ACTUAL = MIGRACIONES[-1][0]
+
+
+def version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrar(db_path: str, verbose: bool = False) -> List[int]:
+    """
+    Aplica las migraciones pendientes y retorna las versiones aplicadas
+    (lista vacía si la BD ya estaba al día).
+    """
+    conn = sqlite3.connect(db_path, timeout=15, isolation_level=None)
+    try:
+        actual = version(conn)
+        if actual == VERSION_ACTUAL:
+            return []
+        if actual > VERSION_ACTUAL:
+            raise Exception(
+                f"La base de datos está en la versión {actual}, más nueva que esta aplicación "
+                f"({VERSION_ACTUAL}). Actualice la aplicación."
+            )
+
+        aplicadas = []
+        for numero, descripcion, funcion in MIGRACIONES:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Se relee con el lock tomado: otro equipo pudo migrar mientras tanto
+                if version(conn) >= numero:
+                    conn.execute("ROLLBACK")
+                    continue
+                if verbose:
+                    print(f"Aplicando migración {numero}: {descripcion}")
+                funcion(conn)
+                conn.execute(f"PRAGMA user_version = {numero}")
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            aplicadas.append(numero)
+        return aplicadas
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python -m app.data.migraciones.runner <ruta.db>")
+        sys.exit(1)
+    aplicadas = migrar(sys.argv[1], verbose=True)
+    if aplicadas:
+        print(f"✅ BD en versión {VERSION_ACTUAL} (aplicadas: {aplicadas})")
+    else:
+        print(f"✅ BD al día (versión {VERSION_ACTUAL})")
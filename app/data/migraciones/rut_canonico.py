@@ -0,0 +1,132 @@
+"""
+Migración única: agrega rutCanonico a tenedor_responsable y personal_veterinario
+en una BD existente, lo llena desde rut y crea los índices únicos.
+
+Informa:
+- RUT que no se pudieron interpretar (quedan con rutCanonico NULL)
+- RUT con dígito verificador incorrecto (se guardan igual, para corregirlos a mano)
+- colisiones: varios registros con el mismo RUT escrito distinto. Se conserva el
+  rutCanonico en uno (activo primero, luego el de menor id) y los demás quedan
+  en NULL hasta que se fusionen o corrijan.
+
+Normalmente la aplica el runner (migración 3, ver runner.py). Uso manual
+(desde la raíz del proyecto):
+    python -m app.data.migraciones.rut_canonico db/veterinaria.db
+"""
+import sqlite3
+import sys
+from typing import Dict, List, Optional
+
+
+# Copia congelada de la normalización de app/data/rut.py al publicar esta
+# migración: si esa normalización cambia, la migración 3 sigue haciendo lo mismo.
+def _calcular_dv(cuerpo: str) -> str:
+    suma = 0
+    factor = 2
+    for digito in reversed(cuerpo):
+        suma += int(digito) * factor
+        factor = 2 if factor == 7 else factor + 1
+    resto = 11 - suma % 11
+    if resto == 11:
+        return "0"
+    if resto == 10:
+        return "K"
+    return str(resto)
+
+
+def _rut_canonico(rut) -> Optional[str]:
+    """"12.345.678-5" / "123456785" / " 12345678 - k " -> "12345678-5"; None si no tiene forma de RUT."""
+    if rut is None:
+        return None
+    r = str(rut).replace(".", "").replace(" ", "").upper()
+    if "-" in r:
+        cuerpo, _, dv = r.partition("-")
+    else:
+        cuerpo, dv = r[:-1], r[-1:]
+    cuerpo = cuerpo.lstrip("0")
+    if not cuerpo.isdigit() or len(cuerpo) > 9:
+        return None
+    if len(dv) != 1 or dv not in "0123456789K":
+        return None
+    return f"{cuerpo}-{dv}"
+
+
+# tabla -> (pk, índice único)
+_TABLAS = {
+    "tenedor_responsable": ("idTenedor", "ux_tenedor_rut_canonico"),
+    "personal_veterinario": ("idPersonal", "ux_personal_rut_canonico"),
+}
+
+
+def _migrar_tabla(conn: sqlite3.Connection, tabla: str, pk: str, indice: str) -> Dict[str, List]:
+    reporte = {"actualizados": 0, "invalidos": [], "dv_incorrecto": [], "colisiones": []}
+
+    existentes = {r[1] for r in conn.execute(f"PRAGMA table_info({tabla})")}
+    if "rutCanonico" not in existentes:
+        conn.execute(f"ALTER TABLE {tabla} ADD COLUMN rutCanonico TEXT")
+    # Se recalcula todo: el índice único se crea al final, sobre datos ya limpios
+    conn.execute(f"DROP INDEX IF EXISTS {indice}")
+
+    por_canonico: Dict[str, List] = {}
+    cambios = []
+    filas = conn.execute(f"SELECT {pk}, rut, estadoRegistro FROM {tabla} ORDER BY {pk}").fetchall()
+    for id_registro, rut, estado in filas:
+        canonico = _rut_canonico(rut)
+        if canonico is None:
+            reporte["invalidos"].append((id_registro, rut))
+        else:
+            cuerpo, dv = canonico.split("-")
+            if _calcular_dv(cuerpo) != dv:
+                reporte["dv_incorrecto"].append((id_registro, rut))
+            por_canonico.setdefault(canonico, []).append((id_registro, rut, estado))
+        cambios.append([canonico, id_registro])
+
+    # Colisiones: se queda con el canónico un solo registro (activo primero, menor id)
+    descartados = set()
+    for canonico, registros in por_canonico.items():
+        if len(registros) > 1:
+            registros.sort(key=lambda r: (r[2] != 1, r[0]))
+            reporte["colisiones"].append((canonico, [(r[0], r[1]) for r in registros]))
+            descartados.update(r[0] for r in registros[1:])
+    for cambio in cambios:
+        if cambio[1] in descartados:
+            cambio[0] = None
+
+    conn.executemany(f"UPDATE {tabla} SET rutCanonico = ? WHERE {pk} = ?", cambios)
+    conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {indice} ON {tabla}(rutCanonico)")
+    reporte["actualizados"] = len(cambios)
+    return reporte
+
+
+def aplicar(conn: sqlite3.Connection) -> Dict[str, Dict[str, List]]:
+    """Aplica la migración (idempotente). Retorna el reporte por tabla."""
+    return {tabla: _migrar_tabla(conn, tabla, pk, indice) for tabla, (pk, indice) in _TABLAS.items()}
+
+
+def imprimir_reporte(reporte: Dict[str, Dict[str, List]]) -> None:
+    for tabla, r in reporte.items():
+        print(f"✅ {tabla}: {r['actualizados']} registros revisados")
+        for id_registro, rut in r["invalidos"]:
+            print(f"   ⚠️ id={id_registro}: RUT '{rut}' no se pudo interpretar (rutCanonico NULL)")
+        for id_registro, rut in r["dv_incorrecto"]:
+            print(f"   ⚠️ id={id_registro}: RUT '{rut}' tiene dígito verificador incorrecto")
+        for canonico, registros in r["colisiones"]:
+            detalle = ", ".join(f"id={i} '{rut}'" for i, rut in registros)
+            print(f"   ⚠️ {canonico} repetido: {detalle} (se conserva id={registros[0][0]})")
+
+
+def main(db_path: str) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        with conn:
+            reporte = aplicar(conn)
+    finally:
+        conn.close()
+    imprimir_reporte(reporte)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Uso: python -m app.data.migraciones.rut_canonico <ruta.db>")
+        sys.exit(1)
+    main(sys.argv[1])
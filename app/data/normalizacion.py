@@ -0,0 +1,23 @@
+import unicodedata
+from typing import Any
+
+
+def clave_busqueda(*partes: Any) -> str:
+    """
+    Clave normalizada para buscar por nombre sin importar tildes, mayúsculas
+    ni espacios: clave_busqueda("  Pérez ", "JUAN  José") -> "perez juan jose".
+    Las partes vacías o None se omiten.
+    """
+    texto = " ".join(str(p) for p in partes if p is not None)
+    # NFKD separa la letra de su tilde ("é" -> "e" + tilde) y se descartan las tildes
+    texto = unicodedata.normalize("NFKD", texto)
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(texto.casefold().split())
+
+
+def rango_prefijo(prefijo: str):
+    """
+    Límites (desde, hasta) para buscar un prefijo con un índice:
+    columna >= desde AND columna < hasta.
+    """
+    return prefijo, prefijo[:-1] + chr(ord(prefijo[-1]) + 1)
@@ -0,0 +1,23 @@
+from typing import Sequence, Tuple
+
+
+def sql_pagina(claves: Sequence[str], descendente: bool = False) -> Tuple[str, str]:
+    """
+    Fragmentos SQL para paginación por clave (keyset) con las columnas `claves`:
+    (condición para "después de la última fila", ORDER BY).
+
+        sql_pagina(("nombre", "idAnimal"))       -> ("(nombre, idAnimal) > (?, ?)", "nombre, idAnimal")
+        sql_pagina(("nombre", "idAnimal"), True) -> ("(nombre, idAnimal) < (?, ?)", "nombre DESC, idAnimal DESC")
+
+    Las columnas se incrustan en el SQL: deben venir de una lista fija del
+    repository (PAGE_ORDERS), nunca de lo que escribe el usuario. Deben ser
+    NOT NULL (una comparación con NULL no avanza la página) y la última debe
+    ser única (la PK) para desempatar.
+    """
+    columnas = ", ".join(claves)
+    marcadores = ", ".join("?" for _ in claves)
+    operador = "<" if descendente else ">"
+    direccion = " DESC" if descendente else ""
+    condicion = f"({columnas}) {operador} ({marcadores})"
+    orden = ", ".join(f"{c}{direccion}" for c in claves)
+    return condicion, orden
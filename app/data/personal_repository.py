@@ -13,13 +13,14 @@ class PersonalRepository:
 
         sql = """
         INSERT INTO personal_veterinario
-        (rut, nombres, apellidos, cargo, areaTrabajo, telefono, correo,
+        (rut, rutCanonico, nombres, apellidos, cargo, areaTrabajo, telefono, correo,
          fechaIngreso, fechaNacimiento, observaciones, estadoRegistro)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
         """
         cur = conn.cursor()
         cur.execute(sql, (
             data.get("rut"),
+            data.get("rutCanonico"),
             data.get("nombres"),
             data.get("apellidos"),
             data.get("cargo"),
@@ -52,6 +53,7 @@ class PersonalRepository:
         return dict(row) if row else None
 
     def get_by_rut(self, rut: str) -> Optional[Dict[str, Any]]:
+        """Busca personal activo por RUT canónico (ej: "12345678-5")."""
         conn = self.db.connect()
         if not conn:
             raise Exception("No se pudo conectar a la base de datos")
@@ -59,7 +61,7 @@ class PersonalRepository:
         sql = """
         SELECT *
         FROM personal_veterinario
-        WHERE rut = ? AND estadoRegistro = 1
+        WHERE rutCanonico = ? AND estadoRegistro = 1
         """
         cur = conn.cursor()
         cur.execute(sql, (rut,))
@@ -0,0 +1,129 @@
+from typing import List, Dict, Any
+from app.data.db_connection import DBConnection
+
+
+# Una misma consulta sirve para vacunas y desparasitaciones; solo cambian los nombres.
+#
+# Fecha de vencimiento de cada aplicación:
+#   - fechaProximaDosis si está registrada (idx_*_proxima)
+#   - si no, fechaAplicacion + intervaloRecMeses del tipo (idx_*_tipo_fecha_sin_proxima);
+#     el rango de fechaAplicacion se acota por tipo para poder usar el índice
+#     y luego se filtra por la fecha exacta calculada.
+# Solo cuenta la última aplicación de cada tipo por animal: si el animal ya recibió
+# una dosis posterior del mismo tipo, la anterior no genera recordatorio.
+_SQL_PENDIENTES = """
+WITH candidatas AS (
+    SELECT x.{pk} AS idAplicacion,
+           x.idAtencion,
+           x.{fk_tipo} AS idTipo,
+           x.fechaAplicacion,
+           x.fechaProximaDosis AS fechaVence,
+           0 AS fechaCalculada
+    FROM {tabla} x
+    WHERE x.estadoRegistro = 1
+      AND x.fechaProximaDosis BETWEEN :desde AND :hasta
+
+    UNION ALL
+
+    SELECT x.{pk},
+           x.idAtencion,
+           x.{fk_tipo},
+           x.fechaAplicacion,
+           date(x.fechaAplicacion, '+' || t.intervaloRecMeses || ' months'),
+           1
+    FROM {tabla_tipo} t
+    CROSS JOIN {tabla} x  -- CROSS JOIN: fuerza recorrer primero el catálogo (pocas filas)
+      ON x.{fk_tipo} = t.{fk_tipo}
+     AND x.fechaProximaDosis IS NULL
+     AND x.estadoRegistro = 1
+     AND x.fechaAplicacion BETWEEN date(:desde, '-' || (t.intervaloRecMeses + 1) || ' months')
+                               AND date(:hasta, '-' || t.intervaloRecMeses || ' months')
+    WHERE t.intervaloRecMeses > 0
+)
+SELECT '{procedimiento}' AS tipoProcedimiento,
+       c.idAplicacion,
+       c.idAtencion,
+       c.idTipo,
+       t.{nombre_tipo} AS nombreTipo,
+       c.fechaAplicacion,
+       c.fechaVence,
+       c.fechaCalculada,
+       an.idAnimal,
+       an.nombre AS nombreAnimal,
+       an.idEspecie,
+       te.idTenedor,
+       te.nombres AS nombresTenedor,
+       te.apellidos AS apellidosTenedor,
+       te.telefono,
+       te.sector
+FROM candidatas c
+JOIN atencion_clinica a ON a.idAtencion = c.idAtencion AND a.estadoRegistro = 1
+JOIN animal an ON an.idAnimal = a.idAnimal AND an.estadoRegistro = 1
+JOIN tenedor_responsable te ON te.idTenedor = an.idTenedor
+LEFT JOIN {tabla_tipo} t ON t.{fk_tipo} = c.idTipo
+WHERE c.fechaVence BETWEEN :desde AND :hasta
+  AND NOT EXISTS (
+      SELECT 1
+      FROM atencion_clinica a2
+      JOIN {tabla} x2 ON x2.idAtencion = a2.idAtencion
+      WHERE a2.idAnimal = an.idAnimal
+        AND a2.estadoRegistro = 1
+        AND x2.estadoRegistro = 1
+        AND x2.{fk_tipo} = c.idTipo
+        AND (x2.fechaAplicacion > c.fechaAplicacion
+             OR (x2.fechaAplicacion = c.fechaAplicacion AND x2.{pk} > c.idAplicacion))
+  )
+ORDER BY c.fechaVence, te.sector, an.nombre
+"""
+
+
+class RecordatorioRepository:
+    """
+    Consultas de dosis vencidas / próximas (vacunas y desparasitaciones).
+    """
+
+    _SQL_VACUNAS = _SQL_PENDIENTES.format(
+        procedimiento="vacuna",
+        tabla="vacuna_aplicada",
+        pk="idVacunaAplicada",
+        tabla_tipo="tipo_vacuna",
+        fk_tipo="idTipoVacuna",
+        nombre_tipo="nombreVacuna",
+    )
+
+    _SQL_DESPARASITACIONES = _SQL_PENDIENTES.format(
+        procedimiento="desparasitacion",
+        tabla="desparasitacion_aplicada",
+        pk="idDesparasitacion",
+        tabla_tipo="tipo_desparasitacion",
+        fk_tipo="idTipoDesparasitacion",
+        nombre_tipo="nombreDesparasitacion",
+    )
+
+    def __init__(self, db: DBConnection):
+        self.db = db
+
+    def _listar(self, sql: str, desde: str, hasta: str) -> List[Dict[str, Any]]:
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        cur = conn.cursor()
+        cur.execute(sql, {"desde": desde, "hasta": hasta})
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    def list_vacunas_pendientes(self, desde: str, hasta: str) -> List[Dict[str, Any]]:
+        """
+        Última vacuna de cada tipo por animal activo cuya próxima dosis vence
+        entre desde y hasta (YYYY-MM-DD, inclusive).
+        """
+        return self._listar(self._SQL_VACUNAS, desde, hasta)
+
+    def list_desparasitaciones_pendientes(self, desde: str, hasta: str) -> List[Dict[str, Any]]:
+        """
+        Última desparasitación de cada tipo por animal activo cuya próxima dosis
+        vence entre desde y hasta (YYYY-MM-DD, inclusive).
+        """
+        return self._listar(self._SQL_DESPARASITACIONES, desde, hasta)
@@ -0,0 +1,72 @@
+"""
+RUT chileno: dígito verificador, forma canónica y validación.
+Está en la capa de datos porque los repositories guardan y buscan por rutCanonico;
+los services lo usan a través de app.services.rut.
+"""
+from typing import Any, Optional, Tuple
+
+
+def calcular_dv(cuerpo: str) -> str:
+    """Dígito verificador (módulo 11) del cuerpo numérico de un RUT."""
+    suma = 0
+    factor = 2
+    for digito in reversed(cuerpo):
+        suma += int(digito) * factor
+        factor = 2 if factor == 7 else factor + 1
+    resto = 11 - suma % 11
+    if resto == 11:
+        return "0"
+    if resto == 10:
+        return "K"
+    return str(resto)
+
+
+def _separar(rut: Any) -> Optional[Tuple[str, str]]:
+    """
+    Separa un RUT escrito de cualquier forma ("12.345.678-5", "12345678-5",
+    "123456785", " 12345678 - k ") en (cuerpo, dv). None si no tiene forma de RUT.
+    """
+    if rut is None:
+        return None
+    r = str(rut).replace(".", "").replace(" ", "").upper()
+    if "-" in r:
+        cuerpo, _, dv = r.partition("-")
+    else:
+        cuerpo, dv = r[:-1], r[-1:]
+
+    cuerpo = cuerpo.lstrip("0")
+    if not cuerpo.isdigit() or len(cuerpo) > 9:
+        return None
+    if len(dv) != 1 or dv not in "0123456789K":
+        return None
+    return cuerpo, dv
+
+
+def rut_canonico(rut: Any) -> Optional[str]:
+    """
+    Forma canónica "12345678-5" (sin puntos, con guion, K mayúscula) sin validar
+    el dígito verificador. None si no tiene forma de RUT.
+    Sirve para comparar y buscar; para datos nuevos usar normalizar_rut.
+    """
+    partes = _separar(rut)
+    if partes is None:
+        return None
+    return f"{partes[0]}-{partes[1]}"
+
+
+def normalizar_rut(rut: Any) -> str:
+    """
+    Valida un RUT (formato y dígito verificador) y lo retorna en forma canónica
+    "12345678-5". Lanza ValueError si no es válido.
+    """
+    if rut is None or not str(rut).strip():
+        raise ValueError("El RUT es obligatorio")
+
+    partes = _separar(rut)
+    if partes is None:
+        raise ValueError("El RUT no tiene un formato válido (ej: 12.345.678-5)")
+
+    cuerpo, dv = partes
+    if calcular_dv(cuerpo) != dv:
+        raise ValueError("El RUT no es válido: el dígito verificador no corresponde")
+    return f"{cuerpo}-{dv}"
@@ -1,5 +1,7 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from app.data.db_connection import DBConnection
+from app.data.normalizacion import clave_busqueda, rango_prefijo
+from app.data.paginacion_sql import sql_pagina
 
 
 class TenedorRepository:
@@ -14,11 +16,13 @@ class TenedorRepository:
             raise Exception("No se pudo conectar a la base de datos")
 
         sql = """INSERT INTO tenedor_responsable
-        (rut, nombres, apellidos, telefono, correo, direccion, sector, observaciones, estadoRegistro)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)"""
+        (rut, rutCanonico, nombres, apellidos, telefono, correo, direccion, sector, observaciones, claveBusqueda,
+         estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)"""
         cur = conn.cursor()
         cur.execute(sql, (
             data.get("rut"),
+            data.get("rutCanonico"),
             data.get("nombres"),
             data.get("apellidos"),
             data.get("telefono"),
@@ -26,6 +30,7 @@ class TenedorRepository:
             data.get("direccion"),
             data.get("sector"),
             data.get("observaciones"),
+            clave_busqueda(data.get("apellidos"), data.get("nombres")),
         ))
         conn.commit()
         new_id = cur.lastrowid
@@ -33,7 +38,7 @@ class TenedorRepository:
         return new_id
 
     def get_by_rut(self, rut: str) -> Optional[Dict[str, Any]]:
-        """ Busca un tenedor por RUT (solo activos).
+        """ Busca un tenedor por RUT canónico, ej "12345678-5" (solo activos).
         Retorna dict con columnas, o None si no existe."""
         conn = self.db.connect()
         if not conn:
@@ -41,7 +46,7 @@ class TenedorRepository:
 
         sql = """SELECT *
         FROM tenedor_responsable
-        WHERE rut = ? AND estadoRegistro = 1 """
+        WHERE rutCanonico = ? AND estadoRegistro = 1 """
         cur = conn.cursor()
         cur.execute(sql, (rut,))
         row = cur.fetchone()
@@ -51,6 +56,27 @@ class TenedorRepository:
             return None
         return dict(row)
 
+    def list_by_ruts(self, ruts: List[str]) -> List[Dict[str, Any]]:
+        """Busca en bloque los tenedores activos cuyos RUT canónicos estén en la lista."""
+        if not ruts:
+            return []
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        rows = []
+        cur = conn.cursor()
+        # Por tramos, para no superar el límite de parámetros de SQLite
+        for i in range(0, len(ruts), 500):
+            tramo = ruts[i:i + 500]
+            sql = f"""SELECT *
+            FROM tenedor_responsable
+            WHERE rutCanonico IN ({", ".join("?" for _ in tramo)}) AND estadoRegistro = 1"""
+            cur.execute(sql, tramo)
+            rows.extend(cur.fetchall())
+        self.db.close()
+        return [dict(r) for r in rows]
+
     def list_active(self) -> List[Dict[str, Any]]:
         """Lista todos los tenedores activos."""
         conn = self.db.connect()
@@ -68,6 +94,79 @@ class TenedorRepository:
         self.db.close()
         return [dict(r) for r in rows]
 
+    def list_by_nombre_prefix(self, texto: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Tenedores activos cuyo "apellidos nombres" empieza con texto, sin importar
+        tildes ni mayúsculas ("perez j" encuentra a "Pérez Juan"). Usa idx_tenedor_clave_busqueda."""
+        prefijo = clave_busqueda(texto)
+        if not prefijo:
+            return []
+        desde, hasta = rango_prefijo(prefijo)
+
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        sql = """SELECT *
+        FROM tenedor_responsable
+        WHERE claveBusqueda >= ? AND claveBusqueda < ? AND estadoRegistro = 1
+        ORDER BY claveBusqueda
+        LIMIT ?"""
+        cur = conn.cursor()
+        cur.execute(sql, (desde, hasta, limit))
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    # Clave de orden de list_active_page (la PK desempata nombres repetidos)
+    PAGE_KEYS = ("apellidos", "nombres", "idTenedor")
+
+    # Órdenes disponibles para list_active_page -> columnas de la clave.
+    # Cada uno se resuelve con un índice (sin ordenar en un B-tree temporal).
+    PAGE_ORDERS = {
+        "apellidos": PAGE_KEYS,
+        "rut": ("rutOrden", "idTenedor"),  # RUT numérico (rutCanonico con ceros a la izquierda)
+        "idTenedor": ("idTenedor",),
+    }
+
+    def list_active_page(
+        self,
+        after: Optional[Tuple[Any, ...]] = None,
+        limit: int = 50,
+        order: str = "apellidos",
+        descending: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Página de tenedores activos, por defecto ordenados por (apellidos, nombres, idTenedor).
+        order = clave de PAGE_ORDERS; after = valores de esas columnas en la última
+        fila de la página anterior, o None para la primera."""
+        keys = self.PAGE_ORDERS.get(order)
+        if keys is None:
+            raise ValueError(f"Orden no soportado: {order}")
+        condicion, orden = sql_pagina(keys, descending)
+
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        if after is None:
+            sql = f"""SELECT *
+            FROM tenedor_responsable
+            WHERE estadoRegistro = 1
+            ORDER BY {orden}
+            LIMIT ?"""
+            params = (limit,)
+        else:
+            sql = f"""SELECT *
+            FROM tenedor_responsable
+            WHERE estadoRegistro = 1 AND {condicion}
+            ORDER BY {orden}
+            LIMIT ?"""
+            params = (*after, limit)
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
     def update(self, id_tenedor: int, data: Dict[str, Any]) -> None:
         """Actualiza datos de un tenedor por id."""
         conn = self.db.connect()
@@ -81,7 +180,8 @@ class TenedorRepository:
             correo = ?,
             direccion = ?,
             sector = ?,
-            observaciones = ?
+            observaciones = ?,
+            claveBusqueda = ?
         WHERE idTenedor = ? AND estadoRegistro = 1"""
         cur = conn.cursor()
         cur.execute(sql, (
@@ -92,6 +192,7 @@ class TenedorRepository:
             data.get("direccion"),
             data.get("sector"),
             data.get("observaciones"),
+            clave_busqueda(data.get("apellidos"), data.get("nombres")),
             id_tenedor,
         ))
         conn.commit()
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from app.data.db_connection import DBConnection
 
 
@@ -90,6 +90,63 @@ class UsuarioRepository:
         self.db.close()
         return [dict(r) for r in rows]
 
+    # Clave de orden de list_active_page (nombreUsuario es único)
+    PAGE_KEYS = ("nombreUsuario",)
+
+    def list_active_page(self, after: Optional[Tuple[Any, ...]] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Página de usuarios activos ordenados por nombreUsuario.
+        after = (nombreUsuario,) de la última fila de la página anterior, o None.
+        """
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        if after is None:
+            sql = """
+            SELECT *
+            FROM usuario_sistema
+            WHERE estadoRegistro = 1
+            ORDER BY nombreUsuario
+            LIMIT ?
+            """
+            params = (limit,)
+        else:
+            sql = """
+            SELECT *
+            FROM usuario_sistema
+            WHERE estadoRegistro = 1 AND nombreUsuario > ?
+            ORDER BY nombreUsuario
+            LIMIT ?
+            """
+            params = (*after, limit)
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    def update_password_hash(self, id_usuario: int, hash_anterior: str, hash_nuevo: str) -> bool:
+        """
+        Reemplaza el hash de la contraseña solo si sigue siendo hash_anterior
+        (si la clave cambió entretanto no se pisa). Retorna True si actualizó.
+        """
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        sql = """
+        UPDATE usuario_sistema
+        SET claveEncriptada = ?
+        WHERE idUsuario = ? AND claveEncriptada = ? AND estadoRegistro = 1
+        """
+        cur = conn.cursor()
+        cur.execute(sql, (hash_nuevo, id_usuario, hash_anterior))
+        conn.commit()
+        actualizado = cur.rowcount > 0
+        self.db.close()
+        return actualizado
+
     def deactivate(self, id_usuario: int) -> None:
         """
         Eliminación lógica.
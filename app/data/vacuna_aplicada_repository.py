@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 from app.data.db_connection import DBConnection
 
 
@@ -34,6 +34,35 @@ class VacunaAplicadaRepository:
         self.db.close()
         return new_id
 
+    def create_many(self, items: List[Dict[str, Any]]) -> List[int]:
+        """
+        Inserta varias vacunas aplicadas en una sola transacción (executemany).
+        Retorna los idVacunaAplicada generados, en el mismo orden de items.
+        """
+        if not items:
+            return []
+
+        sql = """
+        INSERT INTO vacuna_aplicada
+        (idAtencion, idTipoVacuna, fechaAplicacion, fechaProximaDosis, dosis, lote, observaciones, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, 1)
+        """
+        params = [(
+            data.get("idAtencion"),
+            data.get("idTipoVacuna"),
+            data.get("fechaAplicacion"),
+            data.get("fechaProximaDosis"),
+            data.get("dosis"),
+            data.get("lote"),
+            data.get("observaciones"),
+        ) for data in items]
+
+        with self.db.transaccion() as conn:
+            conn.executemany(sql, params)
+            # AUTOINCREMENT + lock de escritura => ids consecutivos
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(params) + 1, last_id + 1))
+
     def get_by_id(self, id_vacuna_aplicada: int) -> Optional[Dict[str, Any]]:
         """
         Retorna una vacuna aplicada activa por idVacunaAplicada, o None.
@@ -93,6 +122,57 @@ class VacunaAplicadaRepository:
         self.db.close()
         return [dict(r) for r in rows]
 
+    # Clave de orden de list_all_active_page (descendente)
+    PAGE_KEYS = ("fechaAplicacion", "idVacunaAplicada")
+
+    def list_all_active_page(self, after: Optional[Tuple[Any, ...]] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Página de vacunas aplicadas activas, más recientes primero
+        (fechaAplicacion DESC, idVacunaAplicada DESC).
+        after = (fechaAplicacion, idVacunaAplicada) de la última fila de la página anterior, o None.
+        """
+        conn = self.db.connect()
+        if not conn:
+            raise Exception("No se pudo conectar a la base de datos")
+
+        if after is None:
+            sql = """
+            SELECT *
+            FROM vacuna_aplicada
+            WHERE estadoRegistro = 1
+            ORDER BY fechaAplicacion DESC, idVacunaAplicada DESC
+            LIMIT ?
+            """
+            params = (limit,)
+        else:
+            sql = """
+            SELECT *
+            FROM vacuna_aplicada
+            WHERE estadoRegistro = 1 AND (fechaAplicacion, idVacunaAplicada) < (?, ?)
+            ORDER BY fechaAplicacion DESC, idVacunaAplicada DESC
+            LIMIT ?
+            """
+            params = (*after, limit)
+        cur = conn.cursor()
+        cur.execute(sql, params)
+        rows = cur.fetchall()
+        self.db.close()
+        return [dict(r) for r in rows]
+
+    def iter_active(self, batch_size: int = 500) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre todas las vacunas aplicadas ACTIVAS en orden de idVacunaAplicada (para exportes).
+        Lee de a batch_size filas (ver DBConnection.iterar_lotes), sin cargar
+        toda la tabla en memoria ni bloquear las escrituras mientras se recorre.
+        """
+        sql = """
+        SELECT *
+        FROM vacuna_aplicada
+        WHERE estadoRegistro = 1
+        """
+        for r in self.db.iterar_lotes(sql, "idVacunaAplicada", batch_size):
+            yield dict(r)
+
     def deactivate(self, id_vacuna_aplicada: int) -> None:
         """
         Eliminación lógica: estadoRegistro = 0
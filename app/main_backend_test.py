@@ -1,6 +1,10 @@
+import shutil
+import tempfile
 from pathlib import Path
 
 from app.data.db_connection import DBConnection
+from app.data.migraciones.runner import migrar
+from app.data.catalogo_cache import CatalogoCache
 
 from app.data.tenedor_repository import TenedorRepository
 from app.services.tenedor_service import TenedorService
@@ -22,6 +26,7 @@ from app.services.raza_service import RazaService
 
 from app.data.usuario_repository import UsuarioRepository
 from app.services.usuario_service import UsuarioService
+from app.services.sesion_service import SesionService
 
 from app.data.atencion_repository import AtencionRepository
 from app.services.atencion_service import AtencionService
@@ -44,10 +49,18 @@ from app.services.tipo_medicamento_service import TipoMedicamentoService
 from app.data.medicamento_aplicado_repository import MedicamentoAplicadoRepository
 from app.services.medicamento_aplicado_service import MedicamentoAplicadoService
 
+from app.services.operativo_service import OperativoService
 
+from app.data.busqueda_repository import BusquedaRepository
+from app.services.busqueda_service import BusquedaService
 
 
 
+
+
+RUT_TENEDOR_GUARDADO = "12.345.678-9"
+
+
 def prueba_tenedores(tenedor_service: TenedorService) -> int:
     """
     Crea (si no existe) un tenedor de prueba y retorna su idTenedor.
@@ -55,7 +68,7 @@ def prueba_tenedores(tenedor_service: TenedorService) -> int:
     print("\n=== PRUEBA: TENEDORES ===")
 
     data_tenedor = {
-        "rut": "12.345.678-9",
+        "rut": "12.345.678-5",
         "nombres": "Juan",
         "apellidos": "Pérez",
         "telefono": "987654321",
@@ -65,10 +78,14 @@ def prueba_tenedores(tenedor_service: TenedorService) -> int:
         "observaciones": None
     }
 
-    existente = tenedor_service.obtener_por_rut(data_tenedor["rut"])
+    # En db/veterinaria.db Juan Pérez quedó guardado con dígito verificador incorrecto:
+    # se busca por ese RUT guardado. Solo en una BD sin ese registro se crea con uno válido.
+    existente = (tenedor_service.obtener_por_rut(RUT_TENEDOR_GUARDADO)
+                 or tenedor_service.obtener_por_rut(data_tenedor["rut"]))
     if existente:
-        print(f"✅ Ya existe el RUT {data_tenedor['rut']}. No se crea de nuevo.")
+        print(f"✅ Ya existe el RUT {existente['rut']}. No se crea de nuevo.")
         id_tenedor = existente.get("idTenedor")
+        data_tenedor["rut"] = existente["rut"]
     else:
         print(f"No existe el RUT {data_tenedor['rut']}. Creando tenedor...")
         id_tenedor = tenedor_service.crear_tenedor(data_tenedor)
@@ -289,6 +306,37 @@ def prueba_usuarios(usuario_service: UsuarioService):
     except Exception as e:
         print("✅ Login incorrecto rechazado:", e)
 
+def prueba_sesion(sesion_service: SesionService):
+    print("\n=== PRUEBA: SESIÓN ===")
+
+    try:
+        sesion = sesion_service.iniciar("admin", "Admin123!")
+        print(f"✅ Sesión iniciada: {sesion.usuario['nombreUsuario']} rol={sesion.rol} "
+              f"permisos={sorted(sesion.permisos)}")
+        print("✅ puede('usuarios'):", sesion_service.puede("usuarios"))
+    except Exception as e:
+        print("❌ No se pudo iniciar sesión:", e)
+
+    sesion_service.cerrar()
+    try:
+        sesion_service.exigir("usuarios")
+        print("❌ Esto no debería imprimirse (sesión cerrada aceptada)")
+    except PermissionError as e:
+        print("✅ Sesión cerrada rechazada:", e)
+
+    # Con la sesión como autorizador, crear usuarios exige el permiso "usuarios"
+    sesion_service.usuario_service.autorizar = sesion_service.exigir
+    try:
+        sesion_service.usuario_service.crear_usuario(
+            {"nombreUsuario": "sin_sesion", "password": "Clave123!", "rol": "tecnico"}
+        )
+        print("❌ Esto no debería imprimirse (usuario creado sin sesión)")
+    except PermissionError as e:
+        print("✅ Crear usuario sin sesión rechazado:", e)
+    finally:
+        sesion_service.usuario_service.autorizar = None
+
+
 def prueba_atenciones(atencion_service: AtencionService, id_animal: int, id_personal: int, id_motivo: int):
     print("\n=== PRUEBA: ATENCIONES CLÍNICAS ===")
 
@@ -459,18 +507,107 @@ def prueba_medicamento_aplicado(service: MedicamentoAplicadoService):
     except Exception as e:
         print(f"⚠️ Error al listar medicamentos: {e}")
 
+def prueba_operativo(service: OperativoService):
+    print("\n=== PRUEBA: OPERATIVO (REGISTRO MASIVO) ===")
+
+    lote = {
+        "fechaAtencion": "2025-12-30",
+        "idPersonal": 1,
+        "idMotivoConsulta": 1,
+        "filas": [
+            {
+                "tenedor": {"rut": "13.131.313-6", "nombres": "Pedro", "apellidos": "Hotu",
+                            "telefono": "987654321", "sector": "Hanga Roa"},
+                "animal": {"idEspecie": 1, "nombre": "Toki", "numeroMicrochip": "MC-0002"},
+                "vacunas": [{"id_tipo_vacuna": 1, "fecha_proxima_dosis": "2026-12-30", "lote": "L-OP-01"}],
+                "desparasitaciones": [{"id_tipo_desparasitacion": 1, "fecha_proxima_dosis": "2026-03-30"}],
+            },
+            {
+                "tenedor": {"rut": "22.222.222-2", "nombres": "Ana", "apellidos": "Tuki",
+                            "telefono": "912345678", "sector": "Mataveri"},
+                "animal": {"idEspecie": 2, "nombre": "Michi", "sexo": "H"},
+                "vacunas": [{"id_tipo_vacuna": 1}],
+            },
+            {
+                # Microchip de Firulais con el RUT de otra persona: la fila debe fallar
+                "tenedor": {"rut": "22.222.222-2", "nombres": "Ana", "apellidos": "Tuki",
+                            "telefono": "912345678", "sector": "Mataveri"},
+                "animal": {"idEspecie": 1, "nombre": "Firulais", "numeroMicrochip": "MC-0001"},
+            },
+            {
+                # Mismo tenedor y microchip de la fila 1: se reutilizan (no se duplican)
+                "tenedor": {"rut": "13131313-6", "nombres": "Pedro", "apellidos": "Hotu",
+                            "telefono": "987654321", "sector": "Hanga Roa"},
+                "animal": {"idEspecie": 1, "nombre": "Toki", "numeroMicrochip": "MC-0002"},
+            },
+        ],
+    }
+
+    try:
+        resultado = service.registrar_lote(lote)
+    except Exception as e:
+        print(f"⚠️ No se pudo registrar el operativo: {e}")
+        return
+
+    for r in resultado["ok"]:
+        print(
+            f"✅ Fila {r['fila']}: tenedor={r['idTenedor']} (nuevo={r['tenedorNuevo']}) "
+            f"animal={r['idAnimal']} (nuevo={r['animalNuevo']}) atención={r['idAtencion']} "
+            f"vacunas={r['idsVacunas']} desparasitaciones={r['idsDesparasitaciones']}"
+        )
+    for e in resultado["errores"]:
+        print(f"⚠️ Fila {e['fila']}: {e['error']}")
+
+
+def prueba_busqueda(service: BusquedaService):
+    print("\n=== PRUEBA: BÚSQUEDA (FTS5) ===")
+
+    for texto in ("juan", "perez", "12.345", "firu"):
+        try:
+            r = service.buscar(texto)
+        except Exception as e:
+            print(f"⚠️ Error al buscar '{texto}': {e}")
+            continue
+        print(
+            f"🔎 '{texto}': "
+            f"tenedores={[t['idTenedor'] for t in r['tenedores']]} "
+            f"animales={[a['idAnimal'] for a in r['animales']]} "
+            f"atenciones={[a['idAtencion'] for a in r['atenciones']]}"
+        )
+
+
+def prueba_metricas_sql(db: DBConnection):
+    print("\n=== PRUEBA: MÉTRICAS SQL ===")
+
+    m = db.metricas_sql()
+    print(f"📊 {len(m['sentencias'])} sentencias distintas desde {m['desde']} "
+          f"(lentas >= {m['umbral_lento_ms']} ms: {len(m['lentas'])})")
+    for s in m["sentencias"][:5]:
+        print(f"- {s['llamadas']}x total={s['total_ms']:.2f}ms max={s['max_ms']:.2f}ms "
+              f"filas={s['filas']} errores={s['errores']} | {s['sql'][:70]}")
+
 
 def main():
     print("=== PRUEBA SISTEMA VETERINARIO (BACKEND) ===")
 
     # Ruta absoluta al archivo DB (robusta)
     BASE_DIR = Path(__file__).resolve().parent.parent
-    db_path = str(BASE_DIR / "db" / "veterinaria.db")
-    print("Usando BD en:", db_path)
+    origen = BASE_DIR / "db" / "veterinaria.db"
+
+    # Las pruebas escriben (tenedores, atenciones, ...): se corren sobre una copia
+    # temporal para no tocar la BD del proyecto y partir siempre del mismo estado.
+    db_path = str(Path(tempfile.mkdtemp(prefix="vet-prueba-")) / "veterinaria.db")
+    shutil.copy2(origen, db_path)
+    print("BD original:", origen)
+    print("Usando copia temporal en:", db_path)
+
+    aplicadas = migrar(db_path, verbose=True)
+    print("Migraciones aplicadas:", aplicadas or "ninguna (BD al día)")
 
     db = DBConnection(db_path)
 
     # Servicios / repos
+    # (los catálogos van envueltos en CatalogoCache: una instancia por tabla)
     tenedor_repo = TenedorRepository(db)
     tenedor_service = TenedorService(tenedor_repo)
 
@@ -480,38 +617,46 @@ def main():
     personal_repo = PersonalRepository(db)
     personal_service = PersonalService(personal_repo)
 
-    motivo_repo = MotivoRepository(db)
+    motivo_repo = CatalogoCache(MotivoRepository(db), "idMotivoConsulta")
     motivo_service = MotivoService(motivo_repo)
 
-    especie_repo = EspecieRepository(db)
+    especie_repo = CatalogoCache(EspecieRepository(db), "idEspecie")
     especie_service = EspecieService(especie_repo)
 
-    raza_repo = RazaRepository(db)
+    raza_repo = CatalogoCache(RazaRepository(db), "idRaza")
     raza_service = RazaService(raza_repo, especie_service)
 
     usuario_repo = UsuarioRepository(db)
     usuario_service = UsuarioService(usuario_repo)
+    sesion_service = SesionService(usuario_service, personal_repo)
 
     atencion_repo = AtencionRepository(db)
     atencion_service = AtencionService(atencion_repo, animal_repo, personal_repo, motivo_repo)
 
-    tipo_vacuna_repo = TipoVacunaRepository(db)
+    tipo_vacuna_repo = CatalogoCache(TipoVacunaRepository(db), "idTipoVacuna", incluye_generales=True)
     tipo_vacuna_service = TipoVacunaService(tipo_vacuna_repo, especie_repo)
 
     vacuna_aplicada_repo = VacunaAplicadaRepository(db)
     vacuna_aplicada_service = VacunaAplicadaService(vacuna_aplicada_repo)
 
-    tipo_des_repo = TipoDesparasitacionRepository(db)
+    tipo_des_repo = CatalogoCache(TipoDesparasitacionRepository(db), "idTipoDesparasitacion")
     tipo_des_service = TipoDesparasitacionService(tipo_des_repo)
 
     desparasitacion_aplicada_repo = DesparasitacionAplicadaRepository(db)
     desparasitacion_aplicada_service = DesparasitacionAplicadaService(desparasitacion_aplicada_repo)
 
-    tipo_medicamento_repo = TipoMedicamentoRepository(db)
+    tipo_medicamento_repo = CatalogoCache(TipoMedicamentoRepository(db), "idTipoMedicamento")
     tipo_medicamento_service = TipoMedicamentoService(tipo_medicamento_repo)
     med_aplicado_repo = MedicamentoAplicadoRepository(db)
     med_aplicado_service = MedicamentoAplicadoService(med_aplicado_repo, atencion_repo, tipo_medicamento_repo)
 
+    operativo_service = OperativoService(
+        tenedor_service, animal_service, atencion_service,
+        vacuna_aplicada_service, desparasitacion_aplicada_service
+    )
+
+    busqueda_service = BusquedaService(BusquedaRepository(db))
+
 
 
 
@@ -523,6 +668,7 @@ def main():
     id_especies = prueba_especies(especie_service)
     id_razas = prueba_razas(especie_service, raza_service)
     id_usuarios = prueba_usuarios(usuario_service)
+    prueba_sesion(sesion_service)
     id_atenciones = prueba_atenciones(atencion_service, id_animal=1, id_personal=1, id_motivo=1)
     id_tipo_vacuna = prueba_tipo_vacuna(tipo_vacuna_service)
     id_vacuna_aplicada = prueba_vacuna_aplicada(vacuna_aplicada_service)
@@ -530,6 +676,9 @@ def main():
     id_desparasitacion_aplicada = prueba_desparasitacion_aplicada(desparasitacion_aplicada_service)
     id_tipo_medicamento = prueba_tipo_medicamento(tipo_medicamento_service)
     id_medicamento_aplicado = prueba_medicamento_aplicado(med_aplicado_service)
+    prueba_operativo(operativo_service)
+    prueba_busqueda(busqueda_service)
+    prueba_metricas_sql(db)
 
 
 
@@ -1,6 +1,8 @@
-from typing import Dict, Any, Optional, List
+from functools import partial
+from typing import Dict, Any, Optional, List, Sequence
 from datetime import datetime, date
 from app.data.animal_repository import AnimalRepository
+from app.services.paginacion import obtener_pagina
 
 
 class AnimalService:
@@ -174,14 +176,13 @@ class AnimalService:
     # ------------------------
     # Casos de uso del módulo
     # ------------------------
-    def crear_animal(self, data: Dict[str, Any]) -> int:
+    def armar_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Crea un animal con reglas de negocio:
+        Valida y normaliza los datos de un animal nuevo (sin tocar la BD):
         - obligatorios: idTenedor, idEspecie, nombre
         - sexo: M/H/Desconocido (default Desconocido)
         - fechaNacimientoEst (opcional) y edadEstimadaMeses (opcional)
           * NO se permiten ambas al mismo tiempo
-        - microchip: si viene, no puede repetirse en animales activos
         - viveDentroCasa: 1/0/NULL
         - conviveConOtros: lista controlada guardada como texto "Perros,Gatos"
         """
@@ -211,16 +212,12 @@ class AnimalService:
         estado_repr = self._optional_text_maxlen(data.get("estadoReproductivo"), "estadoReproductivo", 60)
 
         microchip = self._optional_text_maxlen(data.get("numeroMicrochip"), "numeroMicrochip", 60)
-        if microchip is not None:
-            existe = self.repo.get_by_microchip(microchip)
-            if existe is not None:
-                raise ValueError("Ya existe un animal activo con ese número de microchip.")
 
         vive_dentro = self._optional_int01(data.get("viveDentroCasa"), "viveDentroCasa")
         convive = self._validate_convive_checklist(data.get("conviveConOtros"))
         obs = self._optional_text_maxlen(data.get("observaciones"), "observaciones", 500)
 
-        payload = {
+        return {
             "idTenedor": id_tenedor,
             "idEspecie": id_especie,
             "idRaza": id_raza,
@@ -235,7 +232,20 @@ class AnimalService:
             "conviveConOtros": convive,
             "observaciones": obs,
         }
-                
+
+    def crear_animal(self, data: Dict[str, Any]) -> int:
+        """
+        Crea un animal con las reglas de armar_payload() y además:
+        - microchip: si viene, no puede repetirse en animales activos
+        """
+        payload = self.armar_payload(data)
+
+        microchip = payload["numeroMicrochip"]
+        if microchip is not None:
+            existe = self.repo.get_by_microchip(microchip)
+            if existe is not None:
+                raise ValueError("Ya existe un animal activo con ese número de microchip.")
+
         return self.repo.create(payload)
 
     def obtener_por_id(self, id_animal: int) -> Optional[Dict[str, Any]]:
@@ -245,6 +255,24 @@ class AnimalService:
     def listar_activos(self) -> List[Dict[str, Any]]:
         return self.repo.list_active()
 
+    def listar_activos_pagina(
+        self,
+        despues: Optional[Sequence[Any]] = None,
+        limite: int = 50,
+        orden: str = "nombre",
+        descendente: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Animales activos de a una página (ver obtener_pagina), por nombre o por
+        otra columna de repo.PAGE_ORDERS (el orden lo resuelve SQLite con un índice).
+        El cursor `siguiente` solo sirve para el mismo orden y dirección.
+        """
+        claves = self.repo.PAGE_ORDERS.get(orden)
+        if claves is None:
+            raise ValueError(f"No se puede ordenar por {orden}")
+        consulta = partial(self.repo.list_active_page, order=orden, descending=bool(descendente))
+        return obtener_pagina(consulta, claves, despues, limite)
+
     def listar_por_tenedor(self, id_tenedor: int) -> List[Dict[str, Any]]:
         id_tenedor = self._require_int(id_tenedor, "idTenedor")
         return self.repo.list_by_tenedor(id_tenedor)
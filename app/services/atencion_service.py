@@ -44,7 +44,8 @@ class AtencionService:
             raise ValueError("pesoKg no puede ser negativo")
         return peso_f
 
-    def crear_atencion(self, data: Dict[str, Any]) -> int:
+    def armar_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida y normaliza los datos de una atención (sin tocar la BD)."""
         # Obligatorios
         id_animal = data.get("idAnimal")
         id_personal = data.get("idPersonal")
@@ -64,20 +65,7 @@ class AtencionService:
         if lugar not in self.LUGARES_VALIDOS:
             raise ValueError("lugarAtencion inválido (Consulta/Operativo/Domicilio)")
 
-        # Validaciones de FK (para dar error bonito antes que SQLite)
-        animal = self.animal_repo.get_by_id(int(id_animal))
-        if not animal:
-            raise ValueError("El animal indicado no existe o está inactivo")
-
-        personal = self.personal_repo.get_by_id(int(id_personal))
-        if not personal:
-            raise ValueError("El personal indicado no existe o está inactivo")
-
-        motivo = self.motivo_repo.get_by_id(int(id_motivo))
-        if not motivo:
-            raise ValueError("El motivo de consulta indicado no existe o está inactivo")
-
-        payload = {
+        return {
             "idAnimal": int(id_animal),
             "idPersonal": int(id_personal),
             "idMotivoConsulta": int(id_motivo),
@@ -90,7 +78,29 @@ class AtencionService:
             "fechaControlSugerida": self._validar_fecha(data.get("fechaControlSugerida"), "fechaControlSugerida", False),
             "lugarAtencion": lugar,
         }
-        return self.repo.create(payload)
+
+    def crear_atencion(self, data: Dict[str, Any]) -> int:
+        payload = self.armar_payload(data)
+        id_animal = payload["idAnimal"]
+        id_personal = payload["idPersonal"]
+        id_motivo = payload["idMotivoConsulta"]
+
+        # Validaciones de FK + insert en una sola transacción (misma conexión, un commit)
+        with self.repo.db.transaccion():
+            # Validaciones de FK (para dar error bonito antes que SQLite)
+            animal = self.animal_repo.get_by_id(int(id_animal))
+            if not animal:
+                raise ValueError("El animal indicado no existe o está inactivo")
+
+            personal = self.personal_repo.get_by_id(int(id_personal))
+            if not personal:
+                raise ValueError("El personal indicado no existe o está inactivo")
+
+            motivo = self.motivo_repo.get_by_id(int(id_motivo))
+            if not motivo:
+                raise ValueError("El motivo de consulta indicado no existe o está inactivo")
+
+            return self.repo.create(payload)
 
     def obtener_por_id(self, id_atencion: int) -> Optional[Dict[str, Any]]:
         return self.repo.get_by_id(id_atencion)
@@ -0,0 +1,84 @@
+import re
+from typing import Dict, Any, List, Optional
+
+from app.data.busqueda_repository import BusquedaRepository
+
+# "12.345.678-5", "12345678-k", "12.345": se indexan sin puntos ni guion
+_PATRON_RUT = re.compile(r"[0-9][0-9.]*(-[0-9kK]?)?")
+
+
+class BusquedaService:
+    """
+    Búsqueda por prefijo para el autocompletado de la UI.
+
+    Cada palabra escrita se busca como prefijo ("Gonz Ped" encuentra
+    "González Pedro") y todas deben aparecer. Mayúsculas y tildes no importan.
+    """
+
+    LIMITE_MAXIMO = 100
+
+    def __init__(self, repo: BusquedaRepository):
+        self.repo = repo
+
+    # ---------- Helpers ----------
+    def _armar_match(self, texto: Any) -> Optional[str]:
+        """
+        Convierte el texto del usuario en una expresión MATCH de FTS5.
+        Cada palabra va entre comillas (los operadores de FTS5 se tratan como texto)
+        seguida de * (prefijo). Retorna None si no queda nada que buscar.
+        """
+        if texto is None:
+            return None
+
+        terminos = []
+        for palabra in str(texto).split():
+            if _PATRON_RUT.fullmatch(palabra):
+                palabra = palabra.replace(".", "").replace("-", "")
+            # Solo letras/números: la puntuación la descarta igual el tokenizador
+            palabra = re.sub(r"[^\w]+", " ", palabra).strip()
+            for parte in palabra.split():
+                terminos.append(f'"{parte}"*')
+
+        return " ".join(terminos) if terminos else None
+
+    def _validar_limite(self, limite: Any) -> int:
+        try:
+            limite = int(limite)
+        except (TypeError, ValueError):
+            raise ValueError("El límite debe ser un número entero")
+        if limite < 1 or limite > self.LIMITE_MAXIMO:
+            raise ValueError(f"El límite debe estar entre 1 y {self.LIMITE_MAXIMO}")
+        return limite
+
+    # ---------- Operaciones ----------
+    def buscar_tenedores(self, texto: str, limite: int = 20) -> List[Dict[str, Any]]:
+        """Tenedores activos por nombres, apellidos, RUT o sector."""
+        limite = self._validar_limite(limite)
+        match = self._armar_match(texto)
+        return self.repo.buscar_tenedores(match, limite) if match else []
+
+    def buscar_animales(self, texto: str, limite: int = 20) -> List[Dict[str, Any]]:
+        """Animales activos por nombre, color o microchip (incluye nombre del tenedor)."""
+        limite = self._validar_limite(limite)
+        match = self._armar_match(texto)
+        return self.repo.buscar_animales(match, limite) if match else []
+
+    def buscar_atenciones(self, texto: str, limite: int = 20) -> List[Dict[str, Any]]:
+        """Atenciones activas por síntomas, diagnóstico o tratamiento."""
+        limite = self._validar_limite(limite)
+        match = self._armar_match(texto)
+        return self.repo.buscar_atenciones(match, limite) if match else []
+
+    def buscar(self, texto: str, limite: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+        """Búsqueda general: {"tenedores": [...], "animales": [...], "atenciones": [...]}."""
+        limite = self._validar_limite(limite)
+        match = self._armar_match(texto)
+        if not match:
+            return {"tenedores": [], "animales": [], "atenciones": []}
+
+        with self.repo.db.transaccion(escritura=False):
+            return {
+                "tenedores": self.repo.buscar_tenedores(match, limite),
+                "animales": self.repo.buscar_animales(match, limite),
+                "atenciones": self.repo.buscar_atenciones(match, limite),
+            }
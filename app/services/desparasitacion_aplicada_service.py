@@ -6,7 +6,7 @@ class DesparasitacionAplicadaService:
     def __init__(self, repo: DesparasitacionAplicadaRepository):
         self.repo = repo
 
-    def crear(
+    def armar_payload(
         self,
         id_atencion: int,
         id_tipo_desparasitacion: int,
@@ -15,7 +15,8 @@ class DesparasitacionAplicadaService:
         dosis: Optional[str] = None,
         lote: Optional[str] = None,
         observaciones: Optional[str] = None,
-    ) -> int:
+    ) -> Dict[str, Any]:
+        """Valida los datos y arma el payload para el repository (sin tocar la BD)."""
         # Validaciones mínimas
         if not isinstance(id_atencion, int) or id_atencion <= 0:
             raise ValueError("idAtencion inválido")
@@ -35,9 +36,37 @@ class DesparasitacionAplicadaService:
             "lote": (lote or "").strip() or None,
             "observaciones": (observaciones or "").strip() or None,
         }
+        return payload
 
+    def crear(
+        self,
+        id_atencion: int,
+        id_tipo_desparasitacion: int,
+        fecha_aplicacion: str,
+        fecha_proxima_dosis: Optional[str] = None,
+        dosis: Optional[str] = None,
+        lote: Optional[str] = None,
+        observaciones: Optional[str] = None,
+    ) -> int:
+        payload = self.armar_payload(
+            id_atencion, id_tipo_desparasitacion, fecha_aplicacion, fecha_proxima_dosis, dosis, lote, observaciones
+        )
         return self.repo.create(payload)
 
+    def crear_lote(self, registros: List[Dict[str, Any]]) -> List[int]:
+        """
+        Registra varias desparasitaciones aplicadas en una sola transacción.
+        Cada registro lleva los mismos parámetros que crear(); si alguno es
+        inválido no se inserta ninguno. Retorna los ids en el mismo orden.
+        """
+        payloads = []
+        for i, registro in enumerate(registros, start=1):
+            try:
+                payloads.append(self.armar_payload(**registro))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Registro {i}: {e}")
+        return self.repo.create_many(payloads)
+
     def listar_por_atencion(self, id_atencion: int) -> List[Dict[str, Any]]:
         if not isinstance(id_atencion, int) or id_atencion <= 0:
             raise ValueError("idAtencion inválido")
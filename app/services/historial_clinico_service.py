@@ -0,0 +1,41 @@
+from typing import Dict, Any, List
+from app.data.historial_clinico_repository import HistorialClinicoRepository
+
+
+class HistorialClinicoService:
+    # tipoProcedimiento -> clave de la lista dentro de cada atención
+    _LISTAS = {
+        "vacuna": "vacunas",
+        "medicamento": "medicamentos",
+        "desparasitacion": "desparasitaciones",
+    }
+
+    def __init__(self, repo: HistorialClinicoRepository):
+        self.repo = repo
+
+    def obtener_historial(self, id_animal: int) -> List[Dict[str, Any]]:
+        """
+        Historial clínico completo del animal: sus atenciones activas (más reciente
+        primero), cada una con sus listas 'vacunas', 'medicamentos' y
+        'desparasitaciones' y los nombres de catálogo ya resueltos.
+        """
+        if not isinstance(id_animal, int) or id_animal <= 0:
+            raise ValueError("idAnimal inválido")
+
+        # Ambas lecturas en la misma transacción: foto consistente del historial
+        with self.repo.db.transaccion(escritura=False):
+            atenciones = self.repo.list_atenciones(id_animal)
+            procedimientos = self.repo.list_procedimientos(id_animal)
+
+        por_id = {}
+        for a in atenciones:
+            for lista in self._LISTAS.values():
+                a[lista] = []
+            por_id[a["idAtencion"]] = a
+
+        for p in procedimientos:
+            atencion = por_id.get(p["idAtencion"])
+            if atencion is not None:
+                atencion[self._LISTAS[p["tipoProcedimiento"]]].append(p)
+
+        return atenciones
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque
+
+
+class LimitadorIntentos:
+    """
+    Cuenta intentos fallidos por clave (nombre de usuario, equipo) en una ventana
+    deslizante. Desde max_intentos fallos dentro de la ventana, cada intento
+    nuevo debe esperar un tiempo que se duplica con cada fallo extra
+    (espera_base_s, 2x, 4x, ... hasta espera_max_s).
+
+    La memoria es acotada: se guardan a lo más max_claves claves (se descarta la
+    usada hace más tiempo) y a lo más max_intentos + 16 fallos por clave.
+    Es seguro usarlo desde varios hilos. Los fallos se guardan solo en memoria:
+    no se comparten entre procesos ni sobreviven a un reinicio.
+    """
+
+    def __init__(
+        self,
+        max_intentos: int = 5,
+        ventana_s: float = 15 * 60,
+        espera_base_s: float = 1.0,
+        espera_max_s: float = 5 * 60,
+        max_claves: int = 1000,
+        reloj: Callable[[], float] = time.monotonic,
+    ):
+        self.max_intentos = max_intentos
+        self.ventana_s = ventana_s
+        self.espera_base_s = espera_base_s
+        self.espera_max_s = espera_max_s
+        self.max_claves = max_claves
+        self._reloj = reloj
+
+        self._lock = threading.Lock()
+        self._fallos: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    def _vigentes(self, clave: str, ahora: float) -> Deque[float]:
+        """Fallos de la clave dentro de la ventana (descarta los viejos). Llamar con el lock."""
+        fallos = self._fallos.get(clave)
+        if fallos is None:
+            return deque()
+        while fallos and ahora - fallos[0] > self.ventana_s:
+            fallos.popleft()
+        if not fallos:
+            del self._fallos[clave]
+        return fallos
+
+    def segundos_bloqueo(self, clave: str) -> float:
+        """Segundos que faltan para poder intentar de nuevo (0 = puede intentar)."""
+        with self._lock:
+            ahora = self._reloj()
+            fallos = self._vigentes(clave, ahora)
+            exceso = len(fallos) - self.max_intentos
+            if exceso < 0:
+                return 0.0
+            espera = min(self.espera_max_s, self.espera_base_s * (2 ** exceso))
+            return max(0.0, fallos[-1] + espera - ahora)
+
+    def registrar_fallo(self, clave: str) -> None:
+        with self._lock:
+            ahora = self._reloj()
+            fallos = self._vigentes(clave, ahora)
+            if clave not in self._fallos:
+                fallos = self._fallos[clave] = deque(maxlen=self.max_intentos + 16)
+            fallos.append(ahora)
+            self._fallos.move_to_end(clave)
+            while len(self._fallos) > self.max_claves:
+                self._fallos.popitem(last=False)
+
+    def limpiar(self, clave: str) -> None:
+        with self._lock:
+            self._fallos.pop(clave, None)
@@ -18,7 +18,7 @@ class MedicamentoAplicadoService:
         self.atencion_repo = atencion_repo
         self.tipo_medicamento_repo = tipo_medicamento_repo
 
-    def crear(
+    def armar_payload(
         self,
         id_atencion: int,
         id_tipo_medicamento: int,
@@ -26,28 +26,20 @@ class MedicamentoAplicadoService:
         dosis: Optional[str] = None,
         via: Optional[str] = None,
         observaciones: Optional[str] = None,
-    ) -> int:
+    ) -> Dict[str, Any]:
+        """Valida los datos y arma el payload para el repository (sin tocar la BD)."""
         # 1) Validaciones básicas de IDs
         if not isinstance(id_atencion, int) or id_atencion <= 0:
             raise ValueError("idAtencion inválido")
         if not isinstance(id_tipo_medicamento, int) or id_tipo_medicamento <= 0:
             raise ValueError("idTipoMedicamento inválido")
 
-        # 2) Validar existencia (para no depender solo del error SQL)
-        at = self.atencion_repo.get_by_id(id_atencion)
-        if not at:
-            raise ValueError("No existe una atención clínica activa con ese idAtencion")
-
-        tm = self.tipo_medicamento_repo.get_by_id(id_tipo_medicamento)
-        if not tm:
-            raise ValueError("No existe un tipo de medicamento activo con ese idTipoMedicamento")
-
-        # 3) Validar fecha
+        # 2) Validar fecha
         fecha_aplicacion = (fecha_aplicacion or "").strip()
         if not fecha_aplicacion:
             raise ValueError("fechaAplicacion es obligatoria (YYYY-MM-DD)")
 
-        # 4) Validar vía (si viene)
+        # 3) Validar vía (si viene)
         via_clean = (via or "").strip()
         if via_clean:
             # Respetamos mayúsculas como en CHECK, pero aceptamos que el usuario escriba "im", "Iv", etc.
@@ -69,8 +61,53 @@ class MedicamentoAplicadoService:
             "via": via_clean,
             "observaciones": (observaciones or "").strip() or None,
         }
+        return payload
+
+    def _validar_existencia(self, ids_atencion, ids_tipo_medicamento) -> None:
+        # Validar existencia (para no depender solo del error SQL)
+        for id_atencion in ids_atencion:
+            if not self.atencion_repo.get_by_id(id_atencion):
+                raise ValueError(f"No existe una atención clínica activa con idAtencion={id_atencion}")
+
+        for id_tipo in ids_tipo_medicamento:
+            if not self.tipo_medicamento_repo.get_by_id(id_tipo):
+                raise ValueError(f"No existe un tipo de medicamento activo con idTipoMedicamento={id_tipo}")
+
+    def crear(
+        self,
+        id_atencion: int,
+        id_tipo_medicamento: int,
+        fecha_aplicacion: str,
+        dosis: Optional[str] = None,
+        via: Optional[str] = None,
+        observaciones: Optional[str] = None,
+    ) -> int:
+        payload = self.armar_payload(id_atencion, id_tipo_medicamento, fecha_aplicacion, dosis, via, observaciones)
+
+        with self.repo.db.transaccion():
+            self._validar_existencia([id_atencion], [id_tipo_medicamento])
+            return self.repo.create(payload)
+
+    def crear_lote(self, registros: List[Dict[str, Any]]) -> List[int]:
+        """
+        Registra varios medicamentos aplicados en una sola transacción.
+        Cada registro lleva los mismos parámetros que crear(); las atenciones y
+        tipos de medicamento se validan una sola vez por id distinto. Si algún
+        registro es inválido no se inserta ninguno.
+        """
+        payloads = []
+        for i, registro in enumerate(registros, start=1):
+            try:
+                payloads.append(self.armar_payload(**registro))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Registro {i}: {e}")
 
-        return self.repo.create(payload)
+        with self.repo.db.transaccion():
+            self._validar_existencia(
+                sorted({p["idAtencion"] for p in payloads}),
+                sorted({p["idTipoMedicamento"] for p in payloads}),
+            )
+            return self.repo.create_many(payloads)
 
     def listar_por_atencion(self, id_atencion: int) -> List[Dict[str, Any]]:
         if not isinstance(id_atencion, int) or id_atencion <= 0:
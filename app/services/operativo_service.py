@@ -0,0 +1,184 @@
+from typing import Optional, Dict, Any, List, Tuple
+
+from app.services.tenedor_service import TenedorService
+from app.services.animal_service import AnimalService
+from app.services.atencion_service import AtencionService
+from app.services.vacuna_aplicada_service import VacunaAplicadaService
+from app.services.desparasitacion_aplicada_service import DesparasitacionAplicadaService
+from app.services.rut import rut_canonico
+
+
+class OperativoService:
+    """
+    Registro masivo de un operativo (campaña en terreno).
+
+    Recibe el lote completo y lo escribe en una sola transacción:
+    - tenedores y animales se resuelven en bloque por RUT y microchip
+      (se crean solo los que no existen). Si el microchip ya está registrado a
+      otro tenedor, la fila falla: la atención no se anota al animal de otra persona
+    - cada fila crea su atención (lugarAtencion = "Operativo") y sus
+      vacunas / desparasitaciones con executemany
+    - cada fila corre en su propio SAVEPOINT: si una falla se informa el error
+      y el resto del lote sigue adelante
+
+    Formato del lote:
+        {
+            "fechaAtencion": "YYYY-MM-DD",
+            "idPersonal": 1,
+            "idMotivoConsulta": 1,
+            "filas": [
+                {
+                    "tenedor": {...campos de TenedorService...},
+                    "animal": {...campos de AnimalService, sin idTenedor...},
+                    "atencion": {...campos opcionales: sintomas, pesoKg, ...},
+                    "vacunas": [{"id_tipo_vacuna": 1, "fecha_proxima_dosis": ..., ...}],
+                    "desparasitaciones": [{"id_tipo_desparasitacion": 1, ...}],
+                },
+            ],
+        }
+    """
+
+    def __init__(
+        self,
+        tenedor_service: TenedorService,
+        animal_service: AnimalService,
+        atencion_service: AtencionService,
+        vacuna_service: VacunaAplicadaService,
+        desparasitacion_service: DesparasitacionAplicadaService,
+    ):
+        self.tenedor_service = tenedor_service
+        self.animal_service = animal_service
+        self.atencion_service = atencion_service
+        self.vacuna_service = vacuna_service
+        self.desparasitacion_service = desparasitacion_service
+        self.db = atencion_service.repo.db
+
+    # ---------- Helpers ----------
+    def _validar_cabecera(self, lote: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida lo común a todas las filas (una sola vez por lote)."""
+        cabecera = self.atencion_service.armar_payload({
+            "idAnimal": 1,  # se reemplaza por cada fila
+            "idPersonal": lote.get("idPersonal"),
+            "idMotivoConsulta": lote.get("idMotivoConsulta"),
+            "fechaAtencion": lote.get("fechaAtencion"),
+            "lugarAtencion": "Operativo",
+        })
+
+        if not self.atencion_service.personal_repo.get_by_id(cabecera["idPersonal"]):
+            raise ValueError("El personal indicado no existe o está inactivo")
+        if not self.atencion_service.motivo_repo.get_by_id(cabecera["idMotivoConsulta"]):
+            raise ValueError("El motivo de consulta indicado no existe o está inactivo")
+        return cabecera
+
+    def _resolver_existentes(self, filas: List[Dict[str, Any]]):
+        """Busca en bloque los tenedores (por RUT canónico) y animales (por microchip) que ya existen."""
+        ruts = set()
+        microchips = set()
+        for fila in filas:
+            # Un RUT mal escrito no se busca: su fila fallará al validarse
+            rut = rut_canonico((fila.get("tenedor") or {}).get("rut"))
+            if rut:
+                ruts.add(rut)
+            chip = ((fila.get("animal") or {}).get("numeroMicrochip") or "").strip()
+            if chip:
+                microchips.add(chip)
+
+        tenedores = {t["rutCanonico"]: t["idTenedor"] for t in self.tenedor_service.repo.list_by_ruts(sorted(ruts))}
+        # microchip -> (idAnimal, idTenedor)
+        animales = {a["numeroMicrochip"]: (a["idAnimal"], a["idTenedor"])
+                    for a in self.animal_service.repo.list_by_microchips(sorted(microchips))}
+        return tenedores, animales
+
+    def _procesar_fila(
+        self,
+        fila: Dict[str, Any],
+        cabecera: Dict[str, Any],
+        tenedores: Dict[str, int],
+        animales: Dict[str, Tuple[int, int]],
+    ):
+        """Procesa una fila; retorna (resultado, rut, microchip)."""
+        # 1) Tenedor: existente por RUT o nuevo
+        tenedor = self.tenedor_service.armar_payload(fila.get("tenedor") or {})
+        id_tenedor = tenedores.get(tenedor["rutCanonico"])
+        tenedor_nuevo = id_tenedor is None
+
+        # Un microchip conocido debe ser de este tenedor (se revisa antes de crear nada)
+        chip_fila = ((fila.get("animal") or {}).get("numeroMicrochip") or "").strip()
+        existente = animales.get(chip_fila) if chip_fila else None
+        if existente is not None and (tenedor_nuevo or existente[1] != id_tenedor):
+            raise ValueError(f"El microchip {chip_fila} está registrado a otro tenedor")
+
+        if tenedor_nuevo:
+            id_tenedor = self.tenedor_service.repo.create(tenedor)
+
+        # 2) Animal: existente por microchip o nuevo
+        animal = self.animal_service.armar_payload({**(fila.get("animal") or {}), "idTenedor": id_tenedor})
+        chip = animal["numeroMicrochip"]
+        id_animal: Optional[int] = existente[0] if existente is not None else None
+        animal_nuevo = id_animal is None
+        if animal_nuevo:
+            id_animal = self.animal_service.repo.create(animal)
+
+        # 3) Atención del operativo
+        atencion = self.atencion_service.armar_payload({
+            **(fila.get("atencion") or {}),
+            "idAnimal": id_animal,
+            "idPersonal": cabecera["idPersonal"],
+            "idMotivoConsulta": cabecera["idMotivoConsulta"],
+            "fechaAtencion": cabecera["fechaAtencion"],
+            "lugarAtencion": "Operativo",
+        })
+        id_atencion = self.atencion_service.repo.create(atencion)
+
+        # 4) Procedimientos (fecha de aplicación = fecha del operativo por defecto)
+        base = {"id_atencion": id_atencion, "fecha_aplicacion": cabecera["fechaAtencion"]}
+        vacunas = [self.vacuna_service.armar_payload(**{**base, **v}) for v in fila.get("vacunas") or []]
+        desps = [self.desparasitacion_service.armar_payload(**{**base, **d})
+                 for d in fila.get("desparasitaciones") or []]
+
+        resultado = {
+            "idTenedor": id_tenedor,
+            "tenedorNuevo": tenedor_nuevo,
+            "idAnimal": id_animal,
+            "animalNuevo": animal_nuevo,
+            "idAtencion": id_atencion,
+            "idsVacunas": self.vacuna_service.repo.create_many(vacunas),
+            "idsDesparasitaciones": self.desparasitacion_service.repo.create_many(desps),
+        }
+        return resultado, tenedor["rutCanonico"], chip
+
+    # ---------- Operaciones ----------
+    def registrar_lote(self, lote: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Registra el lote completo en una transacción.
+        Retorna {"ok": [...], "errores": [{"fila": n, "error": "..."}]}
+        (filas numeradas desde 1).
+        """
+        filas = lote.get("filas") or []
+        if not filas:
+            raise ValueError("El lote no tiene filas")
+
+        ok: List[Dict[str, Any]] = []
+        errores: List[Dict[str, Any]] = []
+
+        with self.db.transaccion():
+            cabecera = self._validar_cabecera(lote)
+            tenedores, animales = self._resolver_existentes(filas)
+
+            for n, fila in enumerate(filas, start=1):
+                try:
+                    with self.db.transaccion():
+                        resultado, rut, chip = self._procesar_fila(fila, cabecera, tenedores, animales)
+                except Exception as e:
+                    errores.append({"fila": n, "error": str(e)})
+                    continue
+
+                # Solo después de confirmar la fila quedan disponibles para las siguientes
+                if resultado["tenedorNuevo"]:
+                    tenedores[rut] = resultado["idTenedor"]
+                if resultado["animalNuevo"] and chip:
+                    animales[chip] = (resultado["idAnimal"], resultado["idTenedor"])
+
+                ok.append({"fila": n, **resultado})
+
+        return {"ok": ok, "errores": errores}
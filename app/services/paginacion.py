@@ -0,0 +1,40 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+LIMITE_MAXIMO = 500
+
+
+def obtener_pagina(
+    consulta: Callable[..., List[Dict[str, Any]]],
+    claves: Sequence[str],
+    despues: Optional[Sequence[Any]] = None,
+    limite: int = 50,
+) -> Dict[str, Any]:
+    """
+    Arma una página con paginación por clave (keyset) sobre un método
+    list_*_page(after, limit) de un repository.
+
+    Retorna {"filas": [...], "siguiente": cursor o None}. Para pedir la página
+    siguiente se pasa "siguiente" como `despues`; None indica que no hay más filas.
+    """
+    try:
+        limite = int(limite)
+    except (TypeError, ValueError):
+        raise ValueError("El límite de la página debe ser un número entero")
+    if limite < 1 or limite > LIMITE_MAXIMO:
+        raise ValueError(f"El límite de la página debe estar entre 1 y {LIMITE_MAXIMO}")
+
+    after: Optional[Tuple[Any, ...]] = None
+    if despues is not None:
+        after = tuple(despues)
+        if len(after) != len(claves):
+            raise ValueError("El cursor de la página no es válido")
+
+    # Se pide una fila extra solo para saber si existe una página siguiente
+    filas = consulta(after=after, limit=limite + 1)
+    hay_mas = len(filas) > limite
+    filas = filas[:limite]
+
+    siguiente = None
+    if hay_mas:
+        siguiente = tuple(filas[-1][c] for c in claves)
+    return {"filas": filas, "siguiente": siguiente}
@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict, Any
 from datetime import date
 from app.data.personal_repository import PersonalRepository
+from app.services.rut import normalizar_rut, rut_canonico
 
 
 class PersonalService:
@@ -17,26 +18,10 @@ class PersonalService:
     def _normalize_rut(self, rut: str) -> str:
         """
         Normaliza a formato: 12345678-9 (sin puntos, con guion).
-        Acepta entradas con puntos/espacios; fuerza K mayúscula.
+        Acepta entradas con puntos/espacios o sin guion; fuerza K mayúscula
+        y valida el dígito verificador.
         """
-        rut = self._normalize_text(rut)
-        if not rut:
-            raise ValueError("El RUT es obligatorio")
-
-        r = rut.replace(".", "").replace(" ", "").upper()
-        if "-" not in r:
-            raise ValueError("El RUT debe incluir guion (ej: 12345678-9)")
-
-        cuerpo, dv = r.split("-", 1)
-        cuerpo = cuerpo.strip()
-        dv = dv.strip()
-
-        if not cuerpo.isdigit():
-            raise ValueError("El cuerpo del RUT debe ser numérico (sin puntos)")
-        if dv not in "0123456789K":
-            raise ValueError("El dígito verificador del RUT es inválido")
-
-        return f"{cuerpo}-{dv}"
+        return normalizar_rut(rut)
 
     def _validate_date_yyyy_mm_dd(self, value: Optional[str], field_name: str) -> Optional[str]:
         value = self._normalize_text(value)
@@ -80,6 +65,7 @@ class PersonalService:
 
         payload = {
             "rut": rut,
+            "rutCanonico": rut,
             "nombres": nombres,
             "apellidos": apellidos,
             "cargo": cargo,
@@ -93,8 +79,11 @@ class PersonalService:
         return self.repo.create(payload)
 
     def obtener_por_rut(self, rut: str) -> Optional[Dict[str, Any]]:
-        rut_norm = self._normalize_rut(rut)
-        return self.repo.get_by_rut(rut_norm)
+        # Búsqueda sin validar el DV (registros antiguos); ver TenedorService.obtener_por_rut
+        canonico = rut_canonico(rut)
+        if canonico is None:
+            return None
+        return self.repo.get_by_rut(canonico)
 
     def obtener_por_id(self, id_personal: int) -> Optional[Dict[str, Any]]:
         if not isinstance(id_personal, int) or id_personal <= 0:
@@ -0,0 +1,51 @@
+from typing import Optional, Dict, Any, List
+from datetime import date, datetime, timedelta
+from app.data.recordatorio_repository import RecordatorioRepository
+
+
+class RecordatorioService:
+    DIAS_POR_DEFECTO = 30
+    _FECHA_MINIMA = "1900-01-01"
+
+    def __init__(self, repo: RecordatorioRepository):
+        self.repo = repo
+
+    def _validar_fecha(self, value: Optional[str], campo: str) -> Optional[str]:
+        if value is None or str(value).strip() == "":
+            return None
+        try:
+            return datetime.strptime(str(value).strip(), "%Y-%m-%d").date().isoformat()
+        except ValueError:
+            raise ValueError(f"{campo} debe tener formato YYYY-MM-DD")
+
+    def obtener_recordatorios(
+        self,
+        desde: Optional[str] = None,
+        hasta: Optional[str] = None,
+        hoy: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Dosis de vacunas y desparasitaciones que vencen en la ventana [desde, hasta],
+        ordenadas por fecha de vencimiento, con datos del animal y del tenedor
+        (teléfono y sector) para contactarlo.
+
+        - desde vacío: sin límite inferior (incluye todas las vencidas)
+        - hasta vacío: hoy + 30 días
+        - cada fila trae 'vencida' = True si la fecha ya pasó, y 'fechaCalculada' = 1
+          si la fecha salió de intervaloRecMeses (no había fechaProximaDosis)
+        """
+        hoy = hoy or date.today()
+        desde_ok = self._validar_fecha(desde, "desde") or self._FECHA_MINIMA
+        hasta_ok = self._validar_fecha(hasta, "hasta") or (hoy + timedelta(days=self.DIAS_POR_DEFECTO)).isoformat()
+        if desde_ok > hasta_ok:
+            raise ValueError("La fecha 'desde' no puede ser posterior a 'hasta'")
+
+        with self.repo.db.transaccion(escritura=False):
+            filas = self.repo.list_vacunas_pendientes(desde_ok, hasta_ok)
+            filas += self.repo.list_desparasitaciones_pendientes(desde_ok, hasta_ok)
+
+        hoy_iso = hoy.isoformat()
+        for f in filas:
+            f["vencida"] = f["fechaVence"] < hoy_iso
+        filas.sort(key=lambda f: (f["fechaVence"], f.get("sector") or "", f.get("nombreAnimal") or ""))
+        return filas
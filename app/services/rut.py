@@ -0,0 +1,16 @@
+from typing import Any
+
+# La normalización vive en la capa de datos (rutCanonico); aquí se re-exporta
+# junto con el formato para mostrar.
+from app.data.rut import calcular_dv, normalizar_rut, rut_canonico  # noqa: F401
+
+
+def formatear_rut(rut: Any) -> str:
+    """RUT con puntos para mostrar: "12345678-5" -> "12.345.678-5"."""
+    canonico = normalizar_rut(rut)
+    cuerpo, dv = canonico.split("-")
+    grupos = []
+    while cuerpo:
+        grupos.insert(0, cuerpo[-3:])
+        cuerpo = cuerpo[:-3]
+    return f"{'.'.join(grupos)}-{dv}"
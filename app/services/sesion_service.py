@@ -0,0 +1,154 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from app.data.personal_repository import PersonalRepository
+from app.services.usuario_service import UsuarioService
+
+# Permisos = claves de los módulos del dashboard + acciones que no son un módulo.
+PERMISOS_POR_ROL: Dict[str, FrozenSet[str]] = {
+    "admin_sistema": frozenset({
+        "tenedores", "animales", "atencion", "reportes", "catalogos", "admin", "usuarios",
+    }),
+    "veterinario": frozenset({"tenedores", "animales", "atencion", "reportes"}),
+    "tecnico": frozenset({"tenedores", "animales", "atencion"}),
+    "administrativo": frozenset({"tenedores", "animales", "reportes", "catalogos", "admin"}),
+}
+
+ROLES_CLINICOS = frozenset({"veterinario", "tecnico"})
+
+
+@dataclass(frozen=True)
+class Sesion:
+    """
+    Datos del usuario logueado, cargados una sola vez en el login.
+    usuario no incluye el hash; personal es la fila de personal_veterinario
+    asociada (None si el usuario no tiene personal, ej: admin inicial).
+    """
+    usuario: Dict[str, Any]
+    personal: Optional[Dict[str, Any]]
+    permisos: FrozenSet[str]
+
+    @property
+    def id_usuario(self) -> int:
+        return self.usuario["idUsuario"]
+
+    @property
+    def id_personal(self) -> Optional[int]:
+        return self.personal["idPersonal"] if self.personal else None
+
+    @property
+    def rol(self) -> str:
+        return self.usuario.get("rol", "")
+
+    @property
+    def es_clinico(self) -> bool:
+        return self.rol in ROLES_CLINICOS
+
+    @property
+    def es_admin_normal(self) -> bool:
+        return self.rol == "administrativo"
+
+    @property
+    def es_admin_sistema(self) -> bool:
+        return self.rol == "admin_sistema"
+
+    def puede(self, permiso: str) -> bool:
+        return permiso in self.permisos
+
+
+class SesionService:
+    """
+    Sesión del usuario logueado en este equipo.
+
+    iniciar() hace el login y carga usuario, personal y permisos una vez; después
+    puede() / exigir() responden desde memoria, sin ir a la BD. La sesión expira
+    tras VET_SESION_MINUTOS (30 por defecto) sin actividad: la UI llama a
+    registrar_actividad() con cada tecla o clic.
+    """
+    MINUTOS_POR_DEFECTO = 30
+
+    def __init__(
+        self,
+        usuario_service: UsuarioService,
+        personal_repo: PersonalRepository,
+        minutos_inactividad: Optional[float] = None,
+        reloj: Callable[[], float] = time.monotonic,
+    ):
+        self.usuario_service = usuario_service
+        self.personal_repo = personal_repo
+        if minutos_inactividad is None:
+            minutos_inactividad = os.environ.get("VET_SESION_MINUTOS") or self.MINUTOS_POR_DEFECTO
+        try:
+            minutos_inactividad = float(minutos_inactividad)
+        except (TypeError, ValueError):
+            raise ValueError("Los minutos de inactividad deben ser un número")
+        if minutos_inactividad <= 0:
+            raise ValueError("Los minutos de inactividad deben ser mayores a 0")
+        self.segundos_inactividad = minutos_inactividad * 60
+        self._reloj = reloj
+
+        self._lock = threading.Lock()
+        self._sesion: Optional[Sesion] = None
+        self._ultima_actividad = 0.0
+
+    def iniciar(self, nombre_usuario: str, password: str) -> Sesion:
+        """
+        Valida credenciales y deja la sesión activa.
+        Incluye el hash bcrypt: desde la UI se llama con app.tareas.ejecutar.
+        """
+        usuario = self.usuario_service.login(nombre_usuario, password)
+
+        personal = None
+        if usuario.get("idPersonal") is not None:
+            personal = self.personal_repo.get_by_id(usuario["idPersonal"])
+
+        sesion = Sesion(
+            usuario=usuario,
+            personal=personal,
+            permisos=PERMISOS_POR_ROL.get(usuario.get("rol"), frozenset()),
+        )
+        with self._lock:
+            self._sesion = sesion
+            self._ultima_actividad = self._reloj()
+        return sesion
+
+    def cerrar(self) -> None:
+        with self._lock:
+            self._sesion = None
+
+    def registrar_actividad(self) -> None:
+        # Se llama con cada evento de la UI. Una sesión ya expirada no revive:
+        # actual() la cierra y la hora solo se actualiza si sigue vigente.
+        if self.actual() is not None:
+            self._ultima_actividad = self._reloj()
+
+    def actual(self) -> Optional[Sesion]:
+        """Sesión activa, o None si no hay o expiró por inactividad (y la cierra)."""
+        sesion = self._sesion
+        if sesion is None:
+            return None
+        if self._reloj() - self._ultima_actividad > self.segundos_inactividad:
+            with self._lock:
+                if self._sesion is sesion:
+                    self._sesion = None
+            return None
+        return sesion
+
+    def puede(self, permiso: str) -> bool:
+        sesion = self.actual()
+        return sesion is not None and sesion.puede(permiso)
+
+    def exigir(self, permiso: str) -> Sesion:
+        """
+        Para services: retorna la sesión si tiene el permiso.
+        Lanza PermissionError si no hay sesión activa o no tiene permiso.
+        """
+        sesion = self.actual()
+        if sesion is None:
+            raise PermissionError("No hay una sesión activa (o expiró), vuelve a iniciar sesión")
+        if not sesion.puede(permiso):
+            raise PermissionError("No tienes permiso para realizar esta acción")
+        return sesion
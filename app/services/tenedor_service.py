@@ -1,5 +1,8 @@
-from typing import Dict, Any, Optional, List
+from functools import partial
+from typing import Dict, Any, Optional, List, Sequence
 from app.data.tenedor_repository import TenedorRepository
+from app.services.paginacion import obtener_pagina
+from app.services.rut import normalizar_rut, formatear_rut, rut_canonico
 
 
 class TenedorService:
@@ -24,12 +27,9 @@ class TenedorService:
     # ------------------------
     # Casos de uso del módulo
     # ------------------------
-    def crear_tenedor(self, data: Dict[str, Any]) -> int:
-        """Crea un tenedor responsable:
-        - valida obligatorios
-        - evita rut duplicado
-        - llama al repository para insertar"""
-        rut = self._require_text(data.get("rut"), "rut")
+    def armar_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida obligatorios y normaliza los datos de un tenedor nuevo (sin tocar la BD)."""
+        rut = normalizar_rut(data.get("rut"))
         nombres = self._require_text(data.get("nombres"), "nombres")
         apellidos = self._require_text(data.get("apellidos"), "apellidos")
         telefono = self._require_text(data.get("telefono"), "telefono")
@@ -40,13 +40,9 @@ class TenedorService:
         direccion = self._optional_text(data.get("direccion"))
         observaciones = self._optional_text(data.get("observaciones"))
 
-        # Regla: no permitir rut duplicado (activo)
-        existe = self.repo.get_by_rut(rut)
-        if existe is not None:
-            raise ValueError("Ya existe un tenedor activo con ese RUT.")
-
-        payload = {
-            "rut": rut,
+        return {
+            "rut": formatear_rut(rut),
+            "rutCanonico": rut,
             "nombres": nombres,
             "apellidos": apellidos,
             "telefono": telefono,
@@ -56,17 +52,52 @@ class TenedorService:
             "observaciones": observaciones,
         }
 
+    def crear_tenedor(self, data: Dict[str, Any]) -> int:
+        """Crea un tenedor responsable:
+        - valida obligatorios y el RUT (dígito verificador)
+        - evita rut duplicado (escrito con o sin puntos/guion)
+        - llama al repository para insertar"""
+        payload = self.armar_payload(data)
+
+        # Regla: no permitir rut duplicado (activo)
+        existe = self.repo.get_by_rut(payload["rutCanonico"])
+        if existe is not None:
+            raise ValueError("Ya existe un tenedor activo con ese RUT.")
+
         return self.repo.create(payload)
 
     def obtener_por_rut(self, rut: str) -> Optional[Dict[str, Any]]:
-        """ Retorna un tenedor activo por rut, o None si no existe."""
-        rut = self._require_text(rut, "rut")
-        return self.repo.get_by_rut(rut)
+        """ Retorna un tenedor activo por rut, o None si no existe.
+        Busca por rutCanonico sin validar el dígito verificador: así se encuentran
+        también los registros antiguos con DV incorrecto (la validación estricta es
+        solo para crear/actualizar)."""
+        canonico = rut_canonico(rut)
+        if canonico is None:
+            return None
+        return self.repo.get_by_rut(canonico)
 
     def listar_activos(self) -> List[Dict[str, Any]]:
         """ Lista tenedores activos."""
         return self.repo.list_active()
 
+    def listar_activos_pagina(
+        self,
+        despues: Optional[Sequence[Any]] = None,
+        limite: int = 50,
+        orden: str = "apellidos",
+        descendente: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Tenedores activos de a una página (ver obtener_pagina), por apellidos y nombres o por
+        otra columna de repo.PAGE_ORDERS (el orden lo resuelve SQLite con un índice).
+        El cursor `siguiente` solo sirve para el mismo orden y dirección.
+        """
+        claves = self.repo.PAGE_ORDERS.get(orden)
+        if claves is None:
+            raise ValueError(f"No se puede ordenar por {orden}")
+        consulta = partial(self.repo.list_active_page, order=orden, descending=bool(descendente))
+        return obtener_pagina(consulta, claves, despues, limite)
+
     def actualizar_tenedor(self, id_tenedor: int, data: Dict[str, Any]) -> None:
         """ Actualiza un tenedor (solo si está activo):
         - valida obligatorios mínimos (nombres/apellidos/telefono/sector)
@@ -1,14 +1,77 @@
-from typing import Optional, Dict, Any
+import logging
+import math
+import os
+import socket
+import threading
+from typing import Any, Callable, Dict, Optional, Sequence
 import bcrypt
 
 from app.data.usuario_repository import UsuarioRepository
+from app.services.intentos_login import LimitadorIntentos
+from app.services.paginacion import obtener_pagina
+
+logger = logging.getLogger(__name__)
 
 
 class UsuarioService:
     ROLES_VALIDOS = {"admin_sistema", "veterinario", "tecnico", "administrativo"}
 
-    def __init__(self, repo: UsuarioRepository):
+    # Costo (work factor) de bcrypt: cada punto duplica el tiempo de hash y verificación.
+    # Se ajusta por instalación con VET_BCRYPT_COSTO (bajo en equipos antiguos);
+    # python -m bench.bcrypt_bench sugiere el valor para un tiempo objetivo.
+    COSTO_POR_DEFECTO = 12
+    COSTO_MINIMO = 4
+    COSTO_MAXIMO = 31
+
+    def __init__(
+        self,
+        repo: UsuarioRepository,
+        costo_hash: Optional[int] = None,
+        autorizar: Optional[Callable[[str], Any]] = None,
+    ):
+        """
+        :param costo_hash: Costo de bcrypt para hashes nuevos. Si no se indica, se usa
+            la variable de entorno VET_BCRYPT_COSTO o COSTO_POR_DEFECTO.
+        :param autorizar: Función que recibe un permiso y lanza PermissionError si la
+            sesión no lo tiene (SesionService.exigir). None = sin control (scripts, bench).
+        """
         self.repo = repo
+        self.autorizar = autorizar
+        self.costo_hash = self._resolver_costo(costo_hash)
+
+        # Intentos fallidos: por usuario y por equipo (el PC de recepción es compartido,
+        # por eso su límite es más alto). Bloquean antes de llegar a bcrypt.
+        # Los contadores viven en la memoria de esta aplicación, no en la BD: cada
+        # instancia abierta lleva los suyos y al reiniciarla vuelven a cero. El límite
+        # "por equipo" es en realidad por instancia de la aplicación (la clave es el
+        # nombre del PC); frena probar claves a mano, no a quien reinicia la aplicación.
+        self.intentos_usuario = LimitadorIntentos(max_intentos=5)
+        self.intentos_equipo = LimitadorIntentos(max_intentos=20)
+
+        # Hash de una clave cualquiera con el costo actual: se verifica contra él cuando
+        # el usuario no existe, para que esa respuesta tarde lo mismo que una real.
+        self._hash_ficticio: Optional[str] = None
+        self._hash_ficticio_lock = threading.Lock()
+
+    @classmethod
+    def _resolver_costo(cls, costo: Optional[int]) -> int:
+        if costo is None:
+            costo = os.environ.get("VET_BCRYPT_COSTO") or cls.COSTO_POR_DEFECTO
+        try:
+            costo = int(costo)
+        except (TypeError, ValueError):
+            raise ValueError("El costo de bcrypt debe ser un número entero")
+        if costo < cls.COSTO_MINIMO or costo > cls.COSTO_MAXIMO:
+            raise ValueError(f"El costo de bcrypt debe estar entre {cls.COSTO_MINIMO} y {cls.COSTO_MAXIMO}")
+        return costo
+
+    @staticmethod
+    def _costo_de_hash(hashed_str: str) -> Optional[int]:
+        """Costo con que se generó un hash bcrypt ("$2b$12$..." -> 12), o None si no se reconoce."""
+        partes = (hashed_str or "").split("$")
+        if len(partes) < 4 or not partes[2].isdigit():
+            return None
+        return int(partes[2])
 
     def _normalize_username(self, username: str) -> str:
         if username is None:
@@ -36,7 +99,7 @@ class UsuarioService:
         Devuelve el hash bcrypt como string (UTF-8) para guardarlo en SQLite.
         """
         self._validate_password(password)
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=self.costo_hash)
         hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
         return hashed.decode("utf-8")
 
@@ -48,10 +111,20 @@ class UsuarioService:
         except Exception:
             return False
 
+    def _exigir(self, permiso: str) -> None:
+        if self.autorizar is not None:
+            self.autorizar(permiso)
+
     def crear_usuario(self, data: Dict[str, Any]) -> int:
         """
         Crea usuario con hash bcrypt. nombreUsuario se guarda en minúscula.
+        El hash tarda cientos de ms: desde la UI se llama con app.tareas.ejecutar.
+        Requiere el permiso "usuarios".
         """
+        self._exigir("usuarios")
+        return self._crear_usuario(data)
+
+    def _crear_usuario(self, data: Dict[str, Any]) -> int:
         username = self._normalize_username(data.get("nombreUsuario"))
         rol = data.get("rol")
 
@@ -59,13 +132,15 @@ class UsuarioService:
             raise ValueError("Rol inválido")
 
         password = data.get("password")
-        hashed = self._hash_password(password)
+        self._validate_password(password)
 
-        # Validar duplicado (activo)
+        # Validar duplicado (activo) antes de pagar el costo del hash
         existente = self.repo.get_by_username(username)
         if existente:
             raise ValueError("Ya existe un usuario activo con ese nombre de usuario")
 
+        hashed = self._hash_password(password)
+
         payload = {
             "idPersonal": data.get("idPersonal"),  # puede ser None
             "nombreUsuario": username,
@@ -74,27 +149,89 @@ class UsuarioService:
         }
         return self.repo.create(payload)
 
-    def login(self, nombre_usuario: str, password: str) -> Dict[str, Any]:
+    def login(self, nombre_usuario: str, password: str, equipo: Optional[str] = None) -> Dict[str, Any]:
         """
         Retorna datos del usuario si credenciales son válidas.
+        Verificar el hash tarda cientos de ms: desde la UI se llama con app.tareas.ejecutar.
+
+        :param equipo: Identificador del equipo desde donde se intenta (por defecto el
+            nombre de este PC), para limitar los intentos fallidos por equipo. El conteo
+            es en memoria: vale para esta instancia de la aplicación y se pierde al cerrarla.
         """
         username = self._normalize_username(nombre_usuario)
+        equipo = equipo or socket.gethostname()
+
+        espera = max(
+            self.intentos_usuario.segundos_bloqueo(username),
+            self.intentos_equipo.segundos_bloqueo(equipo),
+        )
+        if espera > 0:
+            raise ValueError(
+                f"Demasiados intentos fallidos. Intenta de nuevo en {math.ceil(espera)} segundos"
+            )
+
+        # Si el usuario no existe igual se paga un bcrypt completo (contra el hash ficticio).
+        # Se obtiene antes de buscar al usuario: el costo de generarlo (solo en el primer
+        # login) no debe delatar si el usuario existe.
+        hash_ficticio = self._obtener_hash_ficticio()
         user = self.repo.get_by_username(username)
-        if not user:
+        hash_actual = user.get("claveEncriptada", "") if user else hash_ficticio
+        if not self._check_password(password, hash_actual) or not user:
+            self.intentos_usuario.registrar_fallo(username)
+            self.intentos_equipo.registrar_fallo(equipo)
             raise ValueError("Usuario o contraseña incorrectos")
 
-        if not self._check_password(password, user.get("claveEncriptada", "")):
-            raise ValueError("Usuario o contraseña incorrectos")
+        self.intentos_usuario.limpiar(username)
+
+        # Hash generado con un costo menor al configurado (o no reconocido): se rehace
+        # con el costo actual, sin hacer esperar al usuario. Nunca se baja el costo:
+        # con una BD compartida, un equipo antiguo con VET_BCRYPT_COSTO bajo no debe
+        # debilitar los hashes ni reescribirlos en cada login contra otros equipos.
+        costo_hash = self._costo_de_hash(hash_actual)
+        if costo_hash is None or costo_hash < self.costo_hash:
+            self._rehash_en_segundo_plano(user["idUsuario"], password, hash_actual)
 
         # Nunca devolvemos el hash hacia afuera
         user_safe = dict(user)
         user_safe.pop("claveEncriptada", None)
         return user_safe
 
+    def _obtener_hash_ficticio(self) -> str:
+        if self._hash_ficticio is None:
+            with self._hash_ficticio_lock:
+                if self._hash_ficticio is None:
+                    self._hash_ficticio = self._hash_password(os.urandom(16).hex())
+        return self._hash_ficticio
+
+    def _rehash_en_segundo_plano(self, id_usuario: int, password: str, hash_anterior: str) -> threading.Thread:
+        def rehash():
+            try:
+                nuevo = self._hash_password(password)
+                self.repo.update_password_hash(id_usuario, hash_anterior, nuevo)
+            except Exception as e:
+                # No es crítico: se reintenta en el próximo login
+                logger.warning("No se pudo actualizar el hash del usuario %s: %s", id_usuario, e)
+
+        hilo = threading.Thread(target=rehash, name=f"rehash-usuario-{id_usuario}", daemon=True)
+        hilo.start()
+        return hilo
+
+    def listar_activos_pagina(self, despues: Optional[Sequence[Any]] = None, limite: int = 50) -> Dict[str, Any]:
+        """
+        Usuarios activos por nombreUsuario, de a una página (ver obtener_pagina).
+        No incluye el hash de la contraseña. Requiere el permiso "usuarios".
+        """
+        self._exigir("usuarios")
+        pagina = obtener_pagina(self.repo.list_active_page, self.repo.PAGE_KEYS, despues, limite)
+        for u in pagina["filas"]:
+            u.pop("claveEncriptada", None)
+        return pagina
+
     def crear_admin_sistema_si_no_existe(self, username: str, password: str) -> Optional[int]:
         """
         Crea un admin_sistema inicial solo si no existe uno activo.
         Retorna el idUsuario creado o None si ya existía.
+        Se llama al instalar, antes de que exista una sesión: no pide permiso.
         """
         if self.repo.exists_active_admin_sistema():
             return None
@@ -105,9 +242,9 @@ class UsuarioService:
             "password": password,
             "rol": "admin_sistema",
         }
-        return self.crear_usuario(data)
+        return self._crear_usuario(data)
 
-    # --- Helpers de permisos (para UI después) ---
+    # --- Helpers de permisos por rol (la UI usa Sesion, que los trae precalculados) ---
     def es_clinico(self, rol: str) -> bool:
         return rol in {"veterinario", "tecnico"}
 
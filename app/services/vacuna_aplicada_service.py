@@ -1,12 +1,13 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from app.data.vacuna_aplicada_repository import VacunaAplicadaRepository
+from app.services.paginacion import obtener_pagina
 
 
 class VacunaAplicadaService:
     def __init__(self, repo: VacunaAplicadaRepository):
         self.repo = repo
 
-    def crear(
+    def armar_payload(
         self,
         id_atencion: int,
         id_tipo_vacuna: int,
@@ -15,7 +16,8 @@ class VacunaAplicadaService:
         dosis: Optional[str] = None,
         lote: Optional[str] = None,
         observaciones: Optional[str] = None,
-    ) -> int:
+    ) -> Dict[str, Any]:
+        """Valida los datos y arma el payload para el repository (sin tocar la BD)."""
         # Validaciones mínimas 
         if not isinstance(id_atencion, int) or id_atencion <= 0:
             raise ValueError("idAtencion inválido")
@@ -35,9 +37,37 @@ class VacunaAplicadaService:
             "lote": (lote or "").strip() or None,
             "observaciones": (observaciones or "").strip() or None,
         }
+        return payload
 
+    def crear(
+        self,
+        id_atencion: int,
+        id_tipo_vacuna: int,
+        fecha_aplicacion: str,
+        fecha_proxima_dosis: Optional[str] = None,
+        dosis: Optional[str] = None,
+        lote: Optional[str] = None,
+        observaciones: Optional[str] = None,
+    ) -> int:
+        payload = self.armar_payload(
+            id_atencion, id_tipo_vacuna, fecha_aplicacion, fecha_proxima_dosis, dosis, lote, observaciones
+        )
         return self.repo.create(payload)
 
+    def crear_lote(self, registros: List[Dict[str, Any]]) -> List[int]:
+        """
+        Registra varias vacunas aplicadas en una sola transacción.
+        Cada registro lleva los mismos parámetros que crear(); si alguno es
+        inválido no se inserta ninguno. Retorna los ids en el mismo orden.
+        """
+        payloads = []
+        for i, registro in enumerate(registros, start=1):
+            try:
+                payloads.append(self.armar_payload(**registro))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Registro {i}: {e}")
+        return self.repo.create_many(payloads)
+
     def obtener_por_id(self, id_vacuna_aplicada: int) -> Optional[Dict[str, Any]]:
         return self.repo.get_by_id(id_vacuna_aplicada)
 
@@ -47,5 +77,9 @@ class VacunaAplicadaService:
     def listar_todas(self) -> List[Dict[str, Any]]:
         return self.repo.list_all_active()
 
+    def listar_todas_pagina(self, despues: Optional[Sequence[Any]] = None, limite: int = 50) -> Dict[str, Any]:
+        """Vacunas aplicadas activas, más recientes primero, de a una página (ver obtener_pagina)."""
+        return obtener_pagina(self.repo.list_all_active_page, self.repo.PAGE_KEYS, despues, limite)
+
     def desactivar(self, id_vacuna_aplicada: int) -> None:
         self.repo.deactivate(id_vacuna_aplicada)
@@ -1,13 +1,21 @@
 # app/ui/app_window.py
 import ttkbootstrap as ttk
+from ttkbootstrap.dialogs import Messagebox
 
 from app.ui.theme import UITheme, setup_theme
 from app.ui.login_view import LoginView
 from app.ui.dashboard_view import DashboardView
+from app.ui.segundo_plano import EjecutorUI
+from app.ui.imagenes import GestorImagenes
 
 from app.data.db_connection import DBConnection
+from app.data.migraciones.runner import migrar
 from app.data.usuario_repository import UsuarioRepository
+from app.data.personal_repository import PersonalRepository
 from app.services.usuario_service import UsuarioService
+from app.services.sesion_service import SesionService
+
+INTERVALO_REVISION_SESION_MS = 30_000
 
 
 class AppWindow(ttk.Window):
@@ -23,11 +31,29 @@ class AppWindow(ttk.Window):
         self.minsize(900, 600)
 
         # --- Servicios backend (reutilizamos tu backend real)
+        # Lleva la BD a la versión actual (si ya está al día solo lee user_version)
+        migrar("db/veterinaria.db")
         self.db = DBConnection("db/veterinaria.db")
         self.usuario_repo = UsuarioRepository(self.db)
         self.usuario_service = UsuarioService(self.usuario_repo)
+        self.sesion_service = SesionService(self.usuario_service, PersonalRepository(self.db))
+        # Crear y listar usuarios exige el permiso "usuarios" de la sesión activa
+        self.usuario_service.autorizar = self.sesion_service.exigir
+
+        self.sesion = None        # Sesion del usuario logueado (usuario, personal, permisos)
+        self.current_user = None  # = sesion.usuario, para las vistas que solo leen el usuario
+        self._revision_sesion_id = None
+
+        # Cualquier tecla o clic cuenta como actividad para la expiración de la sesión
+        self.bind_all("<Any-KeyPress>", lambda e: self.sesion_service.registrar_actividad(), add="+")
+        self.bind_all("<Any-ButtonPress>", lambda e: self.sesion_service.registrar_actividad(), add="+")
 
-        self.current_user = None  # guardaremos aquí el usuario logueado
+        # Llamadas a services desde la UI: en hilos, resultados de vuelta en el hilo de Tk
+        self.tareas = EjecutorUI(self)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Logos e íconos: cargados una vez por (archivo, tamaño), compartidos por las vistas
+        self.imagenes = GestorImagenes()
 
         # --- Contenedor principal
         self.container = ttk.Frame(self, padding=20, style="App.TFrame")
@@ -35,6 +61,7 @@ class AppWindow(ttk.Window):
 
         # --- Registro de pantallas (Frames)
         self.frames = {}
+        self.frame_actual = None
         self._register_frames()
 
         self.show_frame("login")
@@ -52,13 +79,42 @@ class AppWindow(ttk.Window):
     def show_frame(self, name: str):
         frame = self.frames.get(name)
         if frame:
+            # Lo que la pantalla anterior pidió ya no se va a mostrar
+            if self.frame_actual and self.frame_actual != name:
+                self.tareas.cancelar_grupo(self.frame_actual)
+            self.frame_actual = name
             frame.tkraise()
 
-    def login_success(self, user_dict: dict):
-        self.current_user = user_dict
+    def _on_close(self):
+        self.tareas.cerrar()
+        self.destroy()
+
+    def login_success(self, sesion):
+        self.sesion = sesion
+        self.current_user = sesion.usuario
         self.frames["dashboard"].refresh()
         self.show_frame("dashboard")
+        self._revisar_sesion()
+
+    def puede(self, permiso: str) -> bool:
+        """Autorización para la UI: se responde desde la sesión, sin consultar la BD."""
+        return self.sesion_service.puede(permiso)
+
+    def _revisar_sesion(self):
+        self._revision_sesion_id = None
+        if self.sesion is None:
+            return
+        if self.sesion_service.actual() is None:
+            self.logout()
+            Messagebox.show_info("La sesión se cerró por inactividad.", "Sesión expirada")
+            return
+        self._revision_sesion_id = self.after(INTERVALO_REVISION_SESION_MS, self._revisar_sesion)
 
     def logout(self):
+        if self._revision_sesion_id is not None:
+            self.after_cancel(self._revision_sesion_id)
+            self._revision_sesion_id = None
+        self.sesion_service.cerrar()
+        self.sesion = None
         self.current_user = None
         self.show_frame("login")
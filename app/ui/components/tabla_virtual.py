@@ -0,0 +1,289 @@
+# app/ui/components/tabla_virtual.py
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import ttkbootstrap as ttk
+from ttkbootstrap.dialogs import Messagebox
+
+ALTO_FILA_POR_DEFECTO = 20
+ALTO_ENCABEZADO = 25
+FILAS_POR_RUEDA = 3
+
+
+class TablaVirtual(ttk.Frame):
+    """
+    Tabla para listas largas (miles de filas) sobre un listar_*_pagina de un service
+    (paginación por clave, ver app/services/paginacion.py).
+
+    - El Treeview tiene solo los ítems que caben en pantalla: al desplazarse se
+      reescriben sus valores, nunca se insertan miles de ítems.
+    - Las páginas se piden en segundo plano (app.tareas) al acercarse al final
+      de lo cargado; la barra de desplazamiento abarca lo cargado hasta ahora.
+    - Clic en el encabezado de una columna ordenable vuelve a pedir desde la
+      primera página con el orden nuevo: el ORDER BY lo hace SQLite con un índice.
+    - De cada fila se guarda solo (id, valores de las columnas), no el dict completo.
+
+    columnas: [(campo, título, ancho), ...]
+    ordenes:  {campo: orden del service} para las columnas ordenables,
+              ej: {"apellidos": "apellidos", "rut": "rut"}.
+    """
+
+    def __init__(
+        self,
+        master,
+        app,
+        cargar_pagina: Callable[..., Dict[str, Any]],
+        columnas: Sequence[Tuple[str, str, int]],
+        id_campo: str,
+        ordenes: Optional[Dict[str, str]] = None,
+        grupo: Optional[str] = None,
+        limite: int = 200,
+        al_abrir: Optional[Callable[[Any], None]] = None,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+        self.app = app
+        self.cargar_pagina = cargar_pagina
+        self.columnas = list(columnas)
+        self.id_campo = id_campo
+        self.ordenes = ordenes or {}
+        self.grupo = grupo
+        self.limite = limite
+        self.al_abrir = al_abrir
+
+        # Orden actual: campo de la columna (None = orden por defecto del service)
+        self._orden_campo: Optional[str] = None
+        self._descendente = False
+
+        self._filas: List[Tuple[Any, ...]] = []  # (id, valor1, valor2, ...)
+        self._siguiente = None
+        self._hay_mas = True
+        self._tarea = None
+        self._generacion = 0  # cambia con cada recarga: descarta páginas de un orden anterior
+
+        self._inicio = 0      # índice en _filas de la primera fila visible
+        self._visibles = 1
+        self._seleccion = None
+
+        campos = [c for c, _, _ in self.columnas]
+        self.tree = ttk.Treeview(self, columns=campos, show="headings", selectmode="browse")
+        for campo, titulo, ancho in self.columnas:
+            self.tree.column(campo, width=ancho, stretch=True)
+        self._actualizar_encabezados()
+
+        self.scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scroll.grid(row=0, column=1, sticky="ns")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<Double-1>", self._on_abrir)
+        self.tree.bind("<Return>", self._on_abrir)
+        # El desplazamiento lo maneja la tabla (el Treeview no debe moverse solo)
+        self.tree.bind("<MouseWheel>", self._on_rueda)
+        self.tree.bind("<Button-4>", lambda e: self._desplazar(-FILAS_POR_RUEDA))
+        self.tree.bind("<Button-5>", lambda e: self._desplazar(FILAS_POR_RUEDA))
+        self.tree.bind("<Up>", lambda e: self._mover_seleccion(-1))
+        self.tree.bind("<Down>", lambda e: self._mover_seleccion(1))
+        self.tree.bind("<Prior>", lambda e: self._desplazar(-self._visibles))
+        self.tree.bind("<Next>", lambda e: self._desplazar(self._visibles))
+        self.tree.bind("<Home>", lambda e: self._ir_a(0))
+        self.tree.bind("<End>", lambda e: self._ir_a(len(self._filas)))
+
+    # ================= API =================
+    def recargar(self):
+        """Descarta lo cargado y pide la primera página (con el orden actual)."""
+        self._generacion += 1
+        if self._tarea is not None:
+            self._tarea.cancelar()
+            self._tarea = None
+        self._filas = []
+        self._siguiente = None
+        self._hay_mas = True
+        self._inicio = 0
+        self._seleccion = None
+        self._render()
+        self._pedir_pagina()
+
+    def seleccion(self) -> Any:
+        """id de la fila seleccionada (según id_campo), o None."""
+        return self._seleccion
+
+    def filas_cargadas(self) -> int:
+        return len(self._filas)
+
+    # ================= Carga =================
+    def _cargando(self) -> bool:
+        return self._tarea is not None and not self._tarea.cancelada
+
+    def _pedir_pagina(self):
+        if self._cargando() or not self._hay_mas:
+            return
+        fn = self.cargar_pagina
+        if self._orden_campo is not None:
+            fn = partial(fn, orden=self.ordenes[self._orden_campo], descendente=self._descendente)
+        generacion = self._generacion
+        self._tarea = self.app.tareas.ejecutar(
+            fn, self._siguiente, self.limite,
+            al_terminar=lambda pagina: self._on_pagina(generacion, pagina),
+            al_fallar=lambda e: self._on_error(generacion, e),
+            grupo=self.grupo,
+            clave=f"tabla-{id(self)}",
+        )
+
+    def _pedir_si_hace_falta(self):
+        # Se pide la página siguiente cuando quedan menos de 3 pantallas cargadas por delante
+        if self._inicio + 3 * self._visibles >= len(self._filas):
+            self._pedir_pagina()
+
+    def _on_pagina(self, generacion: int, pagina: Dict[str, Any]):
+        if generacion != self._generacion:
+            return
+        self._tarea = None
+        campos = [c for c, _, _ in self.columnas]
+        self._filas.extend(
+            (f.get(self.id_campo), *("" if f.get(c) is None else f.get(c) for c in campos))
+            for f in pagina["filas"]
+        )
+        self._siguiente = pagina["siguiente"]
+        self._hay_mas = self._siguiente is not None
+        self._render()
+        self._pedir_si_hace_falta()
+
+    def _on_error(self, generacion: int, e: Exception):
+        if generacion != self._generacion:
+            return
+        self._tarea = None
+        self._hay_mas = False  # no reintentar en cada scroll; recargar() vuelve a intentar
+        Messagebox.show_error(str(e), "No se pudo cargar la lista")
+
+    # ================= Orden =================
+    def _ordenar_por(self, campo: str):
+        if campo == self._orden_campo:
+            self._descendente = not self._descendente
+        else:
+            self._orden_campo = campo
+            self._descendente = False
+        self._actualizar_encabezados()
+        self.recargar()
+
+    def _actualizar_encabezados(self):
+        for campo, titulo, _ in self.columnas:
+            texto = titulo
+            if campo == self._orden_campo:
+                texto += " ▼" if self._descendente else " ▲"
+            if campo in self.ordenes:
+                self.tree.heading(campo, text=texto, command=lambda c=campo: self._ordenar_por(c))
+            else:
+                self.tree.heading(campo, text=texto)
+
+    # ================= Ventana visible =================
+    def _render(self):
+        items = self.tree.get_children()
+        for i in range(len(items), self._visibles):
+            self.tree.insert("", "end", iid=str(i), values=())
+        for iid in items[self._visibles:]:
+            self.tree.delete(iid)
+
+        iid_seleccionado = None
+        for i in range(self._visibles):
+            indice = self._inicio + i
+            if indice < len(self._filas):
+                fila = self._filas[indice]
+                self.tree.item(str(i), values=fila[1:])
+                if self._seleccion is not None and fila[0] == self._seleccion:
+                    iid_seleccionado = str(i)
+            else:
+                self.tree.item(str(i), values=())
+
+        actual = self.tree.selection()
+        if iid_seleccionado is None:
+            if actual:
+                self.tree.selection_remove(*actual)
+        elif actual != (iid_seleccionado,):
+            self.tree.selection_set(iid_seleccionado)
+
+        total = len(self._filas)
+        if total <= self._visibles:
+            self.scroll.set(0.0, 1.0)
+        else:
+            self.scroll.set(self._inicio / total, (self._inicio + self._visibles) / total)
+
+    def _ir_a(self, inicio: int):
+        maximo = max(0, len(self._filas) - self._visibles)
+        inicio = max(0, min(inicio, maximo))
+        if inicio != self._inicio:
+            self._inicio = inicio
+            self._render()
+        self._pedir_si_hace_falta()
+        return "break"
+
+    def _desplazar(self, filas: int):
+        return self._ir_a(self._inicio + filas)
+
+    def _mover_seleccion(self, paso: int):
+        # Flechas: mueve la selección y desplaza si sale de la pantalla
+        if not self._filas:
+            return "break"
+        indice = self._indice_seleccion()
+        indice = self._inicio if indice is None else max(0, min(indice + paso, len(self._filas) - 1))
+        self._seleccion = self._filas[indice][0]
+        if indice < self._inicio:
+            self._inicio = indice
+        elif indice >= self._inicio + self._visibles:
+            self._inicio = indice - self._visibles + 1
+        self._render()
+        self._pedir_si_hace_falta()
+        return "break"
+
+    def _indice_seleccion(self) -> Optional[int]:
+        if self._seleccion is None:
+            return None
+        # La selección suele estar en pantalla: se busca primero ahí
+        for i in range(self._inicio, min(self._inicio + self._visibles, len(self._filas))):
+            if self._filas[i][0] == self._seleccion:
+                return i
+        for i, fila in enumerate(self._filas):
+            if fila[0] == self._seleccion:
+                return i
+        return None
+
+    # ================= Eventos =================
+    def _on_resize(self, event):
+        alto_fila = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            alto_fila = int(alto_fila)
+        except (TypeError, ValueError):
+            alto_fila = ALTO_FILA_POR_DEFECTO
+        visibles = max(1, (event.height - ALTO_ENCABEZADO) // alto_fila)
+        if visibles != self._visibles:
+            self._visibles = visibles
+            self._inicio = max(0, min(self._inicio, len(self._filas) - visibles))
+            self._render()
+            self._pedir_si_hace_falta()
+
+    def _on_scrollbar(self, accion, valor, unidad=None):
+        if accion == "moveto":
+            return self._ir_a(int(float(valor) * len(self._filas)))
+        if accion == "scroll":
+            paso = int(valor) * (self._visibles if unidad == "pages" else 1)
+            return self._desplazar(paso)
+
+    def _on_rueda(self, event):
+        # Windows / macOS: delta en múltiplos de 120 (o ±1 en macOS)
+        pasos = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._desplazar(-pasos * FILAS_POR_RUEDA)
+
+    def _on_select(self, event):
+        sel = self.tree.selection()
+        if not sel:
+            return
+        indice = self._inicio + int(sel[0])
+        if indice < len(self._filas):
+            self._seleccion = self._filas[indice][0]
+
+    def _on_abrir(self, event):
+        if self.al_abrir and self._seleccion is not None:
+            self.al_abrir(self._seleccion)
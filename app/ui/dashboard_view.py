@@ -1,15 +1,8 @@
 # app/ui/dashboard_view.py
-import os
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 from ttkbootstrap.dialogs import Messagebox
 
-try:
-    from PIL import Image, ImageTk
-    PIL_OK = True
-except Exception:
-    PIL_OK = False
-
 
 VERDE_VETERINARIA = "#177E67"
 
@@ -20,7 +13,10 @@ class DashboardView(ttk.Frame):
         self.app = app
         self.configure(style="App.TFrame")
 
-        self._img_refs = {}
+        # Las imágenes se cargan al mostrar el dashboard por primera vez (refresh),
+        # no al construirlo: así no retrasan la ventana de login
+        self._imagenes_cargadas = False
+        self._icon_labels = []  # (label, archivo)
 
         # ========= HEADER (igual al login) =========
         header = ttk.Frame(self, padding=(20, 12), style="Header.TFrame")
@@ -33,13 +29,9 @@ class DashboardView(ttk.Frame):
         header_inner.columnconfigure(1, weight=2)
         header_inner.columnconfigure(2, weight=1)
 
-        # Logo veterinaria izquierda (opcional)
-        self.logo_vet = self._load_logo("logo_veterinaria.png", (80, 80))
-        if self.logo_vet:
-            ttk.Label(header_inner, image=self.logo_vet, background=VERDE_VETERINARIA)\
-                .grid(row=0, column=0, sticky="w")
-        else:
-            ttk.Label(header_inner, text="", background=VERDE_VETERINARIA).grid(row=0, column=0, sticky="w")
+        # Logo veterinaria izquierda (opcional; la imagen se pone en _cargar_imagenes)
+        self.lbl_logo_vet = ttk.Label(header_inner, text="", background=VERDE_VETERINARIA)
+        self.lbl_logo_vet.grid(row=0, column=0, sticky="w")
 
         # Título centrado
         title_box = ttk.Frame(header_inner, style="Header.TFrame")
@@ -102,15 +94,9 @@ class DashboardView(ttk.Frame):
         body.columnconfigure(0, weight=0)
         body.columnconfigure(1, weight=1)
 
-        icon_label = ttk.Label(body, style="ModuleDesc.TLabel")
+        icon_label = ttk.Label(body, text="■", style="ModuleDesc.TLabel")
         icon_label.grid(row=0, column=0, rowspan=2, sticky="nw", padx=(0, 12))
-
-        icon = self._load_icon(icon_filename, size=(46, 46))
-        if icon:
-            icon_label.configure(image=icon)
-            self._img_refs[f"{key}_icon"] = icon
-        else:
-            icon_label.configure(text="■")
+        self._icon_labels.append((icon_label, icon_filename))
 
         lbl_title = ttk.Label(body, text=title, style="ModuleTitle.TLabel")
         lbl_title.grid(row=0, column=1, sticky="nw")
@@ -143,27 +129,27 @@ class DashboardView(ttk.Frame):
             child.bind("<Enter>", on_enter)
             child.bind("<Leave>", on_leave)
 
-    def _load_logo(self, filename, size):
-        if not PIL_OK:
-            return None
-        path = os.path.join("app", "ui", "assets", filename)
-        if not os.path.exists(path):
-            return None
-        try:
-            img = Image.open(path)
-            img = img.resize(size, Image.LANCZOS)
-            return ImageTk.PhotoImage(img)
-        except Exception:
-            return None
-
-    def _load_icon(self, filename, size=(48, 48)):
-        return self._load_logo(filename, size)
+    def _cargar_imagenes(self):
+        imagenes = self.app.imagenes
+        logo = imagenes.obtener("logo_veterinaria.png", (80, 80))
+        if logo:
+            self.lbl_logo_vet.configure(image=logo)
+        for label, archivo in self._icon_labels:
+            icon = imagenes.obtener(archivo, (46, 46))
+            if icon:
+                label.configure(image=icon, text="")
+        self._imagenes_cargadas = True
 
     # ================= Actions =================
     def open_module(self, key, title):
+        if not self.app.puede(key):
+            Messagebox.show_warning(f"Tu rol no tiene acceso al módulo '{title}'.", "Sin permiso")
+            return
         Messagebox.show_info(f"Módulo '{title}' (key={key})\n\nEn construcción ✅", "Navegación")
 
     def refresh(self):
+        if not self._imagenes_cargadas:
+            self._cargar_imagenes()
         if self.app.current_user:
             username = self.app.current_user.get("nombreUsuario", "")
             rol = self.app.current_user.get("rol", "")
@@ -0,0 +1,105 @@
+# app/ui/imagenes.py
+"""
+Imágenes de la UI (logos, íconos de módulos) cargadas una sola vez.
+
+Los PNG de app/ui/assets son grandes: abrirlos y achicarlos con LANCZOS en cada
+pantalla retrasa el arranque. GestorImagenes guarda cada PhotoImage por
+(archivo, tamaño) y, la primera vez que se achica una imagen, deja la variante
+ya achicada en disco (app/ui/assets/cache, o VET_CACHE_IMAGENES), con un nombre
+armado desde la ruta relativa y la extensión del original. En los
+arranques siguientes esa variante se carga directo con Tk, sin PIL.
+
+Si falta un archivo (o no hay PIL ni variante en disco) obtener() retorna None
+y la vista muestra el espacio sin imagen, en vez de caerse.
+"""
+import logging
+import os
+import tkinter as tk
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+try:
+    from PIL import Image, ImageTk
+    PIL_OK = True
+except Exception:
+    PIL_OK = False
+
+CARPETA_ASSETS = Path(__file__).resolve().parent / "assets"
+
+logger = logging.getLogger(__name__)
+
+
+class GestorImagenes:
+    """
+    Caché de PhotoImage por (archivo, tamaño). Una instancia por ventana
+    (AppWindow.imagenes); se usa solo desde el hilo de Tk.
+    La caché también mantiene viva cada imagen (Tk la borra si nadie la referencia).
+    """
+
+    def __init__(self, carpeta=CARPETA_ASSETS, carpeta_cache=None, persistir: bool = True):
+        """
+        :param carpeta_cache: Dónde guardar las variantes achicadas. Por defecto
+            VET_CACHE_IMAGENES o <carpeta>/cache.
+        :param persistir: False para no leer ni escribir variantes en disco.
+        """
+        self.carpeta = Path(carpeta)
+        if carpeta_cache is None:
+            carpeta_cache = os.environ.get("VET_CACHE_IMAGENES") or self.carpeta / "cache"
+        self.carpeta_cache = Path(carpeta_cache) if persistir else None
+        self._imagenes: Dict[Tuple[str, Tuple[int, int]], Optional[tk.PhotoImage]] = {}
+
+    def obtener(self, archivo: str, tamano: Tuple[int, int]) -> Optional[tk.PhotoImage]:
+        """PhotoImage de assets/<archivo> con el tamaño (ancho, alto), o None si no se pudo cargar."""
+        clave = (archivo, (int(tamano[0]), int(tamano[1])))
+        if clave not in self._imagenes:
+            # None también queda en caché: un archivo que falta no se reintenta en cada pantalla
+            self._imagenes[clave] = self._cargar(*clave)
+        return self._imagenes[clave]
+
+    def _ruta_variante(self, archivo: str, tamano: Tuple[int, int]) -> Optional[Path]:
+        if self.carpeta_cache is None:
+            return None
+        # Ruta relativa completa + extensión: "iconos/perro.png" -> "iconos__perro_png_64x64.png",
+        # así dos archivos con el mismo nombre (otra carpeta u otra extensión) no se pisan
+        ruta = Path(archivo)
+        nombre = ruta.with_suffix("").as_posix().replace("/", "__")
+        extension = ruta.suffix.lstrip(".").lower()
+        return self.carpeta_cache / f"{nombre}_{extension}_{tamano[0]}x{tamano[1]}.png"
+
+    def _cargar(self, archivo: str, tamano: Tuple[int, int]) -> Optional[tk.PhotoImage]:
+        origen = self.carpeta / archivo
+        if not origen.exists():
+            logger.warning("No se encontró la imagen %s", origen)
+            return None
+
+        # Variante ya achicada y al día (más nueva que el original): Tk la lee sin PIL
+        variante = self._ruta_variante(archivo, tamano)
+        try:
+            if variante is not None and variante.exists() \
+                    and variante.stat().st_mtime >= origen.stat().st_mtime:
+                return tk.PhotoImage(file=str(variante))
+        except (OSError, tk.TclError) as e:
+            logger.debug("No se pudo usar la variante %s: %s", variante, e)
+
+        if not PIL_OK:
+            return None
+        try:
+            with Image.open(origen) as img:
+                img = img.resize(tamano, Image.LANCZOS)
+        except OSError as e:
+            logger.warning("No se pudo abrir la imagen %s: %s", origen, e)
+            return None
+
+        if variante is not None:
+            self._guardar_variante(img, variante)
+        return ImageTk.PhotoImage(img)
+
+    def _guardar_variante(self, img, variante: Path) -> None:
+        # No es crítico: si la carpeta no se puede escribir, se achica en cada arranque
+        try:
+            variante.parent.mkdir(parents=True, exist_ok=True)
+            temporal = variante.with_suffix(".tmp")
+            img.save(temporal, "PNG")
+            os.replace(temporal, variante)
+        except OSError as e:
+            logger.debug("No se pudo guardar la variante %s: %s", variante, e)
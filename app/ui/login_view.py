@@ -1,7 +1,6 @@
 # app/ui/login_view.py
 import ttkbootstrap as ttk
 from ttkbootstrap.dialogs import Messagebox
-from PIL import Image, ImageTk
 
 from app.ui.components.forms import LabeledEntry
 
@@ -10,6 +9,7 @@ class LoginView(ttk.Frame):
     def __init__(self, master, app, **kwargs):
         super().__init__(master, **kwargs)
         self.app = app
+        self._verificando = False
 
         # Fondo general de la vista
         self.configure(style="App.TFrame")
@@ -26,8 +26,9 @@ class LoginView(ttk.Frame):
         header_inner.columnconfigure(2, weight=1)
 
         # --- Logo veterinaria (izquierda)
-        self.logo_vet = self._load_logo("app/ui/assets/logo_veterinaria.png", (140, 140))
-        ttk.Label(header_inner, image=self.logo_vet, bootstyle="inverse-success").grid(row=0, column=0, sticky="w")
+        # (si falta el archivo, queda el espacio sin imagen)
+        self.logo_vet = self.app.imagenes.obtener("logo_veterinaria.png", (140, 140))
+        ttk.Label(header_inner, image=self.logo_vet or "", bootstyle="inverse-success").grid(row=0, column=0, sticky="w")
 
         # --- Título centrado
         title_box = ttk.Frame(header_inner, style="Header.TFrame")
@@ -48,8 +49,8 @@ class LoginView(ttk.Frame):
         ).pack()
 
         # --- Logo medio ambiente (derecha)
-        self.logo_muni = self._load_logo("app/ui/assets/logo_medioambiente.png", (140, 140))
-        ttk.Label(header_inner, image=self.logo_muni, bootstyle="inverse-success").grid(row=0, column=2, sticky="e")
+        self.logo_muni = self.app.imagenes.obtener("logo_medioambiente.png", (140, 140))
+        ttk.Label(header_inner, image=self.logo_muni or "", bootstyle="inverse-success").grid(row=0, column=2, sticky="e")
 
         # ================= CUERPO =================
         wrapper = ttk.Frame(self, style="App.TFrame")
@@ -80,12 +81,17 @@ class LoginView(ttk.Frame):
         self.in_user.focus()
 
     # ================= HELPERS =================
-    def _load_logo(self, path: str, size: tuple[int, int]):
-        img = Image.open(path)
-        img = img.resize(size, Image.LANCZOS)
-        return ImageTk.PhotoImage(img)
+    def _set_verificando(self, activo: bool):
+        self._verificando = activo
+        if activo:
+            self.btn_login.configure(state="disabled", text="Verificando...")
+        else:
+            self.btn_login.configure(state="normal", text="Ingresar")
 
     def on_login(self):
+        if self._verificando:
+            return
+
         usuario = self.in_user.get().strip()
         clave = self.in_pass.get().strip()
 
@@ -93,8 +99,20 @@ class LoginView(ttk.Frame):
             Messagebox.show_warning("Debes ingresar usuario y contraseña.", "Faltan datos")
             return
 
-        try:
-            user = self.app.usuario_service.login(usuario, clave)
-            self.app.login_success(user)
-        except Exception as e:
-            Messagebox.show_error(str(e), "No se pudo iniciar sesión")
+        # bcrypt tarda cientos de ms a propósito: se verifica fuera del hilo de Tk
+        self._set_verificando(True)
+        self.app.tareas.ejecutar(
+            self.app.sesion_service.iniciar, usuario, clave,
+            al_terminar=self._on_login_ok,
+            al_fallar=self._on_login_error,
+            grupo="login",
+        )
+
+    def _on_login_ok(self, sesion):
+        self._set_verificando(False)
+        self.in_pass.set("")
+        self.app.login_success(sesion)
+
+    def _on_login_error(self, e: Exception):
+        self._set_verificando(False)
+        Messagebox.show_error(str(e), "No se pudo iniciar sesión")
@@ -0,0 +1,169 @@
+# app/ui/segundo_plano.py
+"""
+Ejecución de trabajo lento (hash de contraseñas, consultas a SQLite) fuera del
+hilo de Tk, para que la ventana no se congele.
+
+Las funciones corren en un pool de hilos y dejan su resultado en una cola; el
+hilo de Tk vacía la cola con after() y llama ahí a los callbacks, así pueden
+tocar widgets. (Tkinter no permite tocar widgets desde otros hilos.)
+
+Uso desde una vista (AppWindow crea una sola instancia en app.tareas):
+
+    self.app.tareas.ejecutar(
+        service.listar_por_animal, id_animal,
+        al_terminar=self._mostrar, al_fallar=self._error,
+        grupo="animales", clave="historial",
+    )
+
+- grupo: pantalla dueña de la tarea. Al navegar a otra pantalla, AppWindow
+  cancela las tareas del grupo que se deja (sus resultados se descartan).
+- clave: una tarea nueva con la misma clave cancela la anterior (ej: buscar
+  mientras se escribe: solo importa la última búsqueda).
+"""
+import queue
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+INTERVALO_MS = 30
+
+
+class Tarea:
+    """Una llamada enviada al EjecutorUI. cancelar() descarta su resultado."""
+
+    def __init__(self, grupo: Optional[str], clave: Optional[str],
+                 al_terminar: Optional[Callable[[Any], None]],
+                 al_fallar: Optional[Callable[[Exception], None]]):
+        self.grupo = grupo
+        self.clave = clave
+        self.al_terminar = al_terminar
+        self.al_fallar = al_fallar
+        self.cancelada = False
+        self.futuro: Optional[Future] = None
+
+    def cancelar(self) -> None:
+        # Si todavía no empezó, no llega a correr; si está corriendo, termina
+        # (no se puede interrumpir un hilo) pero su resultado se descarta.
+        self.cancelada = True
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+
+class EjecutorUI:
+    """
+    Pool de hilos + cola de resultados revisada con after() desde el hilo de Tk.
+    ejecutar(), cancelar_grupo() y cerrar() se llaman desde el hilo de Tk.
+    """
+
+    def __init__(self, root, max_workers: int = 2, intervalo_ms: int = INTERVALO_MS):
+        self.root = root
+        self.intervalo_ms = intervalo_ms
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vet-ui")
+        self._resultados: "queue.Queue[Tuple[Tarea, Any, Optional[Exception]]]" = queue.Queue()
+        self._pendientes: Dict[Tarea, None] = {}  # en orden de envío
+        self._por_clave: Dict[str, Tarea] = {}
+        self._revision_id = None
+        self._cerrado = False
+
+    def ejecutar(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        al_terminar: Optional[Callable[[Any], None]] = None,
+        al_fallar: Optional[Callable[[Exception], None]] = None,
+        grupo: Optional[str] = None,
+        clave: Optional[str] = None,
+    ) -> Tarea:
+        """
+        Ejecuta fn(*args) en segundo plano. Al terminar llama, en el hilo de Tk,
+        al_terminar(resultado) o al_fallar(excepción), salvo que la tarea se haya
+        cancelado entretanto.
+        """
+        if self._cerrado:
+            raise RuntimeError("El ejecutor de tareas ya se cerró")
+
+        if clave is not None:
+            anterior = self._por_clave.get(clave)
+            if anterior is not None:
+                anterior.cancelar()
+
+        tarea = Tarea(grupo, clave, al_terminar, al_fallar)
+        self._pendientes[tarea] = None
+        if clave is not None:
+            self._por_clave[clave] = tarea
+        tarea.futuro = self._executor.submit(self._correr, tarea, fn, args)
+
+        def al_cancelar_futuro(futuro: Future):
+            # Cancelada antes de empezar: ningún hilo la toma, se avisa a la cola aquí
+            if futuro.cancelled():
+                self._resultados.put((tarea, None, None))
+
+        tarea.futuro.add_done_callback(al_cancelar_futuro)
+
+        if self._revision_id is None:
+            self._revision_id = self.root.after(self.intervalo_ms, self._revisar)
+        return tarea
+
+    def _correr(self, tarea: Tarea, fn: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+        # Corre en un hilo del pool: solo deja el resultado en la cola
+        if tarea.cancelada:
+            self._resultados.put((tarea, None, None))
+            return
+        try:
+            resultado = fn(*args)
+        except Exception as e:
+            self._resultados.put((tarea, None, e))
+        else:
+            self._resultados.put((tarea, resultado, None))
+
+    def _revisar(self) -> None:
+        self._revision_id = None
+        if self._cerrado or not self.root.winfo_exists():
+            return
+
+        while True:
+            try:
+                tarea, resultado, error = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            self._pendientes.pop(tarea, None)
+            if tarea.clave is not None and self._por_clave.get(tarea.clave) is tarea:
+                del self._por_clave[tarea.clave]
+            if tarea.cancelada:
+                continue
+            try:
+                if error is not None:
+                    if tarea.al_fallar:
+                        tarea.al_fallar(error)
+                elif tarea.al_terminar:
+                    tarea.al_terminar(resultado)
+            except Exception:
+                # Un callback que falla no debe cortar la revisión: las demás tareas
+                # esperan en la cola. Se reporta como cualquier error de un callback de Tk.
+                self.root.report_callback_exception(*sys.exc_info())
+
+        # Solo se sigue revisando mientras haya tareas en curso
+        if self._pendientes:
+            self._revision_id = self.root.after(self.intervalo_ms, self._revisar)
+
+    def cancelar_grupo(self, grupo: str) -> int:
+        """Cancela las tareas en curso de una pantalla. Retorna cuántas se cancelaron."""
+        canceladas = 0
+        for tarea in list(self._pendientes):
+            if tarea.grupo == grupo and not tarea.cancelada:
+                tarea.cancelar()
+                canceladas += 1
+        return canceladas
+
+    def pendientes(self) -> int:
+        return len(self._pendientes)
+
+    def cerrar(self) -> None:
+        """Al cerrar la ventana: descarta lo pendiente y no acepta tareas nuevas."""
+        self._cerrado = True
+        for tarea in list(self._pendientes):
+            tarea.cancelar()
+        if self._revision_id is not None:
+            self.root.after_cancel(self._revision_id)
+            self._revision_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
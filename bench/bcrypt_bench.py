@@ -0,0 +1,72 @@
+"""
+Calibración del costo de bcrypt para este equipo.
+
+Mide cuánto tarda verificar una contraseña (bcrypt.checkpw, lo que paga cada
+login) con cada costo y sugiere el mayor costo que no supera el tiempo objetivo.
+El valor sugerido se configura con la variable de entorno VET_BCRYPT_COSTO.
+
+    python -m bench.bcrypt_bench                 (objetivo 250 ms)
+    python -m bench.bcrypt_bench --objetivo-ms 400 --max 15
+"""
+import argparse
+import statistics
+import sys
+import time
+
+try:
+    import bcrypt
+except ImportError:  # pragma: no cover - depende del equipo
+    bcrypt = None
+
+CLAVE = b"clave-de-prueba-123"
+
+
+def medir_costo(costo: int, repeticiones: int) -> float:
+    """Mediana en ms de bcrypt.checkpw con un hash del costo indicado."""
+    hashed = bcrypt.hashpw(CLAVE, bcrypt.gensalt(rounds=costo))
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        bcrypt.checkpw(CLAVE, hashed)
+        tiempos.append(time.perf_counter() - t0)
+    return statistics.median(tiempos) * 1000
+
+
+def calibrar(objetivo_ms: float, minimo: int, maximo: int, repeticiones: int) -> int:
+    """Recorre los costos de menor a mayor y retorna el mayor que cumple el objetivo."""
+    sugerido = minimo
+    for costo in range(minimo, maximo + 1):
+        ms = medir_costo(costo, repeticiones)
+        cumple = ms <= objetivo_ms
+        print(f"costo={costo:>2}  verificación={ms:>9.1f} ms  {'✅' if cumple else '❌'}")
+        if not cumple:
+            break
+        sugerido = costo
+    return sugerido
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibra el costo de bcrypt para un tiempo objetivo.")
+    parser.add_argument("--objetivo-ms", type=float, default=250.0,
+                        help="Tiempo máximo aceptable por login (ms)")
+    parser.add_argument("--min", type=int, default=8)
+    parser.add_argument("--max", type=int, default=16)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    if bcrypt is None:
+        print("❌ bcrypt no está instalado en este equipo (pip install bcrypt)")
+        sys.exit(1)
+
+    from app.services.usuario_service import UsuarioService
+
+    minimo = max(args.min, UsuarioService.COSTO_MINIMO)
+    maximo = min(args.max, UsuarioService.COSTO_MAXIMO)
+    print(f"Objetivo: verificar una contraseña en <= {args.objetivo_ms:.0f} ms\n")
+    sugerido = calibrar(args.objetivo_ms, minimo, maximo, args.repeticiones)
+    print(f"\nCosto sugerido: {sugerido}  (actual por defecto: {UsuarioService.COSTO_POR_DEFECTO})")
+    print(f"Configurar con: VET_BCRYPT_COSTO={sugerido}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Benchmark de carga: casos de uso de los services sobre una BD con volumen real.
+
+Genera (o reutiliza) una BD sintética con bench.datos_sinteticos y mide cada caso
+de uso con llamadas repetidas: latencia media, p50/p95/p99, llamadas por segundo
+y filas entregadas por segundo. Con --json guarda los resultados para comparar
+entre versiones.
+
+    python -m bench.carga_bench                          (escala chica, BD temporal)
+    python -m bench.carga_bench --escala completa --db /tmp/carga.db --json v1.json
+
+--escala completa genera 50k tenedores, 120k animales y 1M de atenciones (tarda
+unos minutos); con --db la BD se guarda y las siguientes corridas la reutilizan.
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.data.animal_repository import AnimalRepository
+from app.data.atencion_repository import AtencionRepository
+from app.data.db_connection import DBConnection
+from app.data.historial_clinico_repository import HistorialClinicoRepository
+from app.data.motivo_repository import MotivoRepository
+from app.data.personal_repository import PersonalRepository
+from app.data.tenedor_repository import TenedorRepository
+from app.services.atencion_service import AtencionService
+from app.services.historial_clinico_service import HistorialClinicoService
+from app.services.tenedor_service import TenedorService
+from bench.common import crear_bd_temporal, percentil
+from bench.datos_sinteticos import generar
+
+# escala -> (tenedores, animales, atenciones)
+ESCALAS = {
+    "chica": (5000, 12000, 100000),
+    "media": (20000, 50000, 400000),
+    "completa": (50000, 120000, 1000000),
+}
+
+USUARIO_BENCH = "bench"
+CLAVE_BENCH = "clave-bench"
+
+
+def _contar(resultado: Any) -> int:
+    if resultado is None:
+        return 0
+    if isinstance(resultado, (list, tuple)):
+        return len(resultado)
+    return 1
+
+
+def medir_caso(fn: Callable[[int], Any], repeticiones: int) -> Dict[str, float]:
+    """
+    Ejecuta fn(i) N veces. Resumen en microsegundos más llamadas/s y filas/s
+    (filas = largo de la lista retornada, o 1 si retorna un registro o un id).
+    """
+    tiempos: List[float] = []
+    filas = 0
+    for i in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = fn(i)
+        tiempos.append(time.perf_counter() - t0)
+        filas += _contar(resultado)
+    total = sum(tiempos)
+    return {
+        "llamadas": repeticiones,
+        "media_us": total / repeticiones * 1e6,
+        "p50_us": percentil(tiempos, 50) * 1e6,
+        "p95_us": percentil(tiempos, 95) * 1e6,
+        "p99_us": percentil(tiempos, 99) * 1e6,
+        "ops_s": repeticiones / total if total else 0.0,
+        "filas_s": filas / total if total else 0.0,
+    }
+
+
+def imprimir(nombre: str, r: Dict[str, float]) -> None:
+    print(
+        f"{nombre:<30} p50={r['p50_us']:>9.1f}us  p95={r['p95_us']:>9.1f}us  "
+        f"p99={r['p99_us']:>9.1f}us  {r['ops_s']:>9.0f} ops/s  {r['filas_s']:>10.0f} filas/s"
+    )
+
+
+def _conteos(db_path: str) -> Dict[str, int]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return {
+            "animal": conn.execute("SELECT max(idAnimal) FROM animal").fetchone()[0] or 0,
+            "atencion": conn.execute("SELECT max(idAtencion) FROM atencion_clinica").fetchone()[0] or 0,
+            "personal": conn.execute("SELECT min(idPersonal) FROM personal_veterinario").fetchone()[0] or 0,
+            "motivo": conn.execute("SELECT min(idMotivoConsulta) FROM motivo_consulta").fetchone()[0] or 0,
+        }
+    finally:
+        conn.close()
+
+
+def _caso_login(db: DBConnection, repeticiones: int) -> Optional[Dict[str, float]]:
+    """Login con hash real; None si bcrypt no está instalado en este equipo."""
+    try:
+        from app.data.usuario_repository import UsuarioRepository
+        from app.services.usuario_service import UsuarioService
+    except ImportError as e:
+        print(f"{'usuario.login':<30} omitido ({e})")
+        return None
+
+    service = UsuarioService(UsuarioRepository(db))
+    if not service.repo.get_by_username(USUARIO_BENCH):
+        service.crear_usuario({"nombreUsuario": USUARIO_BENCH, "password": CLAVE_BENCH, "rol": "veterinario"})
+    return medir_caso(lambda i: service.login(USUARIO_BENCH, CLAVE_BENCH), repeticiones)
+
+
+def correr(db_path: str, repeticiones: int, semilla: int = 7) -> Dict[str, Dict[str, float]]:
+    db = DBConnection(db_path)
+    atencion_service = AtencionService(
+        AtencionRepository(db), AnimalRepository(db), PersonalRepository(db), MotivoRepository(db)
+    )
+    historial_service = HistorialClinicoService(HistorialClinicoRepository(db))
+    tenedor_service = TenedorService(TenedorRepository(db))
+    n = _conteos(db_path)
+    rnd = random.Random(semilla)
+    animales = [rnd.randint(1, n["animal"]) for _ in range(repeticiones)]
+    atenciones = [rnd.randint(1, n["atencion"]) for _ in range(repeticiones)]
+    hoy = date.today()
+    fechas = [(hoy - timedelta(days=rnd.randrange(5 * 365))).isoformat() for _ in range(repeticiones)]
+
+    # crear_atencion rechaza animales inactivos: solo se usan los activos
+    animal_repo = AnimalRepository(db)
+    activos = [a for a in animales if animal_repo.get_by_id(a)]
+
+    def crear(i: int) -> int:
+        return atencion_service.crear_atencion({
+            "idAnimal": activos[i % len(activos)],
+            "idPersonal": n["personal"],
+            "idMotivoConsulta": n["motivo"],
+            "fechaAtencion": hoy.isoformat(),
+            "sintomas": "Control de carga",
+            "lugarAtencion": "Consulta",
+        })
+
+    def recorrer_paginas(listar, **orden):
+        """Lo que pide TablaVirtual al desplazarse: páginas seguidas con el cursor (vuelve al inicio al terminar)."""
+        cursor = [None]
+
+        def siguiente(i: int):
+            pagina = listar(cursor[0], 200, **orden)
+            cursor[0] = pagina["siguiente"]
+            return pagina["filas"]
+        return siguiente
+
+    casos = [
+        ("atencion.obtener_por_id", lambda i: atencion_service.obtener_por_id(atenciones[i])),
+        ("atencion.listar_por_animal", lambda i: atencion_service.listar_por_animal(animales[i])),
+        ("atencion.listar_por_fecha", lambda i: atencion_service.listar_por_fecha(fechas[i])),
+        ("historial.obtener_historial", lambda i: historial_service.obtener_historial(animales[i])),
+        ("tenedor.pagina (apellidos)", recorrer_paginas(tenedor_service.listar_activos_pagina)),
+        ("tenedor.pagina (rut desc)",
+         recorrer_paginas(tenedor_service.listar_activos_pagina, orden="rut", descendente=True)),
+        ("atencion.crear_atencion", crear),
+    ]
+
+    resultados: Dict[str, Dict[str, float]] = {}
+    try:
+        for nombre, fn in casos:
+            resultados[nombre] = medir_caso(fn, repeticiones)
+            imprimir(nombre, resultados[nombre])
+
+        # bcrypt es lento a propósito: con menos repeticiones basta
+        login = _caso_login(db, max(1, repeticiones // 50))
+        if login:
+            resultados["usuario.login"] = login
+            imprimir("usuario.login", login)
+    finally:
+        db.close_all()
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de carga de los casos de uso principales.")
+    parser.add_argument("--escala", choices=ESCALAS, default="chica")
+    parser.add_argument("--db", help="BD sintética a usar; si no existe se genera ahí")
+    parser.add_argument("--repeticiones", type=int, default=2000)
+    parser.add_argument("--json", help="Archivo donde guardar los resultados")
+    args = parser.parse_args()
+
+    db_path = args.db or crear_bd_temporal("carga.db")
+    tenedores, animales, atenciones = ESCALAS[args.escala]
+    if not args.db or not os.path.exists(args.db) or not _conteos(args.db)["atencion"]:
+        print(f"Generando BD ({tenedores} tenedores, {animales} animales, {atenciones} atenciones)...")
+        t0 = time.perf_counter()
+        conteo = generar(db_path, tenedores, animales, atenciones)
+        total = sum(conteo.values())
+        print(f"  {total} filas en {time.perf_counter() - t0:.1f}s\n")
+    print(f"BD: {db_path}  ({args.repeticiones} llamadas por caso)\n")
+
+    resultados = correr(db_path, args.repeticiones)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"escala": args.escala, "repeticiones": args.repeticiones, "casos": resultados},
+                      f, indent=2, ensure_ascii=False)
+        print(f"\nResultados guardados en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Utilidades compartidas por los benchmarks de bench/.
+
+Se ejecutan desde la raíz del proyecto, por ejemplo:
+    python -m bench.pool_bench
+"""
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from app.data.migraciones.runner import migrar
+
+
+def crear_bd_temporal(nombre: str = "bench.db") -> str:
+    """Crea una BD vacía en un directorio temporal aplicando las migraciones y retorna su ruta."""
+    carpeta = tempfile.mkdtemp(prefix="vet_bench_")
+    db_path = os.path.join(carpeta, nombre)
+    migrar(db_path)
+    return db_path
+
+
+def medir(fn: Callable[[], object], repeticiones: int) -> List[float]:
+    """Ejecuta fn N veces y retorna la latencia de cada llamada en segundos."""
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn()
+        tiempos.append(time.perf_counter() - t0)
+    return tiempos
+
+
+def percentil(valores: List[float], p: float) -> float:
+    ordenados = sorted(valores)
+    if not ordenados:
+        return 0.0
+    k = min(len(ordenados) - 1, max(0, int(round(p / 100.0 * (len(ordenados) - 1)))))
+    return ordenados[k]
+
+
+def resumen(tiempos: List[float]) -> Dict[str, float]:
+    """Resumen en microsegundos: media, p50, p95, p99 y llamadas por segundo."""
+    total = sum(tiempos)
+    return {
+        "media_us": statistics.mean(tiempos) * 1e6 if tiempos else 0.0,
+        "p50_us": percentil(tiempos, 50) * 1e6,
+        "p95_us": percentil(tiempos, 95) * 1e6,
+        "p99_us": percentil(tiempos, 99) * 1e6,
+        "ops_s": len(tiempos) / total if total else 0.0,
+    }
+
+
+def imprimir_fila(nombre: str, r: Dict[str, float]) -> None:
+    print(
+        f"{nombre:<38} media={r['media_us']:>9.1f}us  p50={r['p50_us']:>9.1f}us  "
+        f"p95={r['p95_us']:>9.1f}us  p99={r['p99_us']:>9.1f}us  {r['ops_s']:>10.0f} ops/s"
+    )
@@ -0,0 +1,310 @@
+"""
+Generador de datos sintéticos para benchmarks y revisiones de planes de consulta.
+
+Llena una BD (ya migrada) con volúmenes configurables y distribuciones sesgadas
+como las reales: pocos sectores concentran la mayoría de los tenedores, perros y
+gatos son casi todos los animales y algunos animales se atienden mucho más que otros.
+Inserta directo con executemany (sin pasar por los services) para que generar
+millones de filas tome segundos y no horas.
+
+Uso (desde la raíz del proyecto):
+    python -m bench.datos_sinteticos /tmp/sintetica.db --tenedores 50000 --animales 120000 --atenciones 1000000
+"""
+import argparse
+import random
+import sqlite3
+import time
+from datetime import date, timedelta
+from typing import Dict, List
+
+from app.data.migraciones.runner import migrar
+from app.data.normalizacion import clave_busqueda
+from app.services.rut import calcular_dv, formatear_rut
+
+SECTORES = [
+    "Hanga Roa", "Mataveri", "Tahai", "Hanga Piko", "Vaitea", "Moeroa",
+    "Tuu Koihu", "Hanga Hoonu", "Anakena", "Rano Kau", "Poike", "Vinapu",
+]
+APELLIDOS = [
+    "Tuki", "Pakarati", "Hey", "Atán", "Teao", "Rapu", "Haoa", "Ika", "Paoa",
+    "Pérez", "González", "Muñoz", "Rodríguez", "Martínez", "Araya", "Núñez",
+]
+NOMBRES = [
+    "Juan", "María", "José", "Ana", "Pedro", "Sofía", "Tomás", "Rosa",
+    "Ramón", "Inés", "Matías", "Valentina", "Andrés", "Lucía", "Héctor", "Elena",
+]
+NOMBRES_ANIMAL = [
+    "Firulais", "Michi", "Toby", "Luna", "Max", "Canela", "Rocky", "Nala",
+    "Simón", "Pelusa", "Negro", "Blanca", "Chispa", "Manchas", "Kiko", "Tití",
+]
+COLORES = ["Negro", "Blanco", "Café", "Gris", "Atigrado", "Canela", "Manchado", None]
+SINTOMAS = [
+    "Vómitos y decaimiento", "Cojera pata trasera", "Prurito intenso", "Tos seca",
+    "Diarrea", "Herida en oreja", "Control sin síntomas", "Pérdida de apetito",
+]
+DIAGNOSTICOS = [
+    "Gastroenteritis", "Dermatitis alérgica", "Otitis externa", "Traumatismo leve",
+    "Sano", "Parasitosis intestinal", "Conjuntivitis", "Infección respiratoria",
+]
+TRATAMIENTOS = [
+    "Dieta blanda y reposo", "Antibiótico 7 días", "Limpieza y curación",
+    "Antiparasitario", "Antiinflamatorio 3 días", "Sin tratamiento",
+]
+
+# (nombre, peso) — sesgo por especie
+ESPECIES = [("Perro", 60), ("Gato", 30), ("Equino", 4), ("Ave", 3), ("Otro", 3)]
+RAZAS = {
+    "Perro": ["Mestizo", "Poodle", "Labrador", "Pastor Alemán"],
+    "Gato": ["Mestizo", "Siamés", "Persa"],
+    "Equino": ["Criollo"],
+    "Ave": ["No aplica"],
+    "Otro": ["No aplica"],
+}
+MOTIVOS = ["Control sano", "Vacunación", "Herida / trauma", "Problema digestivo", "Piel", "Esterilización"]
+TIPOS_VACUNA = [("Antirrábica", 12), ("Óctuple", 12), ("Triple felina", 12), ("Leucemia felina", 12),
+                ("KC", 6), ("Refuerzo cachorro", 0)]
+TIPOS_DESPARASITACION = [("Interna comprimido", "Interna", 3), ("Pipeta externa", "Externa", 1),
+                         ("Mixta inyectable", "Mixta", 6)]
+TIPOS_MEDICAMENTO = [("Amoxicilina", "antibiotico"), ("Meloxicam", "antiinflamatorio"),
+                     ("Tramadol", "analgesico"), ("Complejo B", "vitaminas"),
+                     ("Suero fisiológico", "fluidoterapia"), ("Omeprazol", "gastroprotector"),
+                     ("Enrofloxacino", "antibiotico"), ("Ketoprofeno", "antiinflamatorio")]
+VIAS = ["IM", "IV", "VO", "SC", "Topica", "Otra"]
+
+LOTE = 20000
+
+
+def _zipf(n: int, s: float = 1.1) -> List[float]:
+    """Pesos tipo Zipf: el primero es el más frecuente."""
+    return [1 / (k ** s) for k in range(1, n + 1)]
+
+
+def _en_lotes(conn: sqlite3.Connection, sql: str, filas) -> int:
+    total = 0
+    lote = []
+    for f in filas:
+        lote.append(f)
+        if len(lote) >= LOTE:
+            conn.executemany(sql, lote)
+            total += len(lote)
+            lote = []
+    if lote:
+        conn.executemany(sql, lote)
+        total += len(lote)
+    return total
+
+
+def _catalogos(conn: sqlite3.Connection) -> Dict[str, List[int]]:
+    ids: Dict[str, List[int]] = {}
+
+    def insertar(sql, filas):
+        resultado = []
+        for f in filas:
+            resultado.append(conn.execute(sql, f).lastrowid)
+        return resultado
+
+    ids["especie"] = insertar("INSERT INTO especie (nombreEspecie) VALUES (?)", [(e,) for e, _ in ESPECIES])
+    ids["raza_por_especie"] = []
+    for id_especie, (especie, _) in zip(ids["especie"], ESPECIES):
+        ids["raza_por_especie"].append(insertar(
+            "INSERT INTO raza (idEspecie, nombreRaza) VALUES (?, ?)",
+            [(id_especie, r) for r in RAZAS[especie]],
+        ))
+    ids["motivo"] = insertar("INSERT INTO motivo_consulta (nombreMotivo) VALUES (?)", [(m,) for m in MOTIVOS])
+    ids["personal"] = insertar(
+        "INSERT INTO personal_veterinario (rut, rutCanonico, nombres, apellidos, cargo) VALUES (?, ?, ?, ?, ?)",
+        [(f"{9000000 + i}-{calcular_dv(str(9000000 + i))}", f"{9000000 + i}-{calcular_dv(str(9000000 + i))}",
+          NOMBRES[i], APELLIDOS[i], "Veterinario") for i in range(5)],
+    )
+    ids["tipo_vacuna"] = insertar(
+        "INSERT INTO tipo_vacuna (nombreVacuna, intervaloRecMeses) VALUES (?, ?)",
+        [(n, m or None) for n, m in TIPOS_VACUNA],
+    )
+    ids["tipo_desparasitacion"] = insertar(
+        "INSERT INTO tipo_desparasitacion (nombreDesparasitacion, tipo, intervaloRecMeses) VALUES (?, ?, ?)",
+        TIPOS_DESPARASITACION,
+    )
+    ids["tipo_medicamento"] = insertar(
+        "INSERT INTO tipo_medicamento (nombreMedicamento, categoria) VALUES (?, ?)", TIPOS_MEDICAMENTO,
+    )
+    return ids
+
+
+def generar(
+    db_path: str,
+    tenedores: int = 5000,
+    animales: int = 12000,
+    atenciones: int = 50000,
+    semilla: int = 1,
+    verbose: bool = False,
+) -> Dict[str, int]:
+    """
+    Migra la BD y la llena con datos sintéticos. Retorna filas insertadas por tabla.
+    Pensado para BD nuevas (vacías).
+    """
+    migrar(db_path)
+    rnd = random.Random(semilla)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = OFF")
+    conteo: Dict[str, int] = {}
+    t0 = time.perf_counter()
+
+    def avance(tabla: str) -> None:
+        if verbose:
+            print(f"  {tabla:<26}{conteo[tabla]:>10} filas  ({time.perf_counter() - t0:.1f}s)")
+
+    conn.execute("BEGIN")
+    ids = _catalogos(conn)
+
+    # --- Tenedores (sesgados por sector)
+    pesos_sector = _zipf(len(SECTORES))
+
+    def filas_tenedor():
+        for i in range(tenedores):
+            cuerpo = str(10000000 + i)
+            canonico = f"{cuerpo}-{calcular_dv(cuerpo)}"
+            nombres = f"{rnd.choice(NOMBRES)} {rnd.choice(NOMBRES)}"
+            apellidos = f"{rnd.choice(APELLIDOS)} {rnd.choice(APELLIDOS)}"
+            yield (
+                formatear_rut(canonico), canonico, nombres, apellidos,
+                f"9{rnd.randrange(10000000, 99999999)}",
+                rnd.choices(SECTORES, pesos_sector)[0],
+                clave_busqueda(apellidos, nombres),
+                0 if rnd.random() < 0.03 else 1,
+            )
+
+    conteo["tenedor_responsable"] = _en_lotes(conn, """
+        INSERT INTO tenedor_responsable
+        (rut, rutCanonico, nombres, apellidos, telefono, sector, claveBusqueda, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""", filas_tenedor())
+    avance("tenedor_responsable")
+    primer_tenedor = conn.execute("SELECT min(idTenedor) FROM tenedor_responsable").fetchone()[0]
+
+    # --- Animales (sesgados por especie; ~40% con microchip)
+    pesos_especie = [p for _, p in ESPECIES]
+
+    def filas_animal():
+        for i in range(animales):
+            k = rnd.choices(range(len(ESPECIES)), pesos_especie)[0]
+            nombre = rnd.choice(NOMBRES_ANIMAL)
+            yield (
+                primer_tenedor + rnd.randrange(tenedores),
+                ids["especie"][k],
+                rnd.choice(ids["raza_por_especie"][k]),
+                nombre,
+                rnd.choice(["M", "H", "Desconocido"]),
+                rnd.choice(COLORES),
+                f"CHIP{i:09d}" if rnd.random() < 0.4 else None,
+                clave_busqueda(nombre),
+                0 if rnd.random() < 0.05 else 1,
+            )
+
+    conteo["animal"] = _en_lotes(conn, """
+        INSERT INTO animal
+        (idTenedor, idEspecie, idRaza, nombre, sexo, color, numeroMicrochip, claveBusqueda, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", filas_animal())
+    avance("animal")
+    primer_animal = conn.execute("SELECT min(idAnimal) FROM animal").fetchone()[0]
+
+    # --- Atenciones (algunos animales se atienden mucho más) en los últimos 5 años
+    hoy = date.today()
+    pesos_animal = _zipf(animales, 0.6)
+    animal_de = rnd.choices(range(animales), pesos_animal, k=atenciones)
+
+    def filas_atencion():
+        for i in range(atenciones):
+            fecha = hoy - timedelta(days=rnd.randrange(5 * 365))
+            yield (
+                primer_animal + animal_de[i],
+                rnd.choice(ids["personal"]),
+                rnd.choice(ids["motivo"]),
+                fecha.isoformat(),
+                rnd.choice(SINTOMAS),
+                round(rnd.uniform(1, 45), 1),
+                rnd.choice(DIAGNOSTICOS),
+                rnd.choice(TRATAMIENTOS),
+                rnd.choices(["Consulta", "Operativo", "Domicilio"], [70, 25, 5])[0],
+                0 if rnd.random() < 0.03 else 1,
+            )
+
+    conteo["atencion_clinica"] = _en_lotes(conn, """
+        INSERT INTO atencion_clinica
+        (idAnimal, idPersonal, idMotivoConsulta, fechaAtencion, sintomas, pesoKg,
+         diagnostico, tratamiento, lugarAtencion, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""", filas_atencion())
+    avance("atencion_clinica")
+
+    # --- Procedimientos: se recorren las atenciones ya insertadas
+    atenciones_bd = conn.execute("SELECT idAtencion, fechaAtencion FROM atencion_clinica").fetchall()
+
+    def proxima(fecha: str, meses: int) -> str:
+        d = date.fromisoformat(fecha) + timedelta(days=30 * meses)
+        return d.isoformat()
+
+    def filas_vacuna():
+        for id_atencion, fecha in atenciones_bd:
+            if rnd.random() < 0.4:
+                k = rnd.randrange(len(TIPOS_VACUNA))
+                meses = TIPOS_VACUNA[k][1]
+                yield (id_atencion, ids["tipo_vacuna"][k], fecha,
+                       proxima(fecha, meses) if meses and rnd.random() < 0.5 else None,
+                       "1 ml", f"L-{rnd.randrange(1000):03d}", 0 if rnd.random() < 0.02 else 1)
+
+    conteo["vacuna_aplicada"] = _en_lotes(conn, """
+        INSERT INTO vacuna_aplicada
+        (idAtencion, idTipoVacuna, fechaAplicacion, fechaProximaDosis, dosis, lote, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, ?)""", filas_vacuna())
+    avance("vacuna_aplicada")
+
+    def filas_desparasitacion():
+        for id_atencion, fecha in atenciones_bd:
+            if rnd.random() < 0.3:
+                k = rnd.randrange(len(TIPOS_DESPARASITACION))
+                meses = TIPOS_DESPARASITACION[k][2]
+                yield (id_atencion, ids["tipo_desparasitacion"][k], fecha,
+                       proxima(fecha, meses) if rnd.random() < 0.5 else None,
+                       "1 comp", 0 if rnd.random() < 0.02 else 1)
+
+    conteo["desparasitacion_aplicada"] = _en_lotes(conn, """
+        INSERT INTO desparasitacion_aplicada
+        (idAtencion, idTipoDesparasitacion, fechaAplicacion, fechaProximaDosis, dosis, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?)""", filas_desparasitacion())
+    avance("desparasitacion_aplicada")
+
+    def filas_medicamento():
+        for id_atencion, fecha in atenciones_bd:
+            if rnd.random() < 0.35:
+                yield (id_atencion, rnd.choice(ids["tipo_medicamento"]), fecha, "según peso",
+                       rnd.choice(VIAS), 0 if rnd.random() < 0.02 else 1)
+
+    conteo["medicamento_aplicado"] = _en_lotes(conn, """
+        INSERT INTO medicamento_aplicado
+        (idAtencion, idTipoMedicamento, fechaAplicacion, dosis, via, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?)""", filas_medicamento())
+    avance("medicamento_aplicado")
+
+    conn.execute("COMMIT")
+    conn.close()
+    return conteo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera una BD sintética del sistema veterinario.")
+    parser.add_argument("db_path")
+    parser.add_argument("--tenedores", type=int, default=50000)
+    parser.add_argument("--animales", type=int, default=120000)
+    parser.add_argument("--atenciones", type=int, default=1000000)
+    parser.add_argument("--semilla", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"Generando {args.db_path} ...")
+    t0 = time.perf_counter()
+    conteo = generar(args.db_path, args.tenedores, args.animales, args.atenciones, args.semilla, verbose=True)
+    total = sum(conteo.values())
+    dt = time.perf_counter() - t0
+    print(f"✅ {total} filas en {dt:.1f}s ({total / dt:.0f} filas/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,389 @@
+"""
+Revisión de planes de consulta (EXPLAIN QUERY PLAN) de todos los repositories.
+
+Genera una BD sintética, ejecuta cada método público de app/data/*_repository.py
+capturando el SQL que emite y revisa el plan de cada sentencia. Falla (código de
+salida 1) si alguna recorre completa una tabla grande (SCAN sin índice) u ordena
+en un B-tree temporal: con miles de atenciones eso es lo que vuelve lenta la pantalla.
+
+También falla si un repository tiene un método público sin caso en CASOS: al
+agregar una consulta nueva hay que agregar aquí su caso.
+
+    python -m bench.planes_consulta        (solo muestra las fallas)
+    python -m bench.planes_consulta -v     (muestra todos los planes)
+"""
+import importlib
+import inspect
+import os
+import pkgutil
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+import app.data
+from app.data.db_connection import DBConnection
+from bench.datos_sinteticos import generar
+
+# Tablas que crecen con el uso; los catálogos son chicos y recorrerlos no importa
+TABLAS_GRANDES = {
+    "tenedor_responsable", "animal", "atencion_clinica",
+    "vacuna_aplicada", "desparasitacion_aplicada", "medicamento_aplicado",
+}
+
+# Sentencias que no tienen plan que revisar
+_SIN_PLAN = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "PRAGMA", "--")
+
+
+@dataclass
+class Caso:
+    nombre: str                    # "<Clase>.<método>", opcionalmente con " (detalle)"
+    llamar: Callable[[Dict[str, Any]], Any]   # recibe {nombre de clase: repository}
+    permite_scan: bool = False     # exportaciones y mantenimiento que leen todo a propósito
+    # Ordena un resultado ya acotado por índice (un animal, un rango de fechas, un MATCH)
+    # con un ORDER BY que ningún índice puede entregar: sobre un UNION ALL, una fecha
+    # calculada o la relevancia bm25
+    permite_orden: bool = False
+
+    @property
+    def metodo(self) -> str:
+        return self.nombre.split(" ")[0]
+
+
+def _animal(i: int) -> Dict[str, Any]:
+    return {"idTenedor": 1, "idEspecie": 1, "idRaza": 1, "nombre": f"Planes {i}", "sexo": "M"}
+
+
+def _atencion() -> Dict[str, Any]:
+    return {"idAnimal": 1, "idPersonal": 1, "idMotivoConsulta": 1, "fechaAtencion": "2025-03-14",
+            "lugarAtencion": "Consulta"}
+
+
+def _vacuna() -> Dict[str, Any]:
+    return {"idAtencion": 1, "idTipoVacuna": 1, "fechaAplicacion": "2025-03-14"}
+
+
+def _desparasitacion() -> Dict[str, Any]:
+    return {"idAtencion": 1, "idTipoDesparasitacion": 1, "fechaAplicacion": "2025-03-14"}
+
+
+def _medicamento() -> Dict[str, Any]:
+    return {"idAtencion": 1, "idTipoMedicamento": 1, "fechaAplicacion": "2025-03-14", "via": "VO"}
+
+
+# Primero las lecturas y después las escrituras (que modifican la BD sintética)
+CASOS: List[Caso] = [
+    # --- Tenedores
+    Caso("TenedorRepository.get_by_rut", lambda r: r["TenedorRepository"].get_by_rut("10000005-9")),
+    Caso("TenedorRepository.list_by_ruts",
+         lambda r: r["TenedorRepository"].list_by_ruts(["10000005-9", "10000006-7"])),
+    Caso("TenedorRepository.list_by_nombre_prefix",
+         lambda r: r["TenedorRepository"].list_by_nombre_prefix("tuki p")),
+    Caso("TenedorRepository.list_active_page", lambda r: r["TenedorRepository"].list_active_page(limit=50)),
+    Caso("TenedorRepository.list_active_page (siguiente)",
+         lambda r: r["TenedorRepository"].list_active_page(after=("Pérez Tuki", "Ana José", 10), limit=50)),
+    Caso("TenedorRepository.list_active_page (descendente, siguiente)",
+         lambda r: r["TenedorRepository"].list_active_page(
+             after=("Pérez Tuki", "Ana José", 10), limit=50, descending=True)),
+    Caso("TenedorRepository.list_active_page (rut)",
+         lambda r: r["TenedorRepository"].list_active_page(limit=50, order="rut")),
+    Caso("TenedorRepository.list_active_page (rut, siguiente)",
+         lambda r: r["TenedorRepository"].list_active_page(after=("010000005-9", 10), limit=50, order="rut")),
+    Caso("TenedorRepository.list_active_page (rut, descendente, siguiente)",
+         lambda r: r["TenedorRepository"].list_active_page(after=("010000005-9", 10), limit=50, order="rut",
+                                                           descending=True)),
+    Caso("TenedorRepository.list_active_page (idTenedor, descendente)",
+         lambda r: r["TenedorRepository"].list_active_page(after=(500,), limit=50, order="idTenedor",
+                                                           descending=True)),
+    Caso("TenedorRepository.list_active", lambda r: r["TenedorRepository"].list_active()),
+    # --- Animales
+    Caso("AnimalRepository.get_by_id", lambda r: r["AnimalRepository"].get_by_id(100)),
+    Caso("AnimalRepository.get_by_microchip",
+         lambda r: r["AnimalRepository"].get_by_microchip("CHIP000000010")),
+    Caso("AnimalRepository.list_by_microchips",
+         lambda r: r["AnimalRepository"].list_by_microchips(["CHIP000000010", "CHIP000000011"])),
+    Caso("AnimalRepository.list_by_tenedor", lambda r: r["AnimalRepository"].list_by_tenedor(10)),
+    Caso("AnimalRepository.list_by_nombre_prefix", lambda r: r["AnimalRepository"].list_by_nombre_prefix("fir")),
+    Caso("AnimalRepository.list_active_page", lambda r: r["AnimalRepository"].list_active_page(limit=50)),
+    Caso("AnimalRepository.list_active_page (siguiente)",
+         lambda r: r["AnimalRepository"].list_active_page(after=("Luna", 500), limit=50)),
+    Caso("AnimalRepository.list_active_page (descendente, siguiente)",
+         lambda r: r["AnimalRepository"].list_active_page(after=("Luna", 500), limit=50, descending=True)),
+    Caso("AnimalRepository.list_active_page (idTenedor, siguiente)",
+         lambda r: r["AnimalRepository"].list_active_page(after=(10, "Luna", 500), limit=50, order="idTenedor")),
+    # Orden por PK: SCAN en orden de rowid que se detiene en el LIMIT (no ordena ni lee todo)
+    Caso("AnimalRepository.list_active_page (idAnimal, descendente)",
+         lambda r: r["AnimalRepository"].list_active_page(limit=50, order="idAnimal", descending=True),
+         permite_scan=True),
+    Caso("AnimalRepository.list_active", lambda r: r["AnimalRepository"].list_active()),
+    Caso("AnimalRepository.iter_active", lambda r: list(r["AnimalRepository"].iter_active()),
+         permite_scan=True),
+    # --- Atenciones
+    Caso("AtencionRepository.get_by_id", lambda r: r["AtencionRepository"].get_by_id(100)),
+    Caso("AtencionRepository.list_by_animal", lambda r: r["AtencionRepository"].list_by_animal(1)),
+    Caso("AtencionRepository.list_by_fecha", lambda r: r["AtencionRepository"].list_by_fecha("2025-03-14")),
+    Caso("AtencionRepository.iter_active", lambda r: list(r["AtencionRepository"].iter_active()),
+         permite_scan=True),
+    # --- Procedimientos aplicados
+    Caso("VacunaAplicadaRepository.get_by_id", lambda r: r["VacunaAplicadaRepository"].get_by_id(100)),
+    Caso("VacunaAplicadaRepository.list_by_atencion",
+         lambda r: r["VacunaAplicadaRepository"].list_by_atencion(100)),
+    Caso("VacunaAplicadaRepository.list_all_active_page",
+         lambda r: r["VacunaAplicadaRepository"].list_all_active_page(limit=50)),
+    Caso("VacunaAplicadaRepository.list_all_active_page (siguiente)",
+         lambda r: r["VacunaAplicadaRepository"].list_all_active_page(after=("2024-06-01", 5000), limit=50)),
+    Caso("VacunaAplicadaRepository.list_all_active", lambda r: r["VacunaAplicadaRepository"].list_all_active()),
+    Caso("VacunaAplicadaRepository.iter_active",
+         lambda r: list(r["VacunaAplicadaRepository"].iter_active()), permite_scan=True),
+    Caso("DesparasitacionAplicadaRepository.list_by_atencion",
+         lambda r: r["DesparasitacionAplicadaRepository"].list_by_atencion(100)),
+    Caso("MedicamentoAplicadoRepository.get_by_id", lambda r: r["MedicamentoAplicadoRepository"].get_by_id(100)),
+    Caso("MedicamentoAplicadoRepository.list_by_atencion",
+         lambda r: r["MedicamentoAplicadoRepository"].list_by_atencion(100)),
+    # --- Ficha clínica y recordatorios
+    Caso("HistorialClinicoRepository.list_atenciones",
+         lambda r: r["HistorialClinicoRepository"].list_atenciones(1)),
+    Caso("HistorialClinicoRepository.list_procedimientos",
+         lambda r: r["HistorialClinicoRepository"].list_procedimientos(1), permite_orden=True),
+    Caso("RecordatorioRepository.list_vacunas_pendientes",
+         lambda r: r["RecordatorioRepository"].list_vacunas_pendientes("2025-01-01", "2025-01-31"),
+         permite_orden=True),
+    Caso("RecordatorioRepository.list_desparasitaciones_pendientes",
+         lambda r: r["RecordatorioRepository"].list_desparasitaciones_pendientes("2025-01-01", "2025-01-31"),
+         permite_orden=True),
+    # --- Búsqueda de texto completo (ordena por relevancia solo lo que coincide con MATCH)
+    Caso("BusquedaRepository.buscar_tenedores", lambda r: r["BusquedaRepository"].buscar_tenedores('"tuki"*'),
+         permite_orden=True),
+    Caso("BusquedaRepository.buscar_animales", lambda r: r["BusquedaRepository"].buscar_animales('"luna"*'),
+         permite_orden=True),
+    Caso("BusquedaRepository.buscar_atenciones",
+         lambda r: r["BusquedaRepository"].buscar_atenciones('"otitis"*'), permite_orden=True),
+    # --- Catálogos y usuarios (tablas chicas: se revisan igual por si crecen o cambian)
+    Caso("EspecieRepository.get_by_id", lambda r: r["EspecieRepository"].get_by_id(1)),
+    Caso("EspecieRepository.get_by_nombre", lambda r: r["EspecieRepository"].get_by_nombre("Perro")),
+    Caso("EspecieRepository.list_active", lambda r: r["EspecieRepository"].list_active()),
+    Caso("RazaRepository.get_by_id", lambda r: r["RazaRepository"].get_by_id(1)),
+    Caso("RazaRepository.get_by_nombre_en_especie",
+         lambda r: r["RazaRepository"].get_by_nombre_en_especie(1, "Poodle")),
+    Caso("RazaRepository.list_active", lambda r: r["RazaRepository"].list_active()),
+    Caso("RazaRepository.list_by_especie", lambda r: r["RazaRepository"].list_by_especie(1)),
+    Caso("MotivoRepository.get_by_id", lambda r: r["MotivoRepository"].get_by_id(1)),
+    Caso("MotivoRepository.get_by_nombre", lambda r: r["MotivoRepository"].get_by_nombre("Vacunación")),
+    Caso("MotivoRepository.list_active", lambda r: r["MotivoRepository"].list_active()),
+    Caso("PersonalRepository.get_by_id", lambda r: r["PersonalRepository"].get_by_id(1)),
+    Caso("PersonalRepository.get_by_rut", lambda r: r["PersonalRepository"].get_by_rut("9000000-4")),
+    Caso("PersonalRepository.list_active", lambda r: r["PersonalRepository"].list_active()),
+    Caso("TipoVacunaRepository.get_by_id", lambda r: r["TipoVacunaRepository"].get_by_id(1)),
+    Caso("TipoVacunaRepository.get_by_nombre", lambda r: r["TipoVacunaRepository"].get_by_nombre("Óctuple")),
+    Caso("TipoVacunaRepository.list_active", lambda r: r["TipoVacunaRepository"].list_active()),
+    Caso("TipoVacunaRepository.list_by_especie", lambda r: r["TipoVacunaRepository"].list_by_especie(1)),
+    Caso("TipoDesparasitacionRepository.get_by_name",
+         lambda r: r["TipoDesparasitacionRepository"].get_by_name("Pipeta externa")),
+    Caso("TipoDesparasitacionRepository.list_active",
+         lambda r: r["TipoDesparasitacionRepository"].list_active()),
+    Caso("TipoMedicamentoRepository.get_by_id", lambda r: r["TipoMedicamentoRepository"].get_by_id(1)),
+    Caso("TipoMedicamentoRepository.get_by_nombre",
+         lambda r: r["TipoMedicamentoRepository"].get_by_nombre("Meloxicam")),
+    Caso("TipoMedicamentoRepository.list_active", lambda r: r["TipoMedicamentoRepository"].list_active()),
+    Caso("TipoMedicamentoRepository.list_by_categoria",
+         lambda r: r["TipoMedicamentoRepository"].list_by_categoria("antibiotico")),
+    Caso("UsuarioRepository.get_by_username", lambda r: r["UsuarioRepository"].get_by_username("admin")),
+    Caso("UsuarioRepository.exists_active_admin_sistema",
+         lambda r: r["UsuarioRepository"].exists_active_admin_sistema()),
+    Caso("UsuarioRepository.list_active", lambda r: r["UsuarioRepository"].list_active()),
+    Caso("UsuarioRepository.list_active_page", lambda r: r["UsuarioRepository"].list_active_page(limit=50)),
+
+    # --- Escrituras (los triggers de búsqueda y las FK también entran al plan)
+    Caso("TenedorRepository.create", lambda r: r["TenedorRepository"].create(
+        {"rut": "7.777.777-6", "rutCanonico": "7777777-6", "nombres": "Plan", "apellidos": "Consulta"})),
+    Caso("TenedorRepository.update", lambda r: r["TenedorRepository"].update(
+        1, {"nombres": "Plan", "apellidos": "Actualizado", "sector": "Tahai"})),
+    Caso("TenedorRepository.deactivate", lambda r: r["TenedorRepository"].deactivate(2)),
+    Caso("AnimalRepository.create", lambda r: r["AnimalRepository"].create(_animal(1))),
+    Caso("AnimalRepository.deactivate", lambda r: r["AnimalRepository"].deactivate(2)),
+    Caso("AtencionRepository.create", lambda r: r["AtencionRepository"].create(_atencion())),
+    Caso("AtencionRepository.deactivate", lambda r: r["AtencionRepository"].deactivate(2)),
+    Caso("VacunaAplicadaRepository.create", lambda r: r["VacunaAplicadaRepository"].create(_vacuna())),
+    Caso("VacunaAplicadaRepository.create_many",
+         lambda r: r["VacunaAplicadaRepository"].create_many([_vacuna(), _vacuna()])),
+    Caso("VacunaAplicadaRepository.deactivate", lambda r: r["VacunaAplicadaRepository"].deactivate(2)),
+    Caso("DesparasitacionAplicadaRepository.create",
+         lambda r: r["DesparasitacionAplicadaRepository"].create(_desparasitacion())),
+    Caso("DesparasitacionAplicadaRepository.create_many",
+         lambda r: r["DesparasitacionAplicadaRepository"].create_many([_desparasitacion(), _desparasitacion()])),
+    Caso("DesparasitacionAplicadaRepository.deactivate",
+         lambda r: r["DesparasitacionAplicadaRepository"].deactivate(2)),
+    Caso("MedicamentoAplicadoRepository.create",
+         lambda r: r["MedicamentoAplicadoRepository"].create(_medicamento())),
+    Caso("MedicamentoAplicadoRepository.create_many",
+         lambda r: r["MedicamentoAplicadoRepository"].create_many([_medicamento(), _medicamento()])),
+    Caso("MedicamentoAplicadoRepository.deactivate",
+         lambda r: r["MedicamentoAplicadoRepository"].deactivate(2)),
+    Caso("EspecieRepository.create", lambda r: r["EspecieRepository"].create({"nombreEspecie": "Conejo"})),
+    Caso("EspecieRepository.deactivate", lambda r: r["EspecieRepository"].deactivate(5)),
+    Caso("RazaRepository.create", lambda r: r["RazaRepository"].create({"idEspecie": 1, "nombreRaza": "Beagle"})),
+    Caso("RazaRepository.deactivate", lambda r: r["RazaRepository"].deactivate(2)),
+    Caso("MotivoRepository.create", lambda r: r["MotivoRepository"].create({"nombreMotivo": "Chequeo"})),
+    Caso("MotivoRepository.deactivate", lambda r: r["MotivoRepository"].deactivate(6)),
+    Caso("PersonalRepository.create", lambda r: r["PersonalRepository"].create(
+        {"rut": "8.888.888-K", "rutCanonico": "8888888-K", "nombres": "Plan", "apellidos": "Consulta",
+         "cargo": "Veterinario"})),
+    Caso("PersonalRepository.deactivate", lambda r: r["PersonalRepository"].deactivate(5)),
+    Caso("TipoVacunaRepository.create", lambda r: r["TipoVacunaRepository"].create({"nombreVacuna": "Giardia"})),
+    Caso("TipoVacunaRepository.deactivate", lambda r: r["TipoVacunaRepository"].deactivate(6)),
+    Caso("TipoDesparasitacionRepository.create", lambda r: r["TipoDesparasitacionRepository"].create(
+        {"nombreDesparasitacion": "Collar", "tipo": "Externa"})),
+    Caso("TipoDesparasitacionRepository.deactivate",
+         lambda r: r["TipoDesparasitacionRepository"].deactivate(3)),
+    Caso("TipoMedicamentoRepository.create", lambda r: r["TipoMedicamentoRepository"].create(
+        {"nombreMedicamento": "Prednisona", "categoria": "antiinflamatorio"})),
+    Caso("TipoMedicamentoRepository.deactivate", lambda r: r["TipoMedicamentoRepository"].deactivate(8)),
+    Caso("UsuarioRepository.create", lambda r: r["UsuarioRepository"].create(
+        {"idPersonal": 1, "nombreUsuario": "planes", "claveEncriptada": "x", "rol": "veterinario"})),
+    Caso("UsuarioRepository.update_password_hash",
+         lambda r: r["UsuarioRepository"].update_password_hash(1, "x", "y")),
+    Caso("UsuarioRepository.deactivate", lambda r: r["UsuarioRepository"].deactivate(1)),
+    # Mantenimiento: recorre las tablas completas a propósito
+    Caso("BusquedaRepository.asegurar_indice", lambda r: r["BusquedaRepository"].asegurar_indice(),
+         permite_scan=True),
+    Caso("BusquedaRepository.reconstruir_indice", lambda r: r["BusquedaRepository"].reconstruir_indice(),
+         permite_scan=True),
+]
+
+
+def clases_repository() -> Dict[str, type]:
+    """Clases definidas en los módulos app/data/*_repository.py, por nombre."""
+    clases = {}
+    for modulo in pkgutil.iter_modules(app.data.__path__):
+        if not modulo.name.endswith("_repository"):
+            continue
+        mod = importlib.import_module(f"app.data.{modulo.name}")
+        for nombre, clase in inspect.getmembers(mod, inspect.isclass):
+            if clase.__module__ == mod.__name__ and nombre.endswith("Repository"):
+                clases[nombre] = clase
+    return clases
+
+
+def metodos_sin_caso(clases: Dict[str, type], casos: List[Caso] = CASOS) -> List[str]:
+    """Métodos públicos de los repositories que no tienen ningún caso."""
+    cubiertos = {c.metodo for c in casos}
+    faltantes = []
+    for nombre, clase in sorted(clases.items()):
+        for metodo, _ in inspect.getmembers(clase, inspect.isfunction):
+            if not metodo.startswith("_") and f"{nombre}.{metodo}" not in cubiertos:
+                faltantes.append(f"{nombre}.{metodo}")
+    return faltantes
+
+
+def capturar_sql(db: DBConnection, fn: Callable[[], Any]) -> List[str]:
+    """Ejecuta fn y retorna las sentencias que emitió (con los valores ya incrustados)."""
+    sentencias: List[str] = []
+    conn = db.connect()
+    conn.set_trace_callback(lambda sql: sentencias.append(sql))
+    db.close()
+    try:
+        fn()
+    finally:
+        conn.set_trace_callback(None)
+    # "SELECT 1" es la validación del pool al reutilizar una conexión y las que nombran
+    # 'main'.'*_fts_*' son internas de FTS5; además FTS5 vuelve a reportar la sentencia
+    # que disparó sus triggers, por eso se quitan los repetidos
+    unicas: List[str] = []
+    for s in sentencias:
+        if s.lstrip().upper().startswith(_SIN_PLAN) or s.strip() == "SELECT 1" or "'main'." in s:
+            continue
+        if s not in unicas:
+            unicas.append(s)
+    return unicas
+
+
+def _tablas_de_alias(sql: str) -> Dict[str, str]:
+    """alias -> tabla para las tablas grandes mencionadas en FROM/JOIN/UPDATE."""
+    alias = {}
+    for tabla, nombre in re.findall(r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", sql, re.IGNORECASE):
+        if tabla in TABLAS_GRANDES:
+            alias[tabla] = tabla
+            if nombre and nombre.upper() not in {"ON", "WHERE", "JOIN", "LEFT", "INNER", "CROSS",
+                                                  "ORDER", "GROUP", "LIMIT", "UNION", "SET"}:
+                alias[nombre] = tabla
+    return alias
+
+
+def problemas_plan(conn: sqlite3.Connection, sql: str) -> Tuple[List[str], List[str]]:
+    """
+    Retorna (plan, problemas) de una sentencia. Solo cuentan las tablas grandes:
+    ordenar o recorrer un catálogo de pocas filas no es un problema.
+    """
+    plan = [r[3] for r in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+    alias = _tablas_de_alias(sql)
+    problemas = []
+    for paso in plan:
+        partes = paso.split()
+        if partes[:1] == ["SCAN"] and len(partes) >= 2 and partes[1] in alias and "INDEX" not in paso:
+            problemas.append(f"recorre completa la tabla {alias[partes[1]]}: {paso}")
+        if "USE TEMP B-TREE" in paso and alias:
+            problemas.append(f"ordena en B-tree temporal: {paso}")
+    return plan, problemas
+
+
+def revisar(db_path: str, casos: List[Caso] = CASOS, verbose: bool = True) -> int:
+    """Revisa los planes de los casos sobre db_path. Retorna la cantidad de fallas."""
+    db = DBConnection(db_path, pool_size=1)
+    repos = {nombre: clase(db) for nombre, clase in clases_repository().items()}
+    plan_conn = sqlite3.connect(db_path)
+    fallas = 0
+    try:
+        for caso in casos:
+            sentencias = capturar_sql(db, lambda: caso.llamar(repos))
+            if not sentencias:
+                print(f"❌ {caso.nombre}: no emitió ninguna consulta")
+                fallas += 1
+                continue
+            for sql in sentencias:
+                plan, problemas = problemas_plan(plan_conn, sql)
+                if caso.permite_scan:
+                    problemas = [p for p in problemas if not p.startswith("recorre")]
+                if caso.permite_orden:
+                    problemas = [p for p in problemas if not p.startswith("ordena")]
+                if problemas:
+                    fallas += 1
+                    print(f"❌ {caso.nombre}")
+                    for p in problemas:
+                        print(f"     {p}")
+                elif verbose:
+                    print(f"✅ {caso.nombre}")
+                if (verbose or problemas) and plan:
+                    for paso in plan:
+                        print(f"       · {paso}")
+    finally:
+        plan_conn.close()
+        db.close_all()
+    return fallas
+
+
+def main():
+    faltantes = metodos_sin_caso(clases_repository())
+    for metodo in faltantes:
+        print(f"❌ {metodo}: sin caso en bench/planes_consulta.py")
+
+    carpeta = tempfile.mkdtemp(prefix="vet_planes_")
+    db_path = os.path.join(carpeta, "planes.db")
+    try:
+        # Sin ANALYZE a propósito: la aplicación no guarda estadísticas (sqlite_stat1),
+        # así que se revisan los mismos planes que obtiene en los equipos.
+        generar(db_path, tenedores=3000, animales=8000, atenciones=30000)
+        fallas = revisar(db_path, verbose="-v" in sys.argv)
+    finally:
+        shutil.rmtree(carpeta, ignore_errors=True)
+
+    if fallas or faltantes:
+        print(f"\n❌ {fallas} sentencia(s) con planes que no escalan, {len(faltantes)} método(s) sin caso")
+        sys.exit(1)
+    print(f"\n✅ {len(CASOS)} casos revisados, todos usan índices")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: latencia por llamada de un repository con conexión por llamada
+(comportamiento anterior de DBConnection) vs. el pool de conexiones.
+
+    python -m bench.pool_bench
+"""
+import sqlite3
+
+from app.data.db_connection import DBConnection
+from app.data.tenedor_repository import TenedorRepository
+from bench.common import crear_bd_temporal, medir, resumen, imprimir_fila
+
+N_TENEDORES = 2000
+REPETICIONES = 5000
+
+
+class ConexionPorLlamada:
+    """Réplica del DBConnection original: abre y cierra el archivo en cada llamada."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = None
+
+    def connect(self):
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.row_factory = sqlite3.Row
+        return self.connection
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+
+
+def poblar(db_path: str) -> None:
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """INSERT INTO tenedor_responsable (rut, rutCanonico, nombres, apellidos, telefono, sector, estadoRegistro)
+        VALUES (?, ?, ?, ?, ?, ?, 1)""",
+        [(f"{10000000 + i}-{i % 10}", f"{10000000 + i}-{i % 10}", f"Nombre{i}", f"Apellido{i}", "987654321", "Hanga Roa")
+         for i in range(N_TENEDORES)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def main():
+    db_path = crear_bd_temporal()
+    poblar(db_path)
+    print(f"BD temporal: {db_path} ({N_TENEDORES} tenedores, {REPETICIONES} búsquedas por RUT)\n")
+
+    contador = {"i": 0}
+
+    def busqueda(repo):
+        def _fn():
+            i = contador["i"] = (contador["i"] + 1) % N_TENEDORES
+            repo.get_by_rut(f"{10000000 + i}-{i % 10}")
+        return _fn
+
+    antes = TenedorRepository(ConexionPorLlamada(db_path))
+    imprimir_fila("conexión por llamada", resumen(medir(busqueda(antes), REPETICIONES)))
+
+    pool = DBConnection(db_path)
+    despues = TenedorRepository(pool)
+    imprimir_fila("pool de conexiones", resumen(medir(busqueda(despues), REPETICIONES)))
+    print("\nEstado del pool:", pool.stats())
+    pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
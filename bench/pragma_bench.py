@@ -0,0 +1,56 @@
+"""
+Benchmark: throughput de inserts y lecturas con cada perfil de PRAGMA.
+
+Cada insert se confirma por separado (como hacen los repositories fuera de
+una transacción), así se ve el costo de fsync de cada perfil.
+
+    python -m bench.pragma_bench
+"""
+import time
+
+from app.data.db_connection import DBConnection, PERFILES_PRAGMA
+from app.data.tenedor_repository import TenedorRepository
+from bench.common import crear_bd_temporal
+
+N_INSERTS = 1000
+N_LECTURAS = 5000
+
+
+def correr(nombre: str, perfil) -> None:
+    db = DBConnection(crear_bd_temporal(), perfil=perfil)
+    repo = TenedorRepository(db)
+
+    t0 = time.perf_counter()
+    for i in range(N_INSERTS):
+        repo.create({
+            "rut": f"{10000000 + i}-{i % 10}",
+            "rutCanonico": f"{10000000 + i}-{i % 10}",
+            "nombres": f"Nombre{i}",
+            "apellidos": f"Apellido{i}",
+            "telefono": "987654321",
+            "sector": "Hanga Roa",
+        })
+    t_insert = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(N_LECTURAS):
+        j = i % N_INSERTS
+        repo.get_by_rut(f"{10000000 + j}-{j % 10}")
+    t_lectura = time.perf_counter() - t0
+
+    print(
+        f"{nombre:<16} inserts={N_INSERTS / t_insert:>9.0f}/s  "
+        f"lecturas={N_LECTURAS / t_lectura:>9.0f}/s"
+    )
+    db.close_all()
+
+
+def main():
+    print(f"{N_INSERTS} inserts (commit individual) y {N_LECTURAS} lecturas por RUT\n")
+    correr("sin_pragmas", {})
+    for nombre, perfil in PERFILES_PRAGMA.items():
+        correr(nombre, perfil)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,15 @@
+-- Esquema ACTUAL completo de la BD, como referencia.
+-- No se aplica a mano ni lo lee ninguna migración: la BD la crean y actualizan las
+-- migraciones de app/data/migraciones/runner.py (la 1 parte de esquema_base.sql,
+-- congelado). Todo cambio de esquema va en una migración nueva y se refleja aquí.
+
 -- -------------------------
 -- TENEDOR_RESPONSABLE
 -- -------------------------
 CREATE TABLE IF NOT EXISTS tenedor_responsable (
   idTenedor          INTEGER PRIMARY KEY AUTOINCREMENT,
   rut                TEXT NOT NULL UNIQUE,
+  rutCanonico        TEXT,                 -- 12345678-5 (sin puntos, K mayúscula)
   nombres            TEXT NOT NULL,
   apellidos          TEXT NOT NULL,
   fechaNacimiento    TEXT,                 -- ISO: YYYY-MM-DD (puede ser NULL)
@@ -12,12 +18,32 @@ CREATE TABLE IF NOT EXISTS tenedor_responsable (
   sector             TEXT,
   correo             TEXT,
   observaciones      TEXT,
+  claveBusqueda      TEXT,                 -- "apellidos nombres" sin tildes, minúsculas
   estadoRegistro     INTEGER NOT NULL DEFAULT 1, -- 1=activo, 0=inactivo
+  -- rutCanonico con ceros a la izquierda (11 caracteres): ordena por el número del RUT
+  rutOrden           TEXT GENERATED ALWAYS AS (substr('00000000000' || coalesce(rutCanonico, ''), -11)) VIRTUAL,
   CHECK (estadoRegistro IN (0,1))
 );
 
 CREATE INDEX IF NOT EXISTS idx_tenedor_rut ON tenedor_responsable(rut);
-CREATE INDEX IF NOT EXISTS idx_tenedor_nombre ON tenedor_responsable(apellidos, nombres);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_tenedor_rut_canonico ON tenedor_responsable(rutCanonico);
+
+-- Índices parciales (solo registros activos), alineados con el WHERE y ORDER BY
+-- de cada consulta del repository: resuelven el filtro estadoRegistro = 1 y el
+-- orden sin recorrer la tabla ni ordenar en un B-tree temporal.
+CREATE INDEX IF NOT EXISTS idx_tenedor_activos_nombre
+ON tenedor_responsable(apellidos, nombres)
+WHERE estadoRegistro = 1;
+
+-- list_active_page(order="rut")
+CREATE INDEX IF NOT EXISTS idx_tenedor_activos_rut
+ON tenedor_responsable(rutOrden, idTenedor)
+WHERE estadoRegistro = 1;
+
+-- Búsqueda por prefijo sin tildes/mayúsculas (TenedorRepository.list_by_nombre_prefix)
+CREATE INDEX IF NOT EXISTS idx_tenedor_clave_busqueda
+ON tenedor_responsable(claveBusqueda)
+WHERE estadoRegistro = 1;
 
 -- -------------------------
 -- ESPECIE
@@ -63,6 +89,7 @@ CREATE TABLE IF NOT EXISTS motivo_consulta (
 CREATE TABLE IF NOT EXISTS personal_veterinario (
   idPersonal       INTEGER PRIMARY KEY AUTOINCREMENT,
   rut              TEXT NOT NULL UNIQUE,
+  rutCanonico      TEXT,  -- 12345678-5 (sin puntos, K mayúscula)
   nombres          TEXT NOT NULL,
   apellidos        TEXT NOT NULL,
   cargo            TEXT NOT NULL,
@@ -77,6 +104,7 @@ CREATE TABLE IF NOT EXISTS personal_veterinario (
 );
 
 CREATE INDEX IF NOT EXISTS idx_personal_rut ON personal_veterinario(rut);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_personal_rut_canonico ON personal_veterinario(rutCanonico);
 CREATE INDEX IF NOT EXISTS idx_personal_nombre ON personal_veterinario(apellidos, nombres);
 
 -- -------------------------
@@ -110,12 +138,14 @@ CREATE TABLE IF NOT EXISTS animal (
   nombre              TEXT NOT NULL,
   sexo                TEXT NOT NULL DEFAULT 'Desconocido', -- M/H/Desconocido
   fechaNacimientoEst  TEXT, -- YYYY-MM-DD
+  edadEstimadaMeses   INTEGER, -- opcional, si no se conoce la fecha
   color               TEXT,
   estadoReproductivo  TEXT,
   numeroMicrochip     TEXT,
   viveDentroCasa      INTEGER, -- 1/0/NULL
   conviveConOtros     TEXT,
   observaciones       TEXT,
+  claveBusqueda       TEXT, -- nombre sin tildes, minúsculas
   estadoRegistro      INTEGER NOT NULL DEFAULT 1,
   CHECK (estadoRegistro IN (0,1)),
   CHECK (viveDentroCasa IN (0,1) OR viveDentroCasa IS NULL),
@@ -136,9 +166,27 @@ CREATE UNIQUE INDEX IF NOT EXISTS ux_animal_microchip
 ON animal(numeroMicrochip)
 WHERE numeroMicrochip IS NOT NULL AND trim(numeroMicrochip) <> '';
 
+-- Índices completos de las FK (los usa SQLite al validar ON DELETE/UPDATE)
 CREATE INDEX IF NOT EXISTS idx_animal_tenedor ON animal(idTenedor);
 CREATE INDEX IF NOT EXISTS idx_animal_especie ON animal(idEspecie);
-CREATE INDEX IF NOT EXISTS idx_animal_nombre ON animal(nombre);
+
+-- Activos: list_active / list_active_page, list_by_tenedor, get_by_microchip
+CREATE INDEX IF NOT EXISTS idx_animal_activos_nombre
+ON animal(nombre)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_animal_activos_tenedor
+ON animal(idTenedor, nombre)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_animal_activos_microchip
+ON animal(numeroMicrochip)
+WHERE estadoRegistro = 1;
+
+-- Búsqueda por prefijo sin tildes/mayúsculas (AnimalRepository.list_by_nombre_prefix)
+CREATE INDEX IF NOT EXISTS idx_animal_clave_busqueda
+ON animal(claveBusqueda)
+WHERE estadoRegistro = 1;
 
 -- -------------------------
 -- ATENCION_CLINICA
@@ -172,7 +220,15 @@ CREATE TABLE IF NOT EXISTS atencion_clinica (
 );
 
 CREATE INDEX IF NOT EXISTS idx_atencion_animal_fecha ON atencion_clinica(idAnimal, fechaAtencion);
-CREATE INDEX IF NOT EXISTS idx_atencion_fecha ON atencion_clinica(fechaAtencion);
+
+-- Activos: list_by_animal / historial (fecha DESC, id DESC) y list_by_fecha (id DESC)
+CREATE INDEX IF NOT EXISTS idx_atencion_activos_animal_fecha
+ON atencion_clinica(idAnimal, fechaAtencion)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_atencion_activos_fecha
+ON atencion_clinica(fechaAtencion)
+WHERE estadoRegistro = 1;
 CREATE INDEX IF NOT EXISTS idx_atencion_motivo ON atencion_clinica(idMotivoConsulta);
 
 -- -------------------------
@@ -216,12 +272,31 @@ CREATE TABLE IF NOT EXISTS vacuna_aplicada (
 
 CREATE INDEX IF NOT EXISTS idx_vacuna_atencion ON vacuna_aplicada(idAtencion);
 
+-- Activos: list_by_atencion / historial y list_all_active(_page) (fecha DESC, id DESC;
+-- el índice ascendente se recorre al revés)
+CREATE INDEX IF NOT EXISTS idx_vacuna_activos_atencion_fecha
+ON vacuna_aplicada(idAtencion, fechaAplicacion)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_vacuna_activos_fecha
+ON vacuna_aplicada(fechaAplicacion)
+WHERE estadoRegistro = 1;
+
+-- Recordatorios de próximas dosis
+CREATE INDEX IF NOT EXISTS idx_vacuna_proxima
+ON vacuna_aplicada(fechaProximaDosis)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_vacuna_tipo_fecha_sin_proxima
+ON vacuna_aplicada(idTipoVacuna, fechaAplicacion)
+WHERE fechaProximaDosis IS NULL AND estadoRegistro = 1;
+
 -- -------------------------
 -- TIPO_DESPARASITACION
 -- -------------------------
 CREATE TABLE IF NOT EXISTS tipo_desparasitacion (
   idTipoDesparasitacion INTEGER PRIMARY KEY AUTOINCREMENT,
-  nombreDesparasitacion TEXT NOT NULL UNIQUE,
+  nombreDesparasitacion TEXT NOT NULL,
   tipo                 TEXT NOT NULL DEFAULT 'Mixta', -- Interna/Externa/Mixta
   idEspecie            INTEGER,
   intervaloRecMeses    INTEGER,
@@ -234,6 +309,10 @@ CREATE TABLE IF NOT EXISTS tipo_desparasitacion (
     ON DELETE SET NULL
 );
 
+-- El mismo producto puede registrarse para distintas especies
+CREATE UNIQUE INDEX IF NOT EXISTS ux_tipo_desparasitacion_nombre_especie
+ON tipo_desparasitacion(nombreDesparasitacion, idEspecie);
+
 -- -------------------------
 -- DESPARASITACION_APLICADA
 -- -------------------------
@@ -258,6 +337,73 @@ CREATE TABLE IF NOT EXISTS desparasitacion_aplicada (
 
 CREATE INDEX IF NOT EXISTS idx_desparasitacion_atencion ON desparasitacion_aplicada(idAtencion);
 
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_activos_atencion_fecha
+ON desparasitacion_aplicada(idAtencion, fechaAplicacion)
+WHERE estadoRegistro = 1;
+
+-- Recordatorios de próximas dosis
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_proxima
+ON desparasitacion_aplicada(fechaProximaDosis)
+WHERE estadoRegistro = 1;
+
+CREATE INDEX IF NOT EXISTS idx_desparasitacion_tipo_fecha_sin_proxima
+ON desparasitacion_aplicada(idTipoDesparasitacion, fechaAplicacion)
+WHERE fechaProximaDosis IS NULL AND estadoRegistro = 1;
+
+-- -------------------------
+-- TIPO_MEDICAMENTO
+-- -------------------------
+CREATE TABLE IF NOT EXISTS tipo_medicamento (
+  idTipoMedicamento  INTEGER PRIMARY KEY AUTOINCREMENT,
+  nombreMedicamento  TEXT NOT NULL UNIQUE,
+  categoria          TEXT NOT NULL,
+  descripcion        TEXT,
+  estadoRegistro     INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (categoria IN (
+    'antibiotico',
+    'antiinflamatorio',
+    'analgesico',
+    'vitaminas',
+    'fluidoterapia',
+    'gastroprotector',
+    'otro'
+  ))
+);
+
+CREATE INDEX IF NOT EXISTS idx_tipo_medicamento_categoria ON tipo_medicamento(categoria);
+CREATE INDEX IF NOT EXISTS idx_tipo_medicamento_nombre ON tipo_medicamento(nombreMedicamento);
+
+-- -------------------------
+-- MEDICAMENTO_APLICADO
+-- -------------------------
+CREATE TABLE IF NOT EXISTS medicamento_aplicado (
+  idMedicamentoAplicado  INTEGER PRIMARY KEY AUTOINCREMENT,
+  idAtencion             INTEGER NOT NULL,
+  idTipoMedicamento      INTEGER NOT NULL,
+  fechaAplicacion        TEXT NOT NULL,
+  dosis                  TEXT,
+  via                    TEXT,
+  observaciones          TEXT,
+  estadoRegistro         INTEGER NOT NULL DEFAULT 1,
+  CHECK (estadoRegistro IN (0,1)),
+  CHECK (via IN ('IM','IV','VO','SC','Topica','Otra')),
+  FOREIGN KEY (idAtencion) REFERENCES atencion_clinica(idAtencion)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT,
+  FOREIGN KEY (idTipoMedicamento) REFERENCES tipo_medicamento(idTipoMedicamento)
+    ON UPDATE CASCADE
+    ON DELETE RESTRICT
+);
+
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_atencion ON medicamento_aplicado(idAtencion);
+
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_activos_atencion_fecha
+ON medicamento_aplicado(idAtencion, fechaAplicacion)
+WHERE estadoRegistro = 1;
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_tipo ON medicamento_aplicado(idTipoMedicamento);
+CREATE INDEX IF NOT EXISTS idx_med_aplicado_fecha ON medicamento_aplicado(fechaAplicacion);
+
 
 -- Evita borrar ANIMAL si tiene atenciones
 CREATE TRIGGER IF NOT EXISTS trg_no_delete_animal_con_atenciones
@@ -280,4 +426,10 @@ BEGIN
       OR EXISTS (SELECT 1 FROM desparasitacion_aplicada WHERE idAtencion = OLD.idAtencion)
     THEN RAISE(ABORT, 'No se puede eliminar la atención: tiene procedimientos asociados.')
   END;
-END;
\ No newline at end of file
+END;
+
+-- -------------------------
+-- BÚSQUEDA (FTS5)
+-- -------------------------
+-- Las tablas tenedor_fts, animal_fts y atencion_fts y sus triggers los crea
+-- la migración 4 (crear_indice_busqueda en app/data/busqueda_repository.py).